@@ -3,6 +3,7 @@
 import os
 from pathlib import Path
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,6 +31,8 @@ class Settings(BaseSettings):
     data_directory: Path = Path(__file__).parent.parent / "us_disease_tracker_data"
     nndss_data_directory: Path = Path(__file__).parent.parent / "nndss_data"
     database_path: str = "disease_dashboard.duckdb"  # Persistent DuckDB file
+    db_workers: int = 4  # Threads available for blocking database queries
+    db_pool_size: int = 0  # Pooled DuckDB connections (0 = one per DB worker thread)
 
     # Server
     host: str = "0.0.0.0"
@@ -54,6 +57,20 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @model_validator(mode="after")
+    def _check_db_pool_size(self) -> "Settings":
+        """Reject pools smaller than the DB worker count.
+
+        Every DB worker thread holds a pooled connection while it runs a query,
+        so a smaller pool would leave workers blocked waiting for a connection.
+        """
+        if self.db_pool_size and self.db_pool_size < self.db_workers:
+            raise ValueError(
+                f"db_pool_size ({self.db_pool_size}) must be 0 or at least "
+                f"db_workers ({self.db_workers})"
+            )
+        return self
+
 
 # Global settings instance
 settings = Settings()
@@ -5,32 +5,99 @@ interfaces for disease data. Data loading is delegated to the ETL
 transformers for each data source.
 """
 
+import copy
+import functools
+import inspect
 import logging
 import os
+import queue
 import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 
 import duckdb
 
-from app.config import settings
+from app.config import Settings, settings
 from app.etl.config import get_transformer, list_sources
 from app.etl.normalizers.slugify import slugify
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized query results held per database instance
+_QUERY_CACHE_MAX = 256
+
+# How long a query waits for a pooled connection before failing
+POOL_TIMEOUT_SECONDS = 30.0
+
+
+def _memoized_query(method: Callable) -> Callable:
+    """Memoize a read-only query method until the next data load.
+
+    Results are keyed on the method and its bound arguments (so positional
+    and keyword calls share an entry) and tagged with the data load
+    timestamp, like the response caches. Callers get a deep copy, so a
+    mutated result can't leak into later calls.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "DiseaseDatabase", *args, **kwargs):
+        version = self._loaded_at
+        if version is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, *list(bound.arguments.values())[1:])
+
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._query_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+
+        result = method(self, *args, **kwargs)
+        with self._query_cache_lock:
+            self._query_cache[key] = (version, result)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > _QUERY_CACHE_MAX:
+                self._query_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    return wrapper
+
 
 class DiseaseDatabase:
     """Manages DuckDB connection and disease data queries."""
 
-    def __init__(self):
+    def __init__(self, settings: Settings | None = None):
+        # Without explicit settings, the app-wide settings are read on use
+        self._settings = settings
         self.conn: duckdb.DuckDBPyConnection | None = None
         self._initialized = False
-        self._lock = threading.RLock()
+        self._loaded_at: datetime | None = None
+        # slug -> (disease name, comma-separated data sources)
+        self._slug_index: dict[str, tuple[str, str | None]] = {}
+        self._disease_catalog: list[dict] | None = None
+        self._pool: queue.LifoQueue[duckdb.DuckDBPyConnection] | None = None
+        self._pool_size = 0
+        self._local = threading.local()
+        # Per-disease query results, see _memoized_query
+        self._query_cache: OrderedDict[tuple, tuple[datetime, object]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    @property
+    def settings(self) -> Settings:
+        """Settings this database loads and connects with."""
+        return self._settings if self._settings is not None else settings
 
     def connect(self) -> duckdb.DuckDBPyConnection:
         """Establish DuckDB connection."""
         if self.conn is None:
-            self.conn = duckdb.connect(settings.database_path)
-            logger.info(f"Connected to DuckDB: {settings.database_path}")
+            self.conn = duckdb.connect(self.settings.database_path)
+            logger.info(f"Connected to DuckDB: {self.settings.database_path}")
         return self.conn
 
     def load_all_sources(self) -> None:
@@ -46,10 +113,14 @@ class DiseaseDatabase:
             try:
                 count = conn.execute("SELECT COUNT(*) FROM disease_data").fetchone()[0]
                 if count > 0:
-                    # Verify merged view exists
+                    # Verify derived tables exist
                     conn.execute("SELECT 1 FROM disease_data_merged LIMIT 1")
+                    conn.execute("SELECT 1 FROM disease_rollup LIMIT 1")
                     logger.info(f"Dev mode: using existing database ({count:,} records)")
+                    self._create_pool()
                     self._initialized = True
+                    self._loaded_at = datetime.now(UTC)
+                    self.refresh_disease_index()
                     return
             except duckdb.CatalogException:
                 logger.info("Dev mode: database incomplete, reloading...")
@@ -88,16 +159,25 @@ class DiseaseDatabase:
         for source_name in list_sources():
             self._load_source(source_name)
 
+        # Cluster rows by disease and date so date-range scans skip row groups
+        self._sort_disease_data()
+
         # Create indexes after all data is loaded
         self._create_indexes()
 
         # Create disease name mapping table for reference
         self._create_disease_mapping_table()
 
-        # Create merged view for mixed-source queries (tracker takes priority over NNDSS)
-        self._create_merged_view()
+        # Create merged table for mixed-source queries (tracker takes priority over NNDSS)
+        self._create_merged_table()
+
+        # Pre-aggregate the dashboard stats (depends on the merged table)
+        self._create_rollup_tables()
 
+        self._create_pool()
         self._initialized = True
+        self._loaded_at = datetime.now(UTC)
+        self.refresh_disease_index()
 
         # Log summary
         total_count = conn.execute("SELECT COUNT(*) FROM disease_data").fetchone()[0]
@@ -117,15 +197,15 @@ class DiseaseDatabase:
         # Get source URI based on source name
         # Priority: data_uri env var > local data_directory path
         if source_name == "tracker":
-            if settings.data_uri:
-                source_uri = settings.data_uri
+            if self.settings.data_uri:
+                source_uri = self.settings.data_uri
             else:
-                source_uri = str(settings.data_directory)
+                source_uri = str(self.settings.data_directory)
         elif source_name == "nndss":
-            if settings.nndss_data_uri:
-                source_uri = settings.nndss_data_uri
+            if self.settings.nndss_data_uri:
+                source_uri = self.settings.nndss_data_uri
             else:
-                source_uri = str(settings.nndss_data_directory)
+                source_uri = str(self.settings.nndss_data_directory)
         else:
             logger.warning(f"Unknown source for: {source_name}")
             return
@@ -153,6 +233,21 @@ class DiseaseDatabase:
         except Exception as e:
             logger.error(f"Error loading {source_name}: {e}", exc_info=True)
 
+    def _sort_disease_data(self) -> None:
+        """Physically order disease_data by (disease_name, report_period_start).
+
+        DuckDB has no covering indexes and its ART indexes only serve point
+        lookups, so date-range filters rely on per-row-group min/max zonemaps.
+        Those only prune when rows are clustered on the filtered columns, which
+        the per-source inserts don't guarantee.
+        """
+        conn = self.connect()
+        conn.execute("""
+            CREATE OR REPLACE TABLE disease_data AS
+            SELECT * FROM disease_data
+            ORDER BY disease_name, report_period_start
+        """)
+
     def _create_indexes(self) -> None:
         """Create indexes for common queries."""
         conn = self.connect()
@@ -183,22 +278,33 @@ class DiseaseDatabase:
         mapping_count = conn.execute("SELECT COUNT(*) FROM disease_name_mapping").fetchone()[0]
         logger.info(f"Created disease_name_mapping table with {mapping_count} entries")
 
-    def _create_merged_view(self) -> None:
-        """Create a merged view that deduplicates tracker and NNDSS data.
+    def _create_merged_table(self) -> None:
+        """Create a merged table that deduplicates tracker and NNDSS data.
 
-        For diseases with data from both sources, this view:
+        For diseases with data from both sources, this table:
         1. Aggregates records to (disease, state, month) level
         2. Applies source priority: tracker > NNDSS
         3. Keeps only one record per (disease, state, month) combination
 
         This implements the "filler pattern" where NNDSS fills gaps where
         tracker data doesn't exist.
+
+        The result is materialized (rather than a view re-running the window
+        function on every query) and ordered by (disease_name, month), so the
+        date-range filters of the state map prune row groups via zonemaps.
         """
         conn = self.connect()
 
-        conn.execute("DROP VIEW IF EXISTS disease_data_merged")
+        # Databases built before the table was materialized hold a view here
+        existing = conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?",
+            ["disease_data_merged"],
+        ).fetchone()
+        if existing and existing[0] == "VIEW":
+            conn.execute("DROP VIEW disease_data_merged")
+
         conn.execute("""
-            CREATE VIEW disease_data_merged AS
+            CREATE OR REPLACE TABLE disease_data_merged AS
             WITH monthly_aggregated AS (
                 -- Aggregate all records to monthly state level
                 SELECT
@@ -225,13 +331,212 @@ class DiseaseDatabase:
             SELECT disease_name, disease_slug, state, month, data_source, count
             FROM ranked
             WHERE rn = 1
+            ORDER BY disease_name, month
         """)
-        logger.info("Created disease_data_merged view for mixed-source deduplication")
+        logger.info("Created disease_data_merged table for mixed-source deduplication")
+
+    def _create_rollup_tables(self) -> None:
+        """Create pre-aggregated stats tables used by the summary endpoints.
+
+        disease_rollup holds one row per (disease, data_source) with the
+        per-disease stats, plus a row with a NULL data_source for the
+        mixed-source stats (merged totals/states, raw counties/two-week cases).
+        summary_rollup holds the dataset-wide stats per data_source, plus a
+        NULL row for all sources. Both are rebuilt on every load, so stats
+        requests read O(diseases) rows instead of scanning disease_data.
+        """
+        conn = self.connect()
+
+        conn.execute("""
+            CREATE OR REPLACE TABLE disease_rollup AS
+            WITH windowed AS (
+                SELECT
+                    disease_name,
+                    data_source,
+                    state,
+                    geo_name,
+                    count,
+                    report_period_end,
+                    MAX(report_period_end) OVER (
+                        PARTITION BY disease_name, data_source
+                    ) as source_max_end,
+                    MAX(report_period_end) OVER (PARTITION BY disease_name) as all_max_end
+                FROM disease_data
+            ),
+            per_source AS (
+                SELECT
+                    disease_name,
+                    data_source,
+                    SUM(count) as total_cases,
+                    COUNT(DISTINCT state) as affected_states,
+                    COUNT(DISTINCT geo_name) FILTER (WHERE geo_name != '') as affected_counties,
+                    SUM(count) FILTER (
+                        WHERE report_period_end >= source_max_end - INTERVAL 14 DAYS
+                    ) as two_week_cases
+                FROM windowed
+                GROUP BY disease_name, data_source
+            ),
+            all_sources AS (
+                SELECT
+                    disease_name,
+                    COUNT(DISTINCT geo_name) FILTER (WHERE geo_name != '') as affected_counties,
+                    SUM(count) FILTER (
+                        WHERE report_period_end >= all_max_end - INTERVAL 14 DAYS
+                    ) as two_week_cases
+                FROM windowed
+                GROUP BY disease_name
+            ),
+            merged AS (
+                SELECT
+                    disease_name,
+                    SUM(count) as total_cases,
+                    COUNT(DISTINCT state) as affected_states
+                FROM disease_data_merged
+                GROUP BY disease_name
+            )
+            SELECT * FROM per_source
+            UNION ALL
+            SELECT
+                a.disease_name,
+                CAST(NULL AS VARCHAR) as data_source,
+                m.total_cases,
+                m.affected_states,
+                a.affected_counties,
+                a.two_week_cases
+            FROM all_sources a
+            LEFT JOIN merged m USING (disease_name)
+        """)
+
+        conn.execute("""
+            CREATE OR REPLACE TABLE summary_rollup AS
+            SELECT
+                data_source,
+                COUNT(*) as total_records,
+                COUNT(DISTINCT disease_name) as total_diseases,
+                COUNT(DISTINCT state) as total_states,
+                SUM(count) as total_cases,
+                MIN(report_period_start) as earliest_date,
+                MAX(report_period_end) as latest_date
+            FROM disease_data
+            GROUP BY data_source
+            UNION ALL
+            -- Mixed sources: total_cases from the merged table to avoid double-counting
+            SELECT
+                CAST(NULL AS VARCHAR) as data_source,
+                COUNT(*) as total_records,
+                COUNT(DISTINCT disease_name) as total_diseases,
+                COUNT(DISTINCT state) as total_states,
+                (SELECT SUM(count) FROM disease_data_merged) as total_cases,
+                MIN(report_period_start) as earliest_date,
+                MAX(report_period_end) as latest_date
+            FROM disease_data
+        """)
+
+        rollup_count = conn.execute("SELECT COUNT(*) FROM disease_rollup").fetchone()[0]
+        logger.info(f"Created disease_rollup table with {rollup_count} entries")
+
+    def _create_pool(self) -> None:
+        """Create the pool of connections used by the query methods.
+
+        Each pooled entry is a DuckDB cursor: a separate connection to the same
+        database instance. DuckDB runs queries on different connections in
+        parallel (and releases the GIL while doing so), so queries from
+        concurrent requests no longer serialize on a single shared connection.
+        """
+        self._close_pool()
+        # Queries only run on the DB worker threads, so one connection per worker
+        # means a query never waits on the pool and no connection sits unused
+        size = self.settings.db_pool_size or self.settings.db_workers
+        pool: queue.LifoQueue[duckdb.DuckDBPyConnection] = queue.LifoQueue()
+        for _ in range(size):
+            pool.put(self.conn.cursor())
+        self._pool = pool
+        self._pool_size = size
+        logger.info(f"Created DuckDB connection pool with {size} connections")
+
+    def _close_pool(self) -> None:
+        """Close all pooled connections."""
+        if self._pool is None:
+            return
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+        self._pool = None
+        self._pool_size = 0
+
+    def pool_stats(self) -> dict:
+        """Return connection pool statistics for monitoring and tuning."""
+        available = self._pool.qsize() if self._pool is not None else 0
+        return {
+            "pool_size": self._pool_size,
+            "available": available,
+            "in_use": self._pool_size - available,
+            "workers": self.settings.db_workers,
+        }
+
+    @contextmanager
+    def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a pooled connection for the duration of a query method.
+
+        Re-entrant per thread: query methods that call other query methods
+        (e.g. get_summary_stats -> get_disease_totals) reuse the connection the
+        thread already holds instead of waiting on the pool for a second one.
+        """
+        held = getattr(self._local, "cursor", None)
+        if held is not None:
+            yield held
+            return
+
+        try:
+            cursor = self._pool.get(timeout=POOL_TIMEOUT_SECONDS)
+        except queue.Empty:
+            raise RuntimeError(
+                f"Timed out after {POOL_TIMEOUT_SECONDS}s waiting for a DuckDB connection "
+                f"(pool_size={self._pool_size}, db_workers={self.settings.db_workers})"
+            ) from None
+        self._local.cursor = cursor
+        try:
+            yield cursor
+        finally:
+            self._local.cursor = None
+            self._pool.put(cursor)
+
+    def refresh_disease_index(self) -> None:
+        """Rebuild the cached disease catalog and slug -> (name, data sources) index.
+
+        The catalog only changes when data is reloaded, so the unfiltered
+        disease list and the slug lookups used by every slugged endpoint and
+        page are served from memory. Called automatically at the end of a
+        load; any code path that changes disease_data must call it again.
+        """
+        self._disease_catalog = None
+        catalog = self.get_diseases_with_slugs()
+
+        with self._cursor() as conn:
+            sources_by_slug = dict(
+                conn.execute("""
+                    SELECT disease_slug, STRING_AGG(DISTINCT data_source, ',' ORDER BY data_source)
+                    FROM disease_name_mapping
+                    GROUP BY disease_slug
+                """).fetchall()
+            )
+
+        slug_index: dict[str, tuple[str, str | None]] = {}
+        for disease in catalog:
+            slug = disease["slug"]
+            slug_index.setdefault(slug, (disease["name"], sources_by_slug.get(slug)))
+
+        self._disease_catalog = catalog
+        self._slug_index = slug_index
+        logger.info(f"Built disease index with {len(slug_index)} entries")
 
     def is_initialized(self) -> bool:
         """Check if database has been initialized with data."""
         return self._initialized
 
+    def last_updated_at(self) -> datetime | None:
+        """Return when the data was last loaded, or None if not initialized."""
+        return self._loaded_at
+
     # Query methods
 
     def get_diseases(self, data_source: str | None = None) -> list[str]:
@@ -239,9 +544,12 @@ class DiseaseDatabase:
         if not self._initialized:
             return []
 
-        with self._lock:
+        if not data_source and self._disease_catalog is not None:
+            return sorted({disease["name"] for disease in self._disease_catalog})
+
+        with self._cursor() as conn:
             if data_source:
-                result = self.conn.execute(
+                result = conn.execute(
                     """
                     SELECT DISTINCT disease_name
                     FROM disease_data
@@ -251,7 +559,7 @@ class DiseaseDatabase:
                     [data_source],
                 ).fetchall()
             else:
-                result = self.conn.execute("""
+                result = conn.execute("""
                     SELECT DISTINCT disease_name
                     FROM disease_data
                     ORDER BY disease_name
@@ -264,15 +572,19 @@ class DiseaseDatabase:
 
         When data_source is specified, returns diseases that have data from that source,
         but includes ALL sources for each disease (not just the filtered source).
+        The unfiltered list is served from the catalog cached at load time.
         """
         if not self._initialized:
             return []
 
-        with self._lock:
+        if not data_source and self._disease_catalog is not None:
+            return [dict(disease) for disease in self._disease_catalog]
+
+        with self._cursor() as conn:
             if data_source:
                 # Find diseases that have data from the specified source,
                 # but return all sources for those diseases
-                result = self.conn.execute(
+                result = conn.execute(
                     """
                     SELECT disease_name, disease_slug, STRING_AGG(DISTINCT data_source, ',') as sources
                     FROM disease_data
@@ -287,7 +599,7 @@ class DiseaseDatabase:
                     [data_source],
                 ).fetchall()
             else:
-                result = self.conn.execute("""
+                result = conn.execute("""
                     SELECT disease_name, disease_slug, STRING_AGG(DISTINCT data_source, ',') as sources
                     FROM disease_data
                     GROUP BY disease_name, disease_slug
@@ -296,49 +608,98 @@ class DiseaseDatabase:
 
             return [{"name": row[0], "slug": row[1], "data_source": row[2]} for row in result]
 
-    def get_disease_name_by_slug(self, slug: str) -> str | None:
-        """Look up disease name by its slug."""
+    def get_disease_cards_bundle(self, data_source: str | None = None) -> list[dict]:
+        """Get the disease list with merged cumulative totals in a single query.
+
+        Diseases are filtered the same way as get_diseases_with_slugs; totals
+        always come from the merged view (tracker > NNDSS priority) so cards
+        show the full deduplicated total regardless of the source filter.
+        """
         if not self._initialized:
-            return None
+            return []
 
-        with self._lock:
-            result = self.conn.execute(
+        with self._cursor() as conn:
+            source_filter = ""
+            params = []
+            if data_source:
+                source_filter = """
+                    WHERE disease_slug IN (
+                        SELECT DISTINCT disease_slug
+                        FROM disease_data
+                        WHERE data_source = ?
+                    )
                 """
-                SELECT DISTINCT disease_name
-                FROM disease_data
-                WHERE disease_slug = ?
-                LIMIT 1
+                params.append(data_source)
+
+            result = conn.execute(
+                f"""
+                WITH diseases AS (
+                    SELECT disease_name, disease_slug, STRING_AGG(DISTINCT data_source, ',') as sources
+                    FROM disease_data
+                    {source_filter}
+                    GROUP BY disease_name, disease_slug
+                ),
+                totals AS (
+                    SELECT disease_name, SUM(count) as total_cases
+                    FROM disease_data_merged
+                    GROUP BY disease_name
+                )
+                SELECT d.disease_name, d.disease_slug, d.sources, t.total_cases
+                FROM diseases d
+                LEFT JOIN totals t ON t.disease_name = d.disease_name
+                ORDER BY d.disease_name
             """,
-                [slug],
-            ).fetchone()
+                params,
+            ).fetchall()
 
-            return result[0] if result else None
+            return [
+                {
+                    "name": row[0],
+                    "slug": row[1],
+                    "total_cases": int(row[3]) if row[3] is not None else None,
+                    "data_source": row[2] or "",
+                }
+                for row in result
+            ]
 
-    def get_disease_data_source_by_slug(self, slug: str) -> str | None:
-        """Look up data source(s) for a disease by its slug."""
+    def get_disease_name_by_slug(self, slug: str) -> str | None:
+        """Look up disease name by its slug (in-memory, built at load time)."""
         if not self._initialized:
             return None
 
-        with self._lock:
-            result = self.conn.execute(
-                """
-                SELECT STRING_AGG(DISTINCT data_source, ',') as sources
-                FROM disease_data
-                WHERE disease_slug = ?
-            """,
-                [slug],
-            ).fetchone()
+        entry = self._slug_index.get(slug)
+        return entry[0] if entry else None
 
-            return result[0] if result else None
+    def get_disease_header_by_slug(self, slug: str) -> dict | None:
+        """Look up a disease's name and data source(s) by slug (in-memory).
+
+        Returns:
+            Dict with "name" and "data_source" keys, or None if the slug is unknown
+        """
+        if not self._initialized:
+            return None
+
+        entry = self._slug_index.get(slug)
+        if entry is None:
+            return None
+        return {"name": entry[0], "data_source": entry[1]}
+
+    def get_disease_data_source_by_slug(self, slug: str) -> str | None:
+        """Look up data source(s) for a disease by its slug (in-memory)."""
+        if not self._initialized:
+            return None
+
+        entry = self._slug_index.get(slug)
+        return entry[1] if entry else None
 
     def get_states(self, data_source: str | None = None) -> list[str]:
         """Get list of unique states in the database."""
         if not self._initialized:
             return []
 
-        with self._lock:
+        with self._cursor() as conn:
             if data_source:
-                result = self.conn.execute(
+                result = conn.execute(
                     """
                     SELECT DISTINCT state
                     FROM disease_data
@@ -348,7 +709,7 @@ class DiseaseDatabase:
                     [data_source],
                 ).fetchall()
             else:
-                result = self.conn.execute("""
+                result = conn.execute("""
                     SELECT DISTINCT state
                     FROM disease_data
                     ORDER BY state
@@ -359,63 +720,42 @@ class DiseaseDatabase:
     def get_summary_stats(self, data_source: str | None = None) -> dict:
         """Get summary statistics across all data.
 
-        When data_source is None, uses the merged view for total_cases
-        which applies tracker > NNDSS priority to avoid double-counting.
+        Served from the summary_rollup table. When data_source is None,
+        total_cases comes from the merged table which applies tracker > NNDSS
+        priority to avoid double-counting.
         """
         if not self._initialized:
             return {}
 
-        with self._lock:
-            if data_source:
-                stats = self.conn.execute(
-                    """
-                    SELECT
-                        COUNT(*) as total_records,
-                        COUNT(DISTINCT disease_name) as total_diseases,
-                        COUNT(DISTINCT state) as total_states,
-                        SUM(count) as total_cases,
-                        MIN(report_period_start) as earliest_date,
-                        MAX(report_period_end) as latest_date
-                    FROM disease_data
-                    WHERE data_source = ?
-                """,
-                    [data_source],
-                ).fetchone()
-            else:
-                # Use merged view for total_cases to apply deduplication
-                # Other stats (records, dates) come from raw data for completeness
-                stats = self.conn.execute("""
-                    SELECT
-                        COUNT(*) as total_records,
-                        COUNT(DISTINCT disease_name) as total_diseases,
-                        COUNT(DISTINCT state) as total_states,
-                        (SELECT SUM(count) FROM disease_data_merged) as total_cases,
-                        MIN(report_period_start) as earliest_date,
-                        MAX(report_period_end) as latest_date
-                    FROM disease_data
-                """).fetchone()
-
-            if not stats:
-                return {}
-
-            source_breakdown = self.conn.execute("""
-                SELECT data_source, COUNT(*) as record_count, SUM(count) as case_count
-                FROM disease_data
-                GROUP BY data_source
+        with self._cursor() as conn:
+            rows = conn.execute("""
+                SELECT
+                    data_source,
+                    total_records,
+                    total_diseases,
+                    total_states,
+                    total_cases,
+                    earliest_date,
+                    latest_date
+                FROM summary_rollup
             """).fetchall()
 
-            return {
-                "total_records": stats[0],
-                "total_diseases": stats[1],
-                "total_states": stats[2],
-                "total_cases": stats[3],
-                "earliest_date": stats[4],
-                "latest_date": stats[5],
-                "disease_totals": self.get_disease_totals(data_source),
-                "source_breakdown": {
-                    row[0]: {"records": row[1], "cases": row[2]} for row in source_breakdown
-                },
-            }
+        by_source = {row[0]: row[1:] for row in rows}
+        # An unknown source matches no rows: zero counts and no date range
+        stats = by_source.get(data_source or None, (0, 0, 0, 0, None, None))
+
+        return {
+            "total_records": stats[0],
+            "total_diseases": stats[1],
+            "total_states": stats[2],
+            "total_cases": stats[3],
+            "earliest_date": stats[4],
+            "latest_date": stats[5],
+            "disease_totals": self.get_disease_totals(data_source),
+            "source_breakdown": {
+                row[0]: {"records": row[1], "cases": row[4]} for row in rows if row[0] is not None
+            },
+        }
 
     def get_disease_totals(self, data_source: str | None = None) -> list[dict]:
         """Get total case counts for each disease.
@@ -426,10 +766,10 @@ class DiseaseDatabase:
         if not self._initialized:
             return []
 
-        with self._lock:
+        with self._cursor() as conn:
             if data_source:
                 # Filter to specific source
-                result = self.conn.execute(
+                result = conn.execute(
                     """
                     SELECT disease_name, SUM(count) as total_cases
                     FROM disease_data
@@ -441,7 +781,7 @@ class DiseaseDatabase:
                 ).fetchall()
             else:
                 # Use merged view for mixed sources (tracker > NNDSS priority)
-                result = self.conn.execute("""
+                result = conn.execute("""
                     SELECT disease_name, SUM(count) as total_cases
                     FROM disease_data_merged
                     GROUP BY disease_name
@@ -453,6 +793,7 @@ class DiseaseDatabase:
                 for row in result
             ]
 
+    @_memoized_query
     def get_national_disease_timeseries(
         self, disease_name: str, granularity: str = "month", data_source: str | None = None
     ) -> list[dict]:
@@ -463,7 +804,7 @@ class DiseaseDatabase:
         if granularity not in ["month", "week"]:
             granularity = "month"
 
-        with self._lock:
+        with self._cursor() as conn:
             if data_source:
                 query = f"""
                     SELECT
@@ -474,7 +815,7 @@ class DiseaseDatabase:
                     GROUP BY DATE_TRUNC('{granularity}', report_period_start)
                     ORDER BY period ASC
                 """
-                result = self.conn.execute(query, [disease_name, data_source]).fetchall()
+                result = conn.execute(query, [disease_name, data_source]).fetchall()
             else:
                 query = f"""
                     SELECT
@@ -485,7 +826,7 @@ class DiseaseDatabase:
                     GROUP BY DATE_TRUNC('{granularity}', report_period_start)
                     ORDER BY period ASC
                 """
-                result = self.conn.execute(query, [disease_name]).fetchall()
+                result = conn.execute(query, [disease_name]).fetchall()
 
             return [
                 {
@@ -495,102 +836,36 @@ class DiseaseDatabase:
                 for row in result
             ]
 
+    @_memoized_query
     def get_disease_stats(self, disease_name: str, data_source: str | None = None) -> dict:
         """Get summary statistics for a specific disease.
 
-        When data_source is None, uses the merged view for total_cases and
-        affected_states which applies tracker > NNDSS priority.
+        Served from the disease_rollup table. When data_source is None,
+        total_cases and affected_states come from the merged table which
+        applies tracker > NNDSS priority.
         """
         if not self._initialized:
             return {}
 
-        with self._lock:
-            if data_source:
-                # Filter to specific source - use raw data
-                where_clause = "WHERE disease_name = ? AND data_source = ?"
-                params = [disease_name, data_source]
-
-                total_cases_result = self.conn.execute(
-                    f"""
-                    SELECT SUM(count) as total_cases FROM disease_data {where_clause}
-                """,
-                    params,
-                ).fetchone()
-
-                affected_states_result = self.conn.execute(
-                    f"""
-                    SELECT COUNT(DISTINCT state) as affected_states FROM disease_data {where_clause}
-                """,
-                    params,
-                ).fetchone()
-            else:
-                # Use merged view for mixed sources (tracker > NNDSS priority)
-                params = [disease_name]
-
-                total_cases_result = self.conn.execute(
-                    """
-                    SELECT SUM(count) as total_cases
-                    FROM disease_data_merged
-                    WHERE disease_name = ?
-                """,
-                    params,
-                ).fetchone()
-
-                affected_states_result = self.conn.execute(
-                    """
-                    SELECT COUNT(DISTINCT state) as affected_states
-                    FROM disease_data_merged
-                    WHERE disease_name = ?
-                """,
-                    params,
-                ).fetchone()
-
-            total_cases = int(total_cases_result[0]) if total_cases_result[0] else 0
-            affected_states = int(affected_states_result[0]) if affected_states_result[0] else 0
-
-            # affected_counties and two_week_cases use raw data
-            # (merged view doesn't have geo_name or report_period_end)
-            raw_where_clause = (
-                "WHERE disease_name = ?"
-                if not data_source
-                else "WHERE disease_name = ? AND data_source = ?"
-            )
-            raw_params = [disease_name] if not data_source else [disease_name, data_source]
-
-            affected_counties_result = self.conn.execute(
-                f"""
-                SELECT COUNT(DISTINCT geo_name) as affected_counties
-                FROM disease_data
-                {raw_where_clause} AND geo_name IS NOT NULL AND geo_name != ''
+        with self._cursor() as conn:
+            row = conn.execute(
+                """
+                SELECT total_cases, affected_states, affected_counties, two_week_cases
+                FROM disease_rollup
+                WHERE disease_name = ? AND data_source IS NOT DISTINCT FROM ?
             """,
-                raw_params,
+                [disease_name, data_source or None],
             ).fetchone()
-            affected_counties = (
-                int(affected_counties_result[0]) if affected_counties_result[0] else 0
-            )
 
-            latest_two_week_result = self.conn.execute(
-                f"""
-                WITH latest_date AS (
-                    SELECT MAX(report_period_end) as max_date FROM disease_data {raw_where_clause}
-                )
-                SELECT SUM(count) as two_week_cases
-                FROM disease_data
-                {raw_where_clause}
-                  AND report_period_end >= (SELECT max_date - INTERVAL 14 DAYS FROM latest_date)
-                  AND report_period_end <= (SELECT max_date FROM latest_date)
-            """,
-                raw_params + raw_params,
-            ).fetchone()
-            two_week_cases = int(latest_two_week_result[0]) if latest_two_week_result[0] else 0
-
-            return {
-                "total_cases": total_cases,
-                "affected_states": affected_states,
-                "affected_counties": affected_counties,
-                "two_week_cases": two_week_cases,
-            }
+        total_cases, affected_states, affected_counties, two_week_cases = row or (0, 0, 0, 0)
+        return {
+            "total_cases": int(total_cases) if total_cases else 0,
+            "affected_states": int(affected_states) if affected_states else 0,
+            "affected_counties": int(affected_counties) if affected_counties else 0,
+            "two_week_cases": int(two_week_cases) if two_week_cases else 0,
+        }
 
+    @_memoized_query
     def get_age_group_distribution_by_state(
         self,
         disease_name: str,
@@ -609,7 +884,7 @@ class DiseaseDatabase:
         if not self._initialized:
             return {"states": {}, "age_groups": [], "available_states": []}
 
-        with self._lock:
+        with self._cursor() as conn:
             # Build WHERE clause dynamically
             conditions = ["disease_name = ?"]
             params = [disease_name]
@@ -628,7 +903,7 @@ class DiseaseDatabase:
 
             where_clause = "WHERE " + " AND ".join(conditions)
 
-            states_result = self.conn.execute(
+            states_result = conn.execute(
                 f"""
                 SELECT DISTINCT state FROM disease_data {where_clause} ORDER BY state
             """,
@@ -636,7 +911,7 @@ class DiseaseDatabase:
             ).fetchall()
             available_states = [row[0] for row in states_result]
 
-            age_group_result = self.conn.execute(
+            age_group_result = conn.execute(
                 f"""
                 SELECT state, age_group, SUM(count) as total_cases
                 FROM disease_data
@@ -649,7 +924,7 @@ class DiseaseDatabase:
                 params,
             ).fetchall()
 
-            age_groups_result = self.conn.execute(
+            age_groups_result = conn.execute(
                 f"""
                 SELECT DISTINCT age_group FROM disease_data
                 {where_clause}
@@ -661,19 +936,22 @@ class DiseaseDatabase:
             ).fetchall()
             age_groups = [row[0] for row in age_groups_result]
 
+            # Group rows by state in a single pass instead of rescanning the
+            # full result set for every state
+            state_age_counts: dict[str, dict[str, int]] = {state: {} for state in available_states}
+            for state, age_group, total_cases in age_group_result:
+                state_age_counts.setdefault(state, {})[age_group] = (
+                    int(total_cases) if total_cases else 0
+                )
+
             states_data = {}
             for state in available_states:
-                state_total = 0
-                state_age_counts = {}
-
-                for row in age_group_result:
-                    if row[0] == state:
-                        state_age_counts[row[1]] = int(row[2]) if row[2] else 0
-                        state_total += state_age_counts[row[1]]
+                age_counts = state_age_counts[state]
+                state_total = sum(age_counts.values())
 
                 state_age_percentages = {}
                 for age_group in age_groups:
-                    count = state_age_counts.get(age_group, 0)
+                    count = age_counts.get(age_group, 0)
                     percentage = (count / state_total * 100) if state_total > 0 else 0
                     state_age_percentages[age_group] = {
                         "count": count,
@@ -688,6 +966,7 @@ class DiseaseDatabase:
                 "available_states": available_states,
             }
 
+    @_memoized_query
     def get_disease_timeseries_by_state(
         self, disease_name: str, granularity: str = "month", data_source: str | None = None
     ) -> dict:
@@ -698,7 +977,7 @@ class DiseaseDatabase:
         if granularity not in ["month", "week"]:
             granularity = "month"
 
-        with self._lock:
+        with self._cursor() as conn:
             where_clause = (
                 "WHERE disease_name = ?"
                 if not data_source
@@ -706,7 +985,7 @@ class DiseaseDatabase:
             )
             params = [disease_name] if not data_source else [disease_name, data_source]
 
-            states_result = self.conn.execute(
+            states_result = conn.execute(
                 f"""
                 SELECT DISTINCT state FROM disease_data {where_clause} ORDER BY state
             """,
@@ -714,7 +993,7 @@ class DiseaseDatabase:
             ).fetchall()
             available_states = [row[0] for row in states_result]
 
-            state_result = self.conn.execute(
+            state_result = conn.execute(
                 f"""
                 SELECT state, DATE_TRUNC('{granularity}', report_period_start) as period, SUM(count) as total_cases
                 FROM disease_data
@@ -737,7 +1016,7 @@ class DiseaseDatabase:
                     }
                 )
 
-            national_result = self.conn.execute(
+            national_result = conn.execute(
                 f"""
                 SELECT DATE_TRUNC('{granularity}', report_period_start) as period, SUM(count) as total_cases
                 FROM disease_data
@@ -761,6 +1040,7 @@ class DiseaseDatabase:
                 "available_states": available_states,
             }
 
+    @_memoized_query
     def get_serotype_distribution_by_state(
         self, disease_name: str, data_source: str | None = None
     ) -> dict:
@@ -772,7 +1052,7 @@ class DiseaseDatabase:
         if not self._initialized:
             return {"states": {}, "serotypes": [], "available_states": []}
 
-        with self._lock:
+        with self._cursor() as conn:
             # Use disease_slug for matching
             disease_slug = slugify(disease_name)
 
@@ -784,7 +1064,7 @@ class DiseaseDatabase:
             params = [disease_slug] if not data_source else [disease_slug, data_source]
 
             # Get states that have serotype data (non-null subtype slugs)
-            states_result = self.conn.execute(
+            states_result = conn.execute(
                 f"""
                 SELECT DISTINCT state, state_slug FROM disease_data
                 {where_clause}
@@ -801,7 +1081,7 @@ class DiseaseDatabase:
                 return {"states": {}, "serotypes": [], "available_states": []}
 
             # Get all serotypes present in the data (using slugs for deduplication)
-            serotype_result = self.conn.execute(
+            serotype_result = conn.execute(
                 f"""
                 SELECT DISTINCT disease_subtype_slug FROM disease_data
                 {where_clause}
@@ -813,7 +1093,7 @@ class DiseaseDatabase:
             serotype_slugs = [row[0] for row in serotype_result]
 
             # Get serotype counts by state (grouped by slugs)
-            distribution_result = self.conn.execute(
+            distribution_result = conn.execute(
                 f"""
                 SELECT state_slug, disease_subtype_slug, SUM(count) as total_cases
                 FROM disease_data
@@ -858,6 +1138,7 @@ class DiseaseDatabase:
                 "available_states": list(state_slug_to_name.values()),
             }
 
+    @_memoized_query
     def get_state_case_totals(
         self,
         disease_name: str,
@@ -885,13 +1166,20 @@ class DiseaseDatabase:
             - max_cases: Maximum case count (for scale domain)
             - min_cases: Minimum non-zero case count
             - available_states: List of states with data
+            - national_total: Sum of cases across the returned states
         """
         if not self._initialized:
-            return {"states": {}, "max_cases": 0, "min_cases": 0, "available_states": []}
+            return {
+                "states": {},
+                "max_cases": 0,
+                "min_cases": 0,
+                "available_states": [],
+                "national_total": 0,
+            }
 
         from app.etl.normalizers.fips import STATE_TO_FIPS
 
-        with self._lock:
+        with self._cursor() as conn:
             if data_source:
                 # Filter to specific source - use raw data
                 conditions = ["disease_name = ?", "data_source = ?"]
@@ -907,7 +1195,7 @@ class DiseaseDatabase:
 
                 where_clause = "WHERE " + " AND ".join(conditions)
 
-                result = self.conn.execute(
+                result = conn.execute(
                     f"""
                     SELECT state, SUM(count) as total_cases
                     FROM disease_data
@@ -924,17 +1212,20 @@ class DiseaseDatabase:
                 conditions = ["disease_name = ?"]
                 params = [disease_name]
 
-                if start_date:
+                # A single BETWEEN lets the optimizer treat the brush as one range
+                if start_date and end_date:
+                    conditions.append("month BETWEEN ? AND ?")
+                    params.extend([start_date, end_date])
+                elif start_date:
                     conditions.append("month >= ?")
                     params.append(start_date)
-
-                if end_date:
+                elif end_date:
                     conditions.append("month <= ?")
                     params.append(end_date)
 
                 where_clause = "WHERE " + " AND ".join(conditions)
 
-                result = self.conn.execute(
+                result = conn.execute(
                     f"""
                     SELECT state, SUM(count) as total_cases
                     FROM disease_data_merged
@@ -949,6 +1240,7 @@ class DiseaseDatabase:
             available_states = []
             max_cases = 0
             min_cases = float("inf")
+            national_total = 0
 
             for row in result:
                 state_code = row[0]
@@ -964,6 +1256,7 @@ class DiseaseDatabase:
                     available_states.append(state_code)
                     max_cases = max(max_cases, cases)
                     min_cases = min(min_cases, cases)
+                    national_total += cases
 
             if min_cases == float("inf"):
                 min_cases = 0
@@ -973,6 +1266,7 @@ class DiseaseDatabase:
                 "max_cases": max_cases,
                 "min_cases": min_cases,
                 "available_states": available_states,
+                "national_total": national_total,
             }
 
     def execute_sql(self, sql: str) -> dict:
@@ -993,8 +1287,8 @@ class DiseaseDatabase:
         if not self._initialized:
             return {"data": [], "columns": [], "row_count": 0}
 
-        with self._lock:
-            result = self.conn.execute(sql)
+        with self._cursor() as conn:
+            result = conn.execute(sql)
             columns = [desc[0] for desc in result.description]
             rows = result.fetchall()
 
@@ -1014,6 +1308,9 @@ class DiseaseDatabase:
 
     def close(self):
         """Close database connection."""
+        self._close_pool()
+        with self._query_cache_lock:
+            self._query_cache.clear()
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -1,13 +1,21 @@
 """Shared FastAPI dependencies for database access."""
 
 import asyncio
+import functools
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from fastapi import HTTPException
 
+from app.config import settings
 from app.database import db
 
+# Dedicated, bounded executor for blocking DuckDB calls. Keeping database work
+# off the default executor stops slow analytics queries from starving other
+# threadpool users (sync dependencies, static files) under concurrent load.
+_db_executor = ThreadPoolExecutor(max_workers=settings.db_workers, thread_name_prefix="duckdb")
+
 
 async def get_db():
     """
@@ -26,9 +34,11 @@ async def get_db():
 
 async def run_db_query(func: Callable, *args, **kwargs) -> Any:
     """
-    Run a synchronous database query in a thread pool.
+    Run a synchronous database query in the bounded database executor.
 
     This wraps blocking database calls to work with FastAPI's async handlers.
+    DuckDB releases the GIL while executing queries, so worker threads give
+    real parallelism without having to pickle the connection across processes.
 
     Args:
         func: The database method to call
@@ -38,7 +48,8 @@ async def run_db_query(func: Callable, *args, **kwargs) -> Any:
     Returns:
         The result of the database query
     """
-    return await asyncio.to_thread(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, functools.partial(func, *args, **kwargs))
 
 
 async def get_disease_name_or_404(disease_slug: str) -> str:
@@ -54,7 +65,8 @@ async def get_disease_name_or_404(disease_slug: str) -> str:
     Raises:
         HTTPException: 404 if disease not found
     """
-    disease_name = await run_db_query(db.get_disease_name_by_slug, disease_slug)
+    # The slug index is an in-memory dict, so no thread hop is needed
+    disease_name = db.get_disease_name_by_slug(disease_slug)
     if disease_name is None:
         raise HTTPException(status_code=404, detail=f"Disease '{disease_slug}' not found")
     return disease_name
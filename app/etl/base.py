@@ -13,6 +13,7 @@ from pathlib import Path
 import fsspec
 import pandas as pd
 
+from app.etl.normalizers.mapping import constant_category
 from app.etl.schema import REQUIRED_COLUMNS, validate_dataframe
 from app.etl.storage import get_filesystem, get_storage_options, is_remote_uri
 
@@ -165,9 +166,7 @@ class DataSourceTransformer(ABC):
         """
         Add data_source column identifying the source.
         """
-        df = df.copy()
-        df["data_source"] = self.get_source_name()
-        return df
+        return df.assign(data_source=constant_category(self.get_source_name(), len(df)))
 
     def _validate_schema(self, df: pd.DataFrame) -> None:
         """
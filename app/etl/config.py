@@ -20,6 +20,9 @@ TRANSFORMERS: dict[str, type["DataSourceTransformer"]] = {
     "nndss": NNDSSTransformer,
 }
 
+# TRANSFORMERS is fixed at import, so its sorted names are computed once
+_SORTED_SOURCES = tuple(sorted(TRANSFORMERS))
+
 
 def get_transformer(name: str) -> type["DataSourceTransformer"]:
     """
@@ -34,10 +37,11 @@ def get_transformer(name: str) -> type["DataSourceTransformer"]:
     Raises:
         ValueError: If source name is not configured
     """
-    if name not in TRANSFORMERS:
-        available = ", ".join(sorted(TRANSFORMERS.keys()))
-        raise ValueError(f"Unknown data source: '{name}'. Available sources: {available}")
-    return TRANSFORMERS[name]
+    try:
+        return TRANSFORMERS[name]
+    except KeyError:
+        available = ", ".join(_SORTED_SOURCES)
+        raise ValueError(f"Unknown data source: '{name}'. Available sources: {available}") from None
 
 
 def list_sources() -> list[str]:
@@ -45,6 +49,6 @@ def list_sources() -> list[str]:
     List all configured data source names.
 
     Returns:
-        List of source names in alphabetical order
+        List of source names in alphabetical order (a fresh list per call)
     """
-    return sorted(TRANSFORMERS.keys())
+    return list(_SORTED_SOURCES)
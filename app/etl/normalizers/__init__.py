@@ -14,6 +14,7 @@ from app.etl.normalizers.geo import (
     REGION_SLUGS,
     classify_geo_unit,
 )
+from app.etl.normalizers.mapping import map_unique
 from app.etl.normalizers.slugify import slugify
 
 __all__ = [
@@ -22,5 +23,6 @@ __all__ = [
     "NATIONAL_SLUGS",
     "REGION_SLUGS",
     "classify_geo_unit",
+    "map_unique",
     "slugify",
 ]
@@ -0,0 +1,36 @@
+"""
+Column mapping helper for low-cardinality data.
+
+Source columns such as disease names, states and age groups repeat a few
+hundred distinct values across many rows, so normalizers are applied once
+per distinct value rather than once per row.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def map_unique(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply ``func`` once per distinct value and broadcast results back to every row.
+
+    Factorizing to integer codes and indexing a lookup table avoids a Python
+    call per row. Missing values are mapped through ``func(None)``.
+    """
+    codes, uniques = pd.factorize(values)
+    # Code -1 marks missing values; the trailing entry handles them
+    lookup = np.empty(len(uniques) + 1, dtype=object)
+    lookup[:-1] = [func(value) for value in uniques]
+    lookup[-1] = func(None)
+    return pd.Series(lookup[codes], index=values.index)
+
+
+def constant_category(value: str, length: int) -> pd.Categorical:
+    """Build a column holding ``value`` on every row as a one-category Categorical.
+
+    Stores one byte per row instead of an object pointer, for metadata
+    columns such as data_source that are constant across a source.
+    """
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
@@ -7,17 +7,38 @@ into the unified disease_data schema.
 Supports both local filesystem and remote storage (Azure Blob, S3) via fsspec.
 """
 
+import functools
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
 from app.etl.base import DataSourceTransformer
 from app.etl.normalizers.geo import classify_geo_unit
+from app.etl.normalizers.mapping import constant_category, map_unique
 from app.etl.normalizers.slugify import slugify
 from app.etl.storage import is_remote_uri
 
+# The only NNDSS columns the transform reads, with their types. The weekly
+# file carries a dozen more (flags, 52-week max, YTD totals, sort keys) that
+# are skipped at parse time.
+NNDSS_CSV_DTYPES = {
+    "Reporting Area": str,
+    "Current MMWR Year": "Int64",
+    "MMWR WEEK": "Int64",
+    "Label": str,
+    "Current week": str,
+    "LOCATION2": str,
+}
+
+# Rows per chunk when streaming the CSV. Each chunk is transformed and
+# filtered to state-level counts before the next is read, so peak memory
+# tracks the chunk size plus the (much smaller) output, not the whole file.
+NNDSS_CSV_CHUNK_ROWS = 100_000
+
 # Map NNDSS base disease names (slugified) to tracker canonical names
 NNDSS_TO_TRACKER_SLUG = {
     "meningococcal-disease": "meningococcus",
@@ -112,12 +133,40 @@ class MMWRWeekConverter:
     """
 
     @staticmethod
+    def get_mmwr_week_starts(years: np.ndarray, weeks: np.ndarray) -> np.ndarray:
+        """
+        Calculate the start dates (Sundays) of many MMWR weeks at once.
+
+        MMWR weeks start on Sunday. Week 1 is the first week of the year
+        that has at least four days in the year, so it starts on the Sunday
+        on or before January 1st when Jan 1 falls on Sunday through
+        Wednesday, and on the Sunday after it otherwise.
+
+        Args:
+            years: MMWR years (integer array)
+            weeks: MMWR week numbers (1-53), aligned with ``years``
+
+        Returns:
+            datetime64[D] array of the Sunday starting each MMWR week
+        """
+        years = np.asarray(years, dtype="int64")
+        weeks = np.asarray(weeks, dtype="int64")
+        jan1 = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+
+        # Day of week with Sunday = 0; 1970-01-01 was a Thursday
+        weekday = (jan1.astype("int64") + 4) % 7
+        week1_offset = np.where(weekday <= 3, -weekday, 7 - weekday)
+
+        return jan1 + week1_offset + (weeks - 1) * 7
+
+    @staticmethod
+    @functools.cache
     def get_mmwr_week_start(year: int, week: int) -> datetime:
         """
         Calculate the start date (Sunday) of an MMWR week.
 
-        MMWR weeks start on Sunday. Week 1 is the first week of the year
-        that has at least four days in the year.
+        Scalar form of ``get_mmwr_week_starts``. Results are cached; there
+        are only ~53 weeks per year and the datetimes are immutable.
 
         Args:
             year: MMWR year
@@ -126,23 +175,8 @@ class MMWRWeekConverter:
         Returns:
             datetime for the Sunday starting that MMWR week
         """
-        jan1 = datetime(year, 1, 1)
-
-        # Find the first Sunday on or after January 1st
-        days_until_sunday = (6 - jan1.weekday()) % 7
-        first_sunday = jan1 + timedelta(days=days_until_sunday)
-
-        # If Jan 1 is Sun, Mon, Tue, or Wed, week 1 starts on the first Sunday
-        # Otherwise, week 1 starts on the next Sunday after Jan 1
-        if jan1.weekday() <= 3:  # Sun (6->0 after mod), Mon (0), Tue (1), Wed (2)
-            week1_start = first_sunday
-        else:
-            # Jan 1 is Thu, Fri, or Sat - week 1 starts the following Sunday
-            week1_start = first_sunday + timedelta(days=7)
-
-        # Calculate the target week's start date
-        target_week_start = week1_start + timedelta(weeks=(week - 1))
-        return target_week_start
+        starts = MMWRWeekConverter.get_mmwr_week_starts(np.array([year]), np.array([week]))
+        return starts[0].astype("datetime64[us]").item()
 
     @staticmethod
     def get_mmwr_week_end(year: int, week: int) -> datetime:
@@ -201,41 +235,42 @@ class NNDSSTransformer(DataSourceTransformer):
         # Build the full URI for pandas to read
         if is_remote_uri(self.source_uri):
             file_uri = f"az://{csv_file}"
-            df = pd.read_csv(
-                file_uri,
-                dtype={
-                    "Reporting Area": str,
-                    "Current MMWR Year": "Int64",
-                    "MMWR WEEK": "Int64",
-                    "Label": str,
-                    "Current week": str,
-                    "LOCATION1": str,
-                    "LOCATION2": str,
-                },
-                na_values=["", " "],
-                keep_default_na=True,
-                low_memory=False,
-                storage_options=self.storage_options,
-            )
+            storage_options = self.storage_options
         else:
-            df = pd.read_csv(
-                csv_file,
-                dtype={
-                    "Reporting Area": str,
-                    "Current MMWR Year": "Int64",
-                    "MMWR WEEK": "Int64",
-                    "Label": str,
-                    "Current week": str,
-                    "LOCATION1": str,
-                    "LOCATION2": str,
-                },
-                na_values=["", " "],
-                keep_default_na=True,
-                low_memory=False,
-            )
-
-        logger.info(f"Loaded {len(df)} raw NNDSS records")
+            file_uri = csv_file
+            storage_options = None
+
+        raw_records = 0
+        frames = []
+        for chunk in self._read_csv_chunks(file_uri, storage_options):
+            raw_records += len(chunk)
+            frames.append(self._transform_chunk(chunk))
+
+        logger.info(f"Loaded {raw_records} raw NNDSS records")
 
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        logger.info(f"Transformed to {len(df)} records")
+        return df
+
+    def _read_csv_chunks(
+        self, file_uri: str, storage_options: dict | None
+    ) -> Iterator[pd.DataFrame]:
+        """Read the NNDSS CSV in chunks of at most NNDSS_CSV_CHUNK_ROWS rows."""
+        with pd.read_csv(
+            file_uri,
+            chunksize=NNDSS_CSV_CHUNK_ROWS,
+            usecols=list(NNDSS_CSV_DTYPES),
+            dtype=NNDSS_CSV_DTYPES,
+            na_values=["", " "],
+            keep_default_na=True,
+            storage_options=storage_options,
+        ) as reader:
+            yield from reader
+
+    def _transform_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transform raw NNDSS rows to the unified schema, keeping state-level counts."""
         # Apply transformations in sequence
         df = self._classify_geo_unit(df)
         df = self._parse_dates(df)
@@ -250,11 +285,9 @@ class NNDSSTransformer(DataSourceTransformer):
         # Filter to state-level records only (exclude regional aggregates and national totals)
         pre_filter_count = len(df)
         df = df[df["geo_unit"] == "state"]
-        logger.info(
+        logger.debug(
             f"Filtered {pre_filter_count - len(df)} non-state records (regions, national totals)"
         )
-
-        logger.info(f"Transformed to {len(df)} records")
         return df
 
     def _find_latest_file(self) -> str | None:
@@ -272,57 +305,41 @@ class NNDSSTransformer(DataSourceTransformer):
 
     def _classify_geo_unit(self, df: pd.DataFrame) -> pd.DataFrame:
         """Classify records as state, region, or national level."""
-        df = df.copy()
-        df["geo_unit"] = df["Reporting Area"].apply(classify_geo_unit)
-        return df
+        return df.assign(geo_unit=map_unique(df["Reporting Area"], classify_geo_unit))
 
     def _parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert MMWR year/week to date ranges."""
-        df = df.copy()
-
-        # Compute dates for unique (year, week) combinations, then merge back
-        unique_weeks = df[["Current MMWR Year", "MMWR WEEK"]].drop_duplicates().dropna().copy()
-
-        starts = []
-        ends = []
-        for _, row in unique_weeks.iterrows():
-            try:
-                year = int(row["Current MMWR Year"])
-                week = int(row["MMWR WEEK"])
-                start = self.mmwr_converter.get_mmwr_week_start(year, week)
-                end = self.mmwr_converter.get_mmwr_week_end(year, week)
-                starts.append(start)
-                ends.append(end)
-            except (ValueError, TypeError):
-                starts.append(pd.NaT)
-                ends.append(pd.NaT)
-
-        unique_weeks["report_period_start"] = starts
-        unique_weeks["report_period_end"] = ends
-
-        # Merge back to original dataframe
-        df = df.merge(unique_weeks, on=["Current MMWR Year", "MMWR WEEK"], how="left")
+        years = df["Current MMWR Year"]
+        weeks = df["MMWR WEEK"]
+        valid = (years.notna() & weeks.notna()).to_numpy()
+
+        # Compute every row's week start in one pass; rows missing a year or
+        # week keep NaT
+        starts = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[D]")
+        starts[valid] = self.mmwr_converter.get_mmwr_week_starts(
+            years.to_numpy("int64", na_value=0)[valid],
+            weeks.to_numpy("int64", na_value=0)[valid],
+        )
 
-        return df
+        return df.assign(
+            report_period_start=starts.astype("datetime64[us]"),
+            report_period_end=(starts + 6).astype("datetime64[us]"),
+        )
 
     def _clean_case_counts(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and convert case count data to integers."""
-        df = df.copy()
-
-        # Start with the current week column
-        counts = df["Current week"].astype(str)
+        raw = df["Current week"]
+        counts = pd.to_numeric(raw, errors="coerce")
 
-        # Replace common non-numeric indicators with empty string
-        counts = counts.replace(["nan", "-", "", " "], "")
+        # Almost every value parses directly; only the strings that didn't
+        # ("-", "N", "1,234") go through digit extraction, and those with no
+        # digits at all stay NaN
+        retry = counts.isna() & raw.notna()
+        if retry.any():
+            digits = raw[retry].str.replace(r"\D", "", regex=True).replace("", pd.NA)
+            counts[retry] = pd.to_numeric(digits, errors="coerce")
 
-        # Extract only digits using regex
-        counts = counts.str.replace(r"\D", "", regex=True)
-
-        # Convert to numeric, empty strings become NaN
-        counts = counts.replace("", pd.NA)
-        df["count"] = pd.to_numeric(counts, errors="coerce")
-
-        return df
+        return df.assign(count=counts)
 
     def _normalize_disease_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Parse NNDSS labels to extract base disease name and subtype.
@@ -336,17 +353,14 @@ class NNDSSTransformer(DataSourceTransformer):
         - Strip "Serogroup " / "Serogroups " prefix: "Serogroup B" → "B"
         - Set aggregate subtypes to None: "All serogroups" → None
         """
-        df = df.copy()
-
-        # Store original name before any transformation
-        df["original_disease_name"] = df["Label"]
-
-        # Parse labels into (base_name, subtype)
-        parsed = df["Label"].apply(self._parse_nndss_label)
-        df["disease_name"] = parsed.apply(lambda x: x[0])
-        df["disease_subtype"] = parsed.apply(lambda x: x[1])
-
-        return df
+        # Parse labels into (base_name, subtype) and add all three columns in one
+        # assign so pandas consolidates the new blocks once
+        parsed = map_unique(df["Label"], self._parse_nndss_label)
+        return df.assign(
+            original_disease_name=df["Label"],
+            disease_name=[base_name for base_name, _ in parsed],
+            disease_subtype=[subtype for _, subtype in parsed],
+        )
 
     def _parse_nndss_label(self, label: str) -> tuple[str, str | None]:
         """Parse 'Disease, Subtype info' into (base_name, subtype).
@@ -391,33 +405,27 @@ class NNDSSTransformer(DataSourceTransformer):
 
         return (base_name, subtype_raw if subtype_raw else None)
 
+    @staticmethod
+    def _canonical_disease_slug(disease_name: str | None) -> str | None:
+        """Slugify an NNDSS base disease name and map it to the tracker canonical slug."""
+        slug = slugify(disease_name)
+        return NNDSS_TO_TRACKER_SLUG.get(slug, slug) if slug else None
+
     def _create_state_codes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert state names to 2-letter codes."""
-        df = df.copy()
-
-        # Default: use reporting area as-is
-        df["state"] = df["Reporting Area"]
-
-        # For state-level records, map to state codes
-        state_mask = df["geo_unit"] == "state"
-        df.loc[state_mask, "state"] = (
-            df.loc[state_mask, "Reporting Area"]
-            .str.upper()
-            .map(STATE_CODES)
-            .fillna(df.loc[state_mask, "Reporting Area"])
-        )
+        area = df["Reporting Area"]
+        geo_unit = df["geo_unit"]
+
+        # State-level records map to state codes, keeping the name if unmapped
+        state = area.str.upper().map(STATE_CODES).fillna(area)
 
         # For regions, use LOCATION2 if available
-        region_mask = df["geo_unit"] == "region"
-        df.loc[region_mask, "state"] = df.loc[region_mask, "LOCATION2"].fillna(
-            df.loc[region_mask, "Reporting Area"]
-        )
+        state = state.where(geo_unit != "region", df["LOCATION2"].fillna(area))
 
         # For national level, set to "US"
-        national_mask = df["geo_unit"] == "national"
-        df.loc[national_mask, "state"] = "US"
+        state = state.where(geo_unit != "national", "US")
 
-        return df
+        return df.assign(state=state)
 
     def _map_to_unified_schema(self, df: pd.DataFrame) -> pd.DataFrame:
         """Map NNDSS fields to the unified disease_data schema.
@@ -425,48 +433,43 @@ class NNDSSTransformer(DataSourceTransformer):
         Maps NNDSS disease names to tracker canonical names for consistency.
         All dimension columns get corresponding _slug columns for matching.
         """
-        unified = pd.DataFrame()
-
-        # Date/time fields
-        unified["report_period_start"] = df["report_period_start"]
-        unified["report_period_end"] = df["report_period_end"]
-        unified["date_type"] = "mmwr"
-        unified["time_unit"] = "week"
-
         # Disease - map NNDSS base names to tracker canonical names
         # Both disease_name and disease_slug use tracker canonical form for consistency
-        base_slugs = df["disease_name"].apply(slugify)
-        unified["disease_slug"] = base_slugs.apply(
-            lambda s: NNDSS_TO_TRACKER_SLUG.get(s, s) if s else None
+        disease_slugs = map_unique(df["disease_name"], self._canonical_disease_slug)
+        state_slugs = map_unique(df["state"], slugify)
+
+        # Build the output frame in one constructor call rather than assigning
+        # columns one at a time onto an empty frame
+        return pd.DataFrame(
+            {
+                # Date/time fields
+                "report_period_start": df["report_period_start"],
+                "report_period_end": df["report_period_end"],
+                "date_type": constant_category("mmwr", len(df)),
+                "time_unit": constant_category("week", len(df)),
+                # disease_name uses the canonical slug (tracker names are lowercase)
+                "disease_slug": disease_slugs,
+                "disease_name": disease_slugs,
+                "original_disease_name": df["original_disease_name"],
+                # Disease subtype
+                "disease_subtype": df["disease_subtype"],
+                "disease_subtype_slug": map_unique(df["disease_subtype"], slugify),
+                # State/Geo
+                "state": df["state"],
+                "state_slug": state_slugs,
+                "reporting_jurisdiction": df["state"],
+                "reporting_jurisdiction_slug": state_slugs,
+                "geo_name": df["Reporting Area"],
+                "geo_name_slug": map_unique(df["Reporting Area"], slugify),
+                "geo_unit": df["geo_unit"],
+                "geo_unit_slug": map_unique(df["geo_unit"], slugify),
+                # Age group - NNDSS weekly data doesn't include age groups
+                "age_group": None,
+                "age_group_slug": None,
+                # Other fields
+                "confirmation_status": None,
+                "outcome": constant_category("cases", len(df)),
+                "count": df["count"],
+            },
+            copy=False,
         )
-        # disease_name uses the canonical slug (tracker names are lowercase)
-        unified["disease_name"] = unified["disease_slug"]
-        unified["original_disease_name"] = df["original_disease_name"]
-
-        # Disease subtype
-        unified["disease_subtype"] = df["disease_subtype"]
-        unified["disease_subtype_slug"] = df["disease_subtype"].apply(slugify)
-
-        # State/Geo
-        unified["state"] = df["state"]
-        unified["state_slug"] = df["state"].apply(slugify)
-
-        unified["reporting_jurisdiction"] = df["state"]
-        unified["reporting_jurisdiction_slug"] = df["state"].apply(slugify)
-
-        unified["geo_name"] = df["Reporting Area"]
-        unified["geo_name_slug"] = df["Reporting Area"].apply(slugify)
-
-        unified["geo_unit"] = df["geo_unit"]
-        unified["geo_unit_slug"] = df["geo_unit"].apply(slugify)
-
-        # Age group - NNDSS weekly data doesn't include age groups
-        unified["age_group"] = None
-        unified["age_group_slug"] = None
-
-        # Other fields
-        unified["confirmation_status"] = None
-        unified["outcome"] = "cases"
-        unified["count"] = df["count"]
-
-        return unified
@@ -13,6 +13,7 @@ from collections import defaultdict
 import pandas as pd
 
 from app.etl.base import DataSourceTransformer
+from app.etl.normalizers.mapping import map_unique
 from app.etl.normalizers.slugify import slugify
 from app.etl.storage import is_remote_uri
 
@@ -27,6 +28,25 @@ SUBTYPE_NORMALIZATION = {
     "n/a": "unspecified",
 }
 
+# Text columns are declared up front so pandas skips type inference on them
+# (columns a file doesn't have are ignored)
+TRACKER_CSV_DTYPES = {
+    "date_type": str,
+    "time_unit": str,
+    "disease_name": str,
+    "disease_subtype": str,
+    "state": str,
+    "reporting_jurisdiction": str,
+    "geo_name": str,
+    "geo_unit": str,
+    "age_group": str,
+    "confirmation_status": str,
+    "outcome": str,
+}
+
+# Placeholder strings treated as missing in nullable columns
+NULL_PLACEHOLDERS = {"not specified", "unknown", "n/a", "na", ""}
+
 
 class TrackerTransformer(DataSourceTransformer):
     """
@@ -84,6 +104,7 @@ class TrackerTransformer(DataSourceTransformer):
                     df = pd.read_csv(
                         file_uri,
                         parse_dates=["report_period_start", "report_period_end"],
+                        dtype=TRACKER_CSV_DTYPES,
                         storage_options=self.storage_options,
                     )
                 else:
@@ -91,6 +112,7 @@ class TrackerTransformer(DataSourceTransformer):
                     df = pd.read_csv(
                         csv_file,
                         parse_dates=["report_period_start", "report_period_end"],
+                        dtype=TRACKER_CSV_DTYPES,
                     )
                 file_name = csv_file.split("/")[-1]
                 logger.info(f"Loaded {file_name}: {len(df)} rows")
@@ -167,6 +189,7 @@ class TrackerTransformer(DataSourceTransformer):
 
         Tracker names are the canonical source for disease names.
         All dimension columns get corresponding _slug columns for matching.
+        Slugs are computed once per distinct value (see map_unique).
         """
         unified = pd.DataFrame()
 
@@ -178,25 +201,25 @@ class TrackerTransformer(DataSourceTransformer):
 
         # Disease - tracker names are canonical
         unified["disease_name"] = df["disease_name"]
-        unified["disease_slug"] = df["disease_name"].apply(slugify)
+        unified["disease_slug"] = map_unique(df["disease_name"], slugify)
         unified["original_disease_name"] = df["original_disease_name"]
 
         # Disease subtype - normalize to canonical values
         subtype_series = self._normalize_subtype(df.get("disease_subtype"))
         unified["disease_subtype"] = subtype_series
-        unified["disease_subtype_slug"] = subtype_series.apply(slugify)
+        unified["disease_subtype_slug"] = map_unique(subtype_series, slugify)
 
         # State/Geo
         unified["state"] = df["state"]
-        unified["state_slug"] = df["state"].apply(slugify)
+        unified["state_slug"] = map_unique(df["state"], slugify)
 
         reporting_jurisdiction = df.get("reporting_jurisdiction", df["state"])
         unified["reporting_jurisdiction"] = reporting_jurisdiction
-        unified["reporting_jurisdiction_slug"] = reporting_jurisdiction.apply(slugify)
+        unified["reporting_jurisdiction_slug"] = map_unique(reporting_jurisdiction, slugify)
 
         geo_name = df.get("geo_name", df["state"])
         unified["geo_name"] = geo_name
-        unified["geo_name_slug"] = geo_name.apply(slugify)
+        unified["geo_name_slug"] = map_unique(geo_name, slugify)
 
         geo_unit = df.get("geo_unit", "state")
         if isinstance(geo_unit, str):
@@ -204,12 +227,12 @@ class TrackerTransformer(DataSourceTransformer):
             unified["geo_unit_slug"] = slugify(geo_unit)
         else:
             unified["geo_unit"] = geo_unit
-            unified["geo_unit_slug"] = geo_unit.apply(slugify)
+            unified["geo_unit_slug"] = map_unique(geo_unit, slugify)
 
         # Age group
         age_group = self._clean_nullable(df.get("age_group"))
         unified["age_group"] = age_group
-        unified["age_group_slug"] = age_group.apply(slugify)
+        unified["age_group_slug"] = map_unique(age_group, slugify)
 
         # Other fields
         unified["confirmation_status"] = self._clean_nullable(df.get("confirmation_status"))
@@ -223,9 +246,9 @@ class TrackerTransformer(DataSourceTransformer):
         if series is None:
             return pd.Series([None] * 0)
 
-        placeholders = {"not specified", "unknown", "n/a", "na", ""}
-        return series.apply(
-            lambda x: None if pd.isna(x) or str(x).lower().strip() in placeholders else x
+        return map_unique(
+            series,
+            lambda x: None if pd.isna(x) or str(x).lower().strip() in NULL_PLACEHOLDERS else x,
         )
 
     def _normalize_subtype(self, series: pd.Series | None) -> pd.Series:
@@ -244,4 +267,4 @@ class TrackerTransformer(DataSourceTransformer):
             normalized = SUBTYPE_NORMALIZATION.get(val, x)
             return normalized
 
-        return series.apply(normalize)
+        return map_unique(series, normalize)
@@ -6,12 +6,19 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.database import db
-from app.middleware import BasicAuthMiddleware
+from app.middleware import (
+    GZIP_MIN_SIZE,
+    BasicAuthMiddleware,
+    ETagMiddleware,
+    FragmentCacheMiddleware,
+)
 from app.routers import api, html_api, pages, sql_api
 from app.templates import templates
 
@@ -80,6 +87,9 @@ async def lifespan(app: FastAPI):
         db.load_all_sources()
         logger.info("Database initialized successfully")
 
+        # Render the landing-page cards once so no visitor pays for it
+        html_api.prerender_disease_cards()
+
         # Log summary stats
         stats = db.get_summary_stats()
         source_breakdown = stats.get("source_breakdown", {})
@@ -109,11 +119,48 @@ app = FastAPI(
     version=settings.app_version,
     description="US Disease Tracker Dashboard - Data visualizations for disease surveillance",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add caching middleware for static assets
 app.add_middleware(CacheControlMiddleware)
 
+# Cache rendered HTMX fragments and read-only JSON data responses in memory
+# until the next data reload
+app.add_middleware(
+    FragmentCacheMiddleware,
+    get_version=lambda: db.last_updated_at(),
+    path_prefixes=(
+        "/api/html/",
+        "/api/data/diseases",
+        "/api/data/stats",
+        "/api/data/timeseries/",
+        "/api/data/disease/",
+    ),
+)
+
+# Add ETag/304 handling for read-only data endpoints (data only changes on
+# reload); added after the response cache so a 304 skips the cache lookup
+app.add_middleware(
+    ETagMiddleware,
+    get_version=lambda: db.last_updated_at(),
+    path_prefixes=("/api/data/diseases", "/api/data/stats", "/api/data/timeseries/"),
+)
+
+# Let browsers revalidate HTMX fragments with If-None-Match; added after the
+# fragment cache so a 304 short-circuits before any cache lookup or render
+app.add_middleware(
+    ETagMiddleware,
+    get_version=lambda: db.last_updated_at(),
+    path_prefixes=("/api/html/",),
+    cache_control="private, max-age=60, stale-while-revalidate=300",
+)
+
+# Compress pages and JSON on the fly. Must sit outside the fragment cache so
+# cached bodies stay uncompressed; responses that already carry a
+# Content-Encoding (precompressed fragments, sitemap) pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=6)
+
 # Add staging authentication middleware (if enabled)
 if settings.staging_auth_enabled:
     app.add_middleware(BasicAuthMiddleware)
@@ -139,7 +186,7 @@ templates.env.globals["hot_reload"] = hot_reload
 @app.get("/health")
 async def root_health():
     """Root health check endpoint (unauthenticated)"""
-    return {"status": "ok", "app": settings.app_name}
+    return ORJSONResponse({"status": "ok", "app": settings.app_name})
 
 
 if __name__ == "__main__":
@@ -6,5 +6,18 @@ from app.middleware.auth import (
     parse_basic_auth,
     verify_credentials,
 )
+from app.middleware.etag import ETagMiddleware, compute_etag, etag_matches
+from app.middleware.fragment_cache import GZIP_MIN_SIZE, CachedFragment, FragmentCacheMiddleware
 
-__all__ = ["AuthConfig", "BasicAuthMiddleware", "parse_basic_auth", "verify_credentials"]
+__all__ = [
+    "GZIP_MIN_SIZE",
+    "AuthConfig",
+    "BasicAuthMiddleware",
+    "CachedFragment",
+    "ETagMiddleware",
+    "FragmentCacheMiddleware",
+    "compute_etag",
+    "etag_matches",
+    "parse_basic_auth",
+    "verify_credentials",
+]
@@ -0,0 +1,104 @@
+"""HTTP caching middleware (ETag + 304) for read-only data and fragment endpoints."""
+
+import hashlib
+from collections.abc import Callable
+from datetime import datetime
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+
+
+def compute_etag(version: datetime, path: str, query: str) -> str:
+    """
+    Build a weak ETag for a request against a given data version.
+
+    The tag identifies the data version, not the bytes: GZipMiddleware sits
+    outside this middleware, so gzip and identity bodies share it, which
+    only a weak validator allows.
+
+    Args:
+        version: Timestamp of the last data load
+        path: Request path
+        query: Raw query string
+
+    Returns:
+        Weak ETag value (W/"...")
+    """
+    key = f"{version.isoformat()}|{path}?{query}".encode()
+    return f'W/"{hashlib.sha1(key, usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+
+    Uses weak comparison (RFC 9110), so W/ prefixes on either side are ignored.
+    A bare ``*`` never matches: it only applies when a current representation
+    exists, which isn't known until the route has run.
+
+    Args:
+        if_none_match: The If-None-Match header value (may list several tags)
+        etag: The current ETag
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that adds ETag/Cache-Control headers to read-only endpoints.
+
+    The data only changes when sources are reloaded, so the ETag is derived
+    from the data load timestamp plus the request URL. When the client sends
+    a matching If-None-Match header, a 304 is returned without running the
+    route (no database query, no serialization).
+
+    ``cache_control`` sets the Cache-Control value sent with the ETag, so
+    shared JSON data and per-browser HTML fragments can use different
+    freshness policies. By default responses may be stored by shared caches
+    for five minutes, unless staging auth is on, in which case only the
+    browser may store them.
+    """
+
+    def __init__(
+        self,
+        app,
+        get_version: Callable[[], datetime | None],
+        path_prefixes: tuple[str, ...],
+        cache_control: str | None = None,
+    ):
+        super().__init__(app)
+        self.get_version = get_version
+        self.path_prefixes = path_prefixes
+        if cache_control is None:
+            scope = "private" if settings.staging_auth_enabled else "public"
+            cache_control = f"{scope}, max-age=300"
+        self.cache_control = cache_control
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        path = request.url.path
+        if request.method != "GET" or not path.startswith(self.path_prefixes):
+            return await call_next(request)
+
+        version = self.get_version()
+        if version is None:
+            return await call_next(request)
+
+        etag = compute_etag(version, path, request.url.query)
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers.update(headers)
+        return response
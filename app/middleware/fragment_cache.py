@@ -0,0 +1,101 @@
+"""In-process response cache for rendered HTMX fragments and read-only data."""
+
+import gzip
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 500
+
+
+@dataclass(frozen=True)
+class CachedFragment:
+    """A rendered fragment body and the data version it was rendered from.
+
+    ``gzip_body`` holds the body compressed once at store time (None when the
+    body is too small to benefit), so cache hits never recompress.
+    """
+
+    version: datetime | None
+    body: bytes
+    gzip_body: bytes | None
+    headers: dict[str, str]
+
+    def to_response(self, accept_encoding: str) -> Response:
+        """Build a response, serving the precompressed body if the client accepts gzip."""
+        if self.gzip_body is None:
+            return Response(content=self.body, headers=self.headers)
+        if "gzip" in accept_encoding:
+            headers = {**self.headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            return Response(content=self.gzip_body, headers=headers)
+        return Response(content=self.body, headers={**self.headers, "Vary": "Accept-Encoding"})
+
+
+class FragmentCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that caches rendered HTML fragment and read-only JSON data
+    responses in memory.
+
+    These responses are anonymous and depend only on the URL and the loaded
+    data, so cache entries are keyed on path + query and tagged with the data
+    load timestamp. Reloading data changes the timestamp, which invalidates every
+    entry without an explicit flush. Each process holds its own DuckDB copy,
+    so an in-process cache stays consistent with the data it serves.
+
+    Bodies are gzip-compressed once when stored and the compressed copy is
+    served to clients that accept it. Only successful GET responses are
+    cached; the least recently used entry is evicted once ``max_entries``
+    is reached.
+    """
+
+    def __init__(
+        self,
+        app,
+        get_version: Callable[[], datetime | None],
+        path_prefixes: tuple[str, ...],
+        max_entries: int = 1024,
+    ):
+        super().__init__(app)
+        self.get_version = get_version
+        self.path_prefixes = path_prefixes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedFragment] = OrderedDict()
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        path = request.url.path
+        if request.method != "GET" or not path.startswith(self.path_prefixes):
+            return await call_next(request)
+
+        version = self.get_version()
+        if version is None:
+            return await call_next(request)
+
+        key = f"{path}?{request.url.query}"
+        accept_encoding = request.headers.get("Accept-Encoding", "")
+        cached = self._entries.get(key)
+        if cached is not None and cached.version == version:
+            self._entries.move_to_end(key)
+            return cached.to_response(accept_encoding)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        # Content-Length is recomputed per response (plain vs. compressed body)
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        gzip_body = gzip.compress(body, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+
+        cached = CachedFragment(version=version, body=body, gzip_body=gzip_body, headers=headers)
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return cached.to_response(accept_encoding)
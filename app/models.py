@@ -1,9 +1,13 @@
 """Pydantic models for API responses"""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
+# Time bucket accepted by the timeseries endpoints
+Granularity = Literal["month", "week"]
+
 
 class HealthResponse(BaseModel):
     """Health check response model"""
@@ -13,6 +17,15 @@ class HealthResponse(BaseModel):
     database_initialized: bool = Field(..., description="Database initialization status")
 
 
+class PoolHealthResponse(BaseModel):
+    """Database connection pool statistics"""
+
+    pool_size: int = Field(..., description="Total pooled DuckDB connections")
+    available: int = Field(..., description="Connections currently idle in the pool")
+    in_use: int = Field(..., description="Connections currently checked out by queries")
+    workers: int = Field(..., description="Threads available for blocking database queries")
+
+
 class DiseaseListItem(BaseModel):
     """Disease list item model"""
 
@@ -70,7 +83,7 @@ class NationalDiseaseTimeSeriesResponse(BaseModel):
 
     disease_name: str = Field(..., description="Disease name")
     disease_slug: str = Field(..., description="URL-safe disease slug")
-    granularity: str = Field(..., description="Time granularity (month or week)")
+    granularity: Granularity = Field(..., description="Time granularity (month or week)")
     data: list[NationalDiseaseTimeSeriesDataPoint] = Field(
         ..., description="Time series data points"
     )
@@ -97,7 +110,7 @@ class DiseaseTimeSeriesByStateResponse(BaseModel):
 
     disease_name: str = Field(..., description="Disease name")
     disease_slug: str = Field(..., description="URL-safe disease slug")
-    granularity: str = Field(..., description="Time granularity (month or week)")
+    granularity: Granularity = Field(..., description="Time granularity (month or week)")
     available_states: list[str] = Field(
         ..., description="List of states with data for this disease"
     )
@@ -1,23 +1,29 @@
-"""JSON API endpoints"""
+"""JSON API endpoints
+
+Data and health endpoints return ORJSONResponse built from plain dicts (for
+data, the ones the database layer produces), which skips FastAPI's
+jsonable_encoder/response_model pass. The response_model declarations are
+kept so the OpenAPI schema stays documented.
+"""
 
 import logging
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import db
 from app.dependencies import get_disease_name_or_404, run_db_query
 from app.models import (
-    AgeGroupData,
     AgeGroupDistributionResponse,
-    DiseaseListItem,
     DiseaseListResponse,
     DiseaseStatsResponse,
     DiseaseTimeSeriesByStateResponse,
+    Granularity,
     HealthResponse,
     NationalDiseaseTimeSeriesDataPoint,
     NationalDiseaseTimeSeriesResponse,
-    StateCaseData,
+    PoolHealthResponse,
     StateCaseTotalsResponse,
     StateTimeSeriesDataPoint,
     SummaryStatsResponse,
@@ -30,6 +36,9 @@ router = APIRouter(
     tags=["data-api"],
 )
 
+# Served by /stats before data is loaded (get_summary_stats returns {})
+_EMPTY_SUMMARY_STATS = SummaryStatsResponse().model_dump()
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -39,11 +48,26 @@ async def health_check():
     Returns:
         Service status and version information
     """
-    return HealthResponse(
-        status="healthy", version=settings.app_version, database_initialized=db.is_initialized()
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "version": settings.app_version,
+            "database_initialized": db.is_initialized(),
+        }
     )
 
 
+@router.get("/pool-health", response_model=PoolHealthResponse)
+async def pool_health():
+    """
+    Database connection pool statistics.
+
+    Returns:
+        Pool size, idle and in-use connection counts, and DB worker thread count
+    """
+    return ORJSONResponse(db.pool_stats())
+
+
 @router.get("/diseases", response_model=DiseaseListResponse)
 async def list_diseases(data_source: str | None = None):
     """
@@ -57,12 +81,14 @@ async def list_diseases(data_source: str | None = None):
     """
     try:
         diseases = await run_db_query(db.get_diseases_with_slugs, data_source=data_source)
-        return DiseaseListResponse(
-            diseases=[DiseaseListItem(name=d["name"], slug=d["slug"]) for d in diseases],
-            count=len(diseases),
+        return ORJSONResponse(
+            {
+                "diseases": [{"name": d["name"], "slug": d["slug"]} for d in diseases],
+                "count": len(diseases),
+            }
         )
     except Exception as e:
-        logger.error(f"Error fetching diseases: {e}")
+        logger.error("Error fetching diseases: %s", e)
         raise HTTPException(status_code=500, detail="Failed to fetch diseases") from e
 
 
@@ -79,15 +105,15 @@ async def get_summary_stats(data_source: str | None = None):
     """
     try:
         stats = await run_db_query(db.get_summary_stats, data_source=data_source)
-        return SummaryStatsResponse(**stats)
+        return ORJSONResponse(stats or _EMPTY_SUMMARY_STATS)
     except Exception as e:
-        logger.error(f"Error fetching stats: {e}")
+        logger.error("Error fetching stats: %s", e)
         raise HTTPException(status_code=500, detail="Failed to fetch statistics") from e
 
 
 @router.get("/timeseries/national/{disease_slug}", response_model=NationalDiseaseTimeSeriesResponse)
 async def get_national_disease_timeseries(
-    disease_slug: str, granularity: str = "month", data_source: str | None = None
+    disease_slug: str, granularity: Granularity = "month", data_source: str | None = None
 ):
     """
     Get national time series data for a specific disease.
@@ -106,22 +132,28 @@ async def get_national_disease_timeseries(
             db.get_national_disease_timeseries, disease_name, granularity, data_source=data_source
         )
 
-        return NationalDiseaseTimeSeriesResponse(
-            disease_name=disease_name,
-            disease_slug=disease_slug,
-            granularity=granularity,
-            data=[NationalDiseaseTimeSeriesDataPoint(**point) for point in data],
+        # Rows are passed through as-is; in debug mode spot-check one against the model
+        if settings.debug and data:
+            NationalDiseaseTimeSeriesDataPoint.model_validate(data[0])
+
+        return ORJSONResponse(
+            {
+                "disease_name": disease_name,
+                "disease_slug": disease_slug,
+                "granularity": granularity,
+                "data": data,
+            }
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching timeseries for {disease_slug}: {e}")
+        logger.error("Error fetching timeseries for %s: %s", disease_slug, e)
         raise HTTPException(status_code=500, detail="Failed to fetch time series data") from e
 
 
 @router.get("/timeseries/states/{disease_slug}", response_model=DiseaseTimeSeriesByStateResponse)
 async def get_disease_timeseries_by_state(
-    disease_slug: str, granularity: str = "month", data_source: str | None = None
+    disease_slug: str, granularity: Granularity = "month", data_source: str | None = None
 ):
     """
     Get state-level time series data for a specific disease.
@@ -140,26 +172,24 @@ async def get_disease_timeseries_by_state(
             db.get_disease_timeseries_by_state, disease_name, granularity, data_source=data_source
         )
 
-        # Convert states data to proper format
-        states_formatted = {}
-        for state, state_data in data["states"].items():
-            states_formatted[state] = [StateTimeSeriesDataPoint(**point) for point in state_data]
-
-        # Convert national data to proper format
-        national_formatted = [StateTimeSeriesDataPoint(**point) for point in data["national"]]
-
-        return DiseaseTimeSeriesByStateResponse(
-            disease_name=disease_name,
-            disease_slug=disease_slug,
-            granularity=granularity,
-            available_states=data["available_states"],
-            states=states_formatted,
-            national=national_formatted,
+        # Rows are passed through as-is; in debug mode spot-check one against the model
+        if settings.debug and data["national"]:
+            StateTimeSeriesDataPoint.model_validate(data["national"][0])
+
+        return ORJSONResponse(
+            {
+                "disease_name": disease_name,
+                "disease_slug": disease_slug,
+                "granularity": granularity,
+                "available_states": data["available_states"],
+                "states": data["states"],
+                "national": data["national"],
+            }
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching state timeseries for {disease_slug}: {e}")
+        logger.error("Error fetching state timeseries for %s: %s", disease_slug, e)
         raise HTTPException(status_code=500, detail="Failed to fetch state time series data") from e
 
 
@@ -179,18 +209,20 @@ async def get_disease_stats(disease_slug: str, data_source: str | None = None):
         disease_name = await get_disease_name_or_404(disease_slug)
         stats = await run_db_query(db.get_disease_stats, disease_name, data_source=data_source)
 
-        return DiseaseStatsResponse(
-            disease_name=disease_name,
-            disease_slug=disease_slug,
-            total_cases=stats["total_cases"],
-            affected_states=stats["affected_states"],
-            affected_counties=stats["affected_counties"],
-            two_week_cases=stats["two_week_cases"],
+        return ORJSONResponse(
+            {
+                "disease_name": disease_name,
+                "disease_slug": disease_slug,
+                "total_cases": stats["total_cases"],
+                "affected_states": stats["affected_states"],
+                "affected_counties": stats["affected_counties"],
+                "two_week_cases": stats["two_week_cases"],
+            }
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching stats for {disease_slug}: {e}")
+        logger.error("Error fetching stats for %s: %s", disease_slug, e)
         raise HTTPException(status_code=500, detail="Failed to fetch disease statistics") from e
 
 
@@ -224,24 +256,20 @@ async def get_age_group_distribution(
             end_date=end_date,
         )
 
-        # Convert to proper format
-        states_formatted = {}
-        for state, age_data in data["states"].items():
-            states_formatted[state] = {
-                age_group: AgeGroupData(**values) for age_group, values in age_data.items()
+        # The DB layer already returns the response shape; encode it as-is
+        return ORJSONResponse(
+            {
+                "disease_name": disease_name,
+                "disease_slug": disease_slug,
+                "age_groups": data["age_groups"],
+                "available_states": data["available_states"],
+                "states": data["states"],
             }
-
-        return AgeGroupDistributionResponse(
-            disease_name=disease_name,
-            disease_slug=disease_slug,
-            age_groups=data["age_groups"],
-            available_states=data["available_states"],
-            states=states_formatted,
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching age group distribution for {disease_slug}: {e}")
+        logger.error("Error fetching age group distribution for %s: %s", disease_slug, e)
         raise HTTPException(status_code=500, detail="Failed to fetch age group distribution") from e
 
 
@@ -274,21 +302,19 @@ async def get_state_case_totals(
             end_date=end_date,
         )
 
-        # Convert to proper format
-        states_formatted = {
-            state: StateCaseData(**state_data) for state, state_data in data["states"].items()
-        }
-
-        return StateCaseTotalsResponse(
-            disease_name=disease_name,
-            disease_slug=disease_slug,
-            states=states_formatted,
-            max_cases=data["max_cases"],
-            min_cases=data["min_cases"],
-            available_states=data["available_states"],
+        # The DB layer already returns the response shape; encode it as-is
+        return ORJSONResponse(
+            {
+                "disease_name": disease_name,
+                "disease_slug": disease_slug,
+                "states": data["states"],
+                "max_cases": data["max_cases"],
+                "min_cases": data["min_cases"],
+                "available_states": data["available_states"],
+            }
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching state totals for {disease_slug}: {e}")
+        logger.error("Error fetching state totals for %s: %s", disease_slug, e)
         raise HTTPException(status_code=500, detail="Failed to fetch state case totals") from e
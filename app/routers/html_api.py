@@ -1,12 +1,16 @@
 """HTML fragment endpoints for HTMX"""
 
+import asyncio
 import logging
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
 from app.database import db
 from app.dependencies import get_db, get_disease_name_or_404, run_db_query
+from app.etl.config import list_sources
+from app.models import Granularity
 from app.templates import templates
 
 logger = logging.getLogger(__name__)
@@ -16,9 +20,68 @@ router = APIRouter(
     tags=["html"],
 )
 
+# Rendered disease-card grids keyed by effective data source, tagged with the
+# data load timestamp they were rendered from. Only configured sources (and
+# None for merged data) are stored, so arbitrary query values can't grow it.
+_cards_html: dict[str | None, tuple[datetime, bytes]] = {}
+_CACHEABLE_CARD_SOURCES = frozenset([None, *list_sources()])
+
+
+def _build_stats(disease_name: str, disease_slug: str, stats_raw: dict) -> dict:
+    """Shape get_disease_stats output for the stats bar partial."""
+    return {
+        "disease_name": disease_name,
+        "disease_slug": disease_slug,
+        "total_cases": stats_raw["total_cases"],
+        "affected_states": stats_raw["affected_states"],
+        "affected_counties": stats_raw["affected_counties"],
+        "two_week_cases": stats_raw["two_week_cases"],
+    }
+
+
+def _build_state_selector_states(state_data: dict) -> list[dict]:
+    """Transform state case totals to the list of {state, total} the selector expects."""
+    states = [{"state": "National", "total": state_data["national_total"]}]
+    states.extend(
+        {"state": state, "total": data["cases"]} for state, data in state_data["states"].items()
+    )
+    return states
+
+
+def render_disease_cards(data_source: str | None) -> bytes:
+    """
+    Return the disease-card grid for a data source, rendering it at most once per load.
+
+    The grid is identical for every visitor until data is reloaded, so the
+    rendered bytes are kept in memory and re-rendered only when the data
+    load timestamp changes. Unknown data sources are rendered but not kept.
+
+    Args:
+        data_source: Effective data source (None for merged data)
+
+    Returns:
+        Rendered HTML bytes
+    """
+    version = db.last_updated_at()
+    cached = _cards_html.get(data_source)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    diseases = db.get_disease_cards_bundle(data_source)
+    body = templates.get_template("partials/disease_cards.html").render(diseases=diseases).encode()
+    if version is not None and data_source in _CACHEABLE_CARD_SOURCES:
+        _cards_html[data_source] = (version, body)
+    return body
+
+
+def prerender_disease_cards() -> None:
+    """Render the landing-page card grids (default and merged) after a data load."""
+    for data_source in ("tracker", None):
+        render_disease_cards(data_source)
+
 
 @router.get("/diseases", response_class=HTMLResponse)
-async def get_disease_cards(request: Request, data_source: str | None = None, _db=Depends(get_db)):
+async def get_disease_cards(data_source: str | None = None, _db=Depends(get_db)):
     """
     Returns HTML fragment containing all disease cards.
     Used by HTMX to populate the landing page grid.
@@ -29,28 +92,9 @@ async def get_disease_cards(request: Request, data_source: str | None = None, _d
     """
     # Default to tracker data, use 'all' for merged view (secret param)
     effective_source = None if data_source == "all" else (data_source or "tracker")
-    diseases_raw = await run_db_query(db.get_diseases_with_slugs, effective_source)
-
-    # Always get merged totals (not filtered by data_source)
-    # The cumulative total should always show the full deduplicated total
-    stats = await run_db_query(db.get_summary_stats, None)
-    disease_totals = {d["disease_name"]: d["total_cases"] for d in stats.get("disease_totals", [])}
-
-    # Enrich diseases with total cases and data source
-    diseases = []
-    for d in diseases_raw:
-        diseases.append(
-            {
-                "name": d["name"],
-                "slug": d["slug"],
-                "total_cases": disease_totals.get(d["name"]),
-                "data_source": d.get("data_source", ""),
-            }
-        )
+    body = await run_db_query(render_disease_cards, effective_source)
 
-    return templates.TemplateResponse(
-        request, "partials/disease_cards.html", {"diseases": diseases}
-    )
+    return HTMLResponse(body)
 
 
 @router.get("/disease/{disease_slug}/stats", response_class=HTMLResponse)
@@ -62,21 +106,16 @@ async def get_disease_stats(request: Request, disease_slug: str, _db=Depends(get
     disease_name = await get_disease_name_or_404(disease_slug)
     stats_raw = await run_db_query(db.get_disease_stats, disease_name)
 
-    stats = {
-        "disease_name": disease_name,
-        "disease_slug": disease_slug,
-        "total_cases": stats_raw["total_cases"],
-        "affected_states": stats_raw["affected_states"],
-        "affected_counties": stats_raw["affected_counties"],
-        "two_week_cases": stats_raw["two_week_cases"],
-    }
-
-    return templates.TemplateResponse(request, "partials/disease_stats.html", {"stats": stats})
+    return templates.TemplateResponse(
+        request,
+        "partials/disease_stats.html",
+        {"stats": _build_stats(disease_name, disease_slug, stats_raw)},
+    )
 
 
 @router.get("/disease/{disease_slug}/timeseries", response_class=HTMLResponse)
 async def get_timeseries_chart(
-    request: Request, disease_slug: str, granularity: str = "month", _db=Depends(get_db)
+    request: Request, disease_slug: str, granularity: Granularity = "month", _db=Depends(get_db)
 ):
     """
     Returns HTML fragment containing time series chart with embedded data.
@@ -148,21 +187,13 @@ async def get_state_selector(request: Request, disease_slug: str, _db=Depends(ge
     disease_name = await get_disease_name_or_404(disease_slug)
     state_data = await run_db_query(db.get_state_case_totals, disease_name)
 
-    # Transform to list of {state, total} for the selector component
-    states = [
-        {"state": "National", "total": sum(s["cases"] for s in state_data["states"].values())}
-    ]
-    states.extend(
-        {"state": state, "total": data["cases"]} for state, data in state_data["states"].items()
-    )
-
     return templates.TemplateResponse(
         request,
         "partials/state_selector.html",
         {
             "disease_slug": disease_slug,
             "disease_name": disease_name,
-            "states": states,
+            "states": _build_state_selector_states(state_data),
         },
     )
 
@@ -222,3 +253,49 @@ async def get_state_map_chart(
             "end_date": end_date,
         },
     )
+
+
+@router.get("/disease/{disease_slug}/bundle", response_class=HTMLResponse)
+async def get_disease_bundle(request: Request, disease_slug: str, _db=Depends(get_db)):
+    """
+    Returns every disease detail panel in a single HTML response.
+    Each panel is wrapped in an hx-swap-oob element targeting its placeholder
+    on the disease detail page, so the page makes one request instead of one
+    per panel. The disease name is resolved once and the panel queries are
+    dispatched together; the state totals query feeds both the state selector
+    and the (unfiltered) map.
+    """
+    disease_name = await get_disease_name_or_404(disease_slug)
+    include_serotypes = disease_slug == "meningococcus"
+
+    queries = [
+        run_db_query(db.get_disease_stats, disease_name),
+        run_db_query(db.get_state_case_totals, disease_name),
+        run_db_query(db.get_national_disease_timeseries, disease_name, "month"),
+        run_db_query(db.get_disease_timeseries_by_state, disease_name, "month"),
+        run_db_query(db.get_age_group_distribution_by_state, disease_name),
+    ]
+    if include_serotypes:
+        queries.append(run_db_query(db.get_serotype_distribution_by_state, disease_name))
+
+    results = await asyncio.gather(*queries)
+    stats_raw, state_totals, national_timeseries, state_timeseries, age_groups = results[:5]
+
+    return templates.TemplateResponse(
+        request,
+        "partials/disease_bundle.html",
+        {
+            "disease_slug": disease_slug,
+            "disease_name": disease_name,
+            "granularity": "month",
+            "start_date": None,
+            "end_date": None,
+            "stats": _build_stats(disease_name, disease_slug, stats_raw),
+            "states": _build_state_selector_states(state_totals),
+            "timeseries_data": national_timeseries,
+            "state_map_data": state_totals,
+            "timeseries_chart_data": state_timeseries,
+            "age_group_data": age_groups,
+            "serotype_data": results[5] if include_serotypes else None,
+        },
+    )
@@ -1,12 +1,17 @@
 """HTML/HTMX page endpoints"""
 
+import gzip
+import hashlib
 import logging
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, Response
 
+from app.config import settings
 from app.database import db
-from app.dependencies import run_db_query
+from app.middleware import GZIP_MIN_SIZE, CachedFragment, etag_matches
 from app.templates import templates
 
 logger = logging.getLogger(__name__)
@@ -15,6 +20,20 @@ router = APIRouter(
     tags=["pages"],
 )
 
+# Built sitemaps keyed by base URL, tagged with the data load timestamp.
+# Bounded because the base URL comes from the request's Host header.
+_SITEMAP_CACHE_MAX = 16
+_sitemap_cache: dict[str, CachedFragment] = {}
+
+# The sitemap is assembled directly as bytes, so it is never UTF-8 encoded per build
+_SITEMAP_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_SITEMAP_ROOT_URL = b"  <url><loc>%s/</loc><priority>1.0</priority></url>\n"
+_SITEMAP_DISEASE_URL = b"  <url><loc>%s/disease/%s</loc><priority>0.8</priority></url>\n"
+_SITEMAP_FOOTER = b"</urlset>"
+
 
 @router.get("/", response_class=HTMLResponse)
 async def landing_page(request: Request, data_source: str | None = None):
@@ -53,30 +72,23 @@ async def disease_detail_page(request: Request, disease_slug: str):
     Returns:
         Rendered HTML template
     """
-    # Look up disease name from slug for page title
-    disease_name = (
-        await run_db_query(db.get_disease_name_by_slug, disease_slug)
-        if db.is_initialized()
-        else None
-    )
-
-    if db.is_initialized() and disease_name is None:
-        return templates.TemplateResponse(
-            request,
-            "index.html",
-            {
-                "page_title": "Disease Not Found",
-                "error": f"Disease with slug '{disease_slug}' not found",
-            },
-            status_code=404,
-        )
-
-    # Get data source for this disease
-    data_source = (
-        await run_db_query(db.get_disease_data_source_by_slug, disease_slug)
-        if db.is_initialized()
-        else None
-    )
+    disease_name = None
+    data_source = None
+    if db.is_initialized():
+        # Name (for the page title) and data sources come from the in-memory slug index
+        disease = db.get_disease_header_by_slug(disease_slug)
+        if disease is None:
+            return templates.TemplateResponse(
+                request,
+                "index.html",
+                {
+                    "page_title": "Disease Not Found",
+                    "error": f"Disease with slug '{disease_slug}' not found",
+                },
+                status_code=404,
+            )
+        disease_name = disease["name"]
+        data_source = disease["data_source"]
 
     return templates.TemplateResponse(
         request,
@@ -95,35 +107,64 @@ async def disease_detail_page(request: Request, disease_slug: str):
     )
 
 
+def _build_sitemap(base_url: str) -> bytes:
+    """Build the sitemap XML for the landing page and every disease page."""
+    # The base URL comes from the Host header, so it is escaped along with slugs
+    base = escape(base_url).encode()
+    parts = [_SITEMAP_HEADER, _SITEMAP_ROOT_URL % base]
+
+    # Add disease pages (every catalog entry carries a slug)
+    if db.is_initialized():
+        parts.extend(
+            _SITEMAP_DISEASE_URL % (base, escape(disease["slug"]).encode())
+            for disease in db.get_diseases_with_slugs()
+        )
+
+    parts.append(_SITEMAP_FOOTER)
+    return b"".join(parts)
+
+
 @router.get("/sitemap.xml", response_class=Response)
 async def sitemap(request: Request):
     """
     Generate XML sitemap for search engines.
 
+    The XML only changes when data is reloaded, so it is built and
+    gzip-compressed (at maximum level) once per base URL and data load, and
+    served with an ETag so crawlers can revalidate.
+
     Returns:
         XML sitemap with all disease pages
     """
     base_url = str(request.base_url).rstrip("/")
+    version = db.last_updated_at()
+
+    cached = _sitemap_cache.get(base_url)
+    if cached is None or cached.version != version:
+        # Built from the in-memory disease catalog, so no DB thread hop
+        content = _build_sitemap(base_url)
+        headers = {
+            "Content-Type": "application/xml",
+            # Weak: the gzip and identity bodies share one tag
+            "ETag": f'W/"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"',
+            "Cache-Control": (
+                "private, max-age=300" if settings.staging_auth_enabled else "public, max-age=300"
+            ),
+        }
+        if version is not None:
+            headers["Last-Modified"] = format_datetime(version, usegmt=True)
+        cached = CachedFragment(
+            version=version,
+            body=content,
+            gzip_body=gzip.compress(content, mtime=0) if len(content) >= GZIP_MIN_SIZE else None,
+            headers=headers,
+        )
+        if version is not None:
+            if len(_sitemap_cache) >= _SITEMAP_CACHE_MAX:
+                _sitemap_cache.clear()
+            _sitemap_cache[base_url] = cached
 
-    # Start XML
-    xml_parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-        f"  <url><loc>{base_url}/</loc><priority>1.0</priority></url>",
-    ]
-
-    # Add disease pages
-    if db.is_initialized():
-        diseases = await run_db_query(db.get_diseases_with_slugs)
-        for disease in diseases:
-            slug = disease.get("slug", "")
-            xml_parts.append(
-                f"  <url><loc>{base_url}/disease/{slug}</loc><priority>0.8</priority></url>"
-            )
-
-    xml_parts.append("</urlset>")
+    if etag_matches(request.headers.get("If-None-Match"), cached.headers["ETag"]):
+        return Response(status_code=304, headers=cached.headers)
 
-    return Response(
-        content="\n".join(xml_parts),
-        media_type="application/xml",
-    )
+    return cached.to_response(request.headers.get("Accept-Encoding", ""))
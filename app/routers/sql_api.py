@@ -4,11 +4,17 @@ This endpoint accepts SQL queries from the frontend Mosaic coordinator
 and returns JSON results. It validates queries to ensure security.
 """
 
+import asyncio
+import functools
 import logging
-import re
+from collections import OrderedDict
+from datetime import datetime
 from typing import Any
 
+import duckdb
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, field_validator
 
 from app.database import db
@@ -29,22 +35,79 @@ ALLOWED_TABLES = frozenset(
     ]
 )
 
-# SQL keywords that indicate mutation (not allowed)
-FORBIDDEN_KEYWORDS = frozenset(
-    [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "CREATE",
-        "ALTER",
-        "TRUNCATE",
-        "GRANT",
-        "REVOKE",
-        "EXECUTE",
-        "EXEC",
-    ]
-)
+# Upper bound on accepted query text; checked before any parsing
+MAX_SQL_LENGTH = 16384
+
+# Accepted query openings (plain SELECT, CTE or parenthesized set operation)
+_SELECT_PREFIXES = ("SELECT", "WITH", "(")
+
+# Query results keyed by SQL text, tagged with the data load timestamp. The
+# coordinator re-issues the same queries while the user scrubs filters, and
+# results only change when data is reloaded.
+_RESULT_CACHE_MAX = 512
+_result_cache: OrderedDict[str, tuple[datetime, bytes]] = OrderedDict()
+# Executions in progress, so concurrent identical queries share one run
+_in_flight: dict[str, asyncio.Future] = {}
+
+# In-memory connection used only to serialize SQL to an AST, never to run
+# queries. Validation runs on the event loop thread, so it isn't shared
+# across threads.
+_parser_conn = duckdb.connect()
+
+
+def _collect_relations(
+    node: Any, tables: set[str], ctes: set[str], table_functions: set[str]
+) -> None:
+    """Collect base tables, CTE names and table functions from a serialized AST."""
+    if isinstance(node, dict):
+        node_type = node.get("type")
+        if node_type == "BASE_TABLE":
+            tables.add(node["table_name"].lower())
+        elif node_type == "TABLE_FUNCTION":
+            table_functions.add(node["function"]["function_name"].lower())
+        if "cte_map" in node:
+            ctes.update(entry["key"].lower() for entry in node["cte_map"]["map"])
+        for value in node.values():
+            _collect_relations(value, tables, ctes, table_functions)
+    elif isinstance(node, list):
+        for item in node:
+            _collect_relations(item, tables, ctes, table_functions)
+
+
+@functools.lru_cache(maxsize=512)
+def parse_select(sql: str) -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Parse a query with DuckDB's own parser.
+
+    Parsing (rather than regex scanning) ignores keywords inside string
+    literals and identifiers, and resolves CTE names so they aren't mistaken
+    for tables. Results are cached because the Mosaic coordinator re-sends
+    the same queries while the user cross-filters.
+
+    Args:
+        sql: The SQL query string
+
+    Returns:
+        Tuple of (referenced table names, referenced table functions)
+
+    Raises:
+        ValueError: If the SQL doesn't parse or isn't a single SELECT statement
+    """
+    try:
+        statements = duckdb.extract_statements(sql)
+    except duckdb.ParserException as e:
+        raise ValueError(f"Invalid SQL: {e}") from e
+
+    if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("Only single SELECT queries are allowed")
+
+    ast = orjson.loads(_parser_conn.execute("SELECT json_serialize_sql(?)", [sql]).fetchone()[0])
+    tables: set[str] = set()
+    ctes: set[str] = set()
+    table_functions: set[str] = set()
+    _collect_relations(ast, tables, ctes, table_functions)
+    # References to CTEs resolve to the CTE, not to a table
+    return frozenset(tables - ctes), frozenset(table_functions)
 
 
 class QueryRequest(BaseModel):
@@ -57,21 +120,17 @@ class QueryRequest(BaseModel):
     @classmethod
     def validate_sql(cls, v: str) -> str:
         """Validate SQL query for safety."""
-        if not v or not v.strip():
+        # Cheap checks first, so oversized or blank input never reaches the parser
+        if len(v) > MAX_SQL_LENGTH:
+            raise ValueError(f"SQL query exceeds {MAX_SQL_LENGTH} characters")
+        if not v or v.isspace():
             raise ValueError("SQL query cannot be empty")
+        # Only the first few characters are uppercased, never the whole query
+        if not v.lstrip()[:6].upper().startswith(_SELECT_PREFIXES):
+            raise ValueError("Only single SELECT queries are allowed")
 
-        # Normalize whitespace for checking
-        normalized = " ".join(v.upper().split())
-
-        # Must start with SELECT
-        if not normalized.startswith("SELECT"):
-            raise ValueError("Only SELECT queries are allowed")
-
-        # Check for forbidden keywords
-        for keyword in FORBIDDEN_KEYWORDS:
-            # Match keyword as whole word
-            if re.search(rf"\b{keyword}\b", normalized):
-                raise ValueError(f"Forbidden SQL keyword: {keyword}")
+        # Must be exactly one SELECT statement (raises ValueError otherwise)
+        parse_select(v)
 
         return v
 
@@ -100,32 +159,78 @@ def validate_tables_in_query(sql: str) -> None:
         sql: The SQL query string
 
     Raises:
-        HTTPException: If query references disallowed tables
+        HTTPException: If query references disallowed tables or table functions
     """
-    # Simple regex to find table names after FROM and JOIN
-    # This is a basic check - production should use proper SQL parsing
-    normalized = sql.upper()
-
-    # Find table references (basic pattern)
-    from_pattern = r"\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*)"
-    join_pattern = r"\bJOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)"
-
-    tables_found = set()
-    for match in re.finditer(from_pattern, normalized):
-        tables_found.add(match.group(1).lower())
-    for match in re.finditer(join_pattern, normalized):
-        tables_found.add(match.group(1).lower())
+    try:
+        tables, table_functions = parse_select(sql)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     # Check all found tables are allowed
-    disallowed = tables_found - ALLOWED_TABLES
+    disallowed = sorted(tables - ALLOWED_TABLES)
     if disallowed:
         raise HTTPException(
             status_code=400, detail=f"Query references disallowed tables: {', '.join(disallowed)}"
         )
 
+    # Table functions can read files or run nested queries
+    if table_functions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Query uses disallowed table functions: {', '.join(sorted(table_functions))}",
+        )
+
+
+def _execute_to_json(sql: str) -> bytes:
+    """Run a query and encode the result as QueryResponse-shaped JSON bytes.
+
+    Results come from our own database, so they are encoded directly with
+    orjson instead of being validated through QueryResponse first. Values
+    orjson can't encode natively (e.g. DECIMAL) fall back to str, as
+    Pydantic's encoder did.
+    """
+    return orjson.dumps(db.execute_sql(sql), default=str)
+
+
+async def execute_cached(sql: str) -> bytes:
+    """
+    Execute a validated query, reusing results until the next data reload.
+
+    Identical queries arriving while one is already running wait on that
+    execution instead of starting their own. Results are cached already
+    encoded, so a hit costs no serialization.
+
+    Args:
+        sql: The validated SQL query
+
+    Returns:
+        JSON-encoded result with data, columns and row_count
+    """
+    version = db.last_updated_at()
+    cached = _result_cache.get(sql)
+    if cached is not None and cached[0] == version:
+        _result_cache.move_to_end(sql)
+        return cached[1]
+
+    task = _in_flight.get(sql)
+    if task is None:
+        task = asyncio.ensure_future(run_db_query(_execute_to_json, sql))
+        _in_flight[sql] = task
+        task.add_done_callback(lambda _task: _in_flight.pop(sql, None))
+
+    # Shielded so one cancelled request doesn't cancel the shared execution
+    result = await asyncio.shield(task)
+
+    if version is not None:
+        _result_cache[sql] = (version, result)
+        _result_cache.move_to_end(sql)
+        while len(_result_cache) > _RESULT_CACHE_MAX:
+            _result_cache.popitem(last=False)
+    return result
+
 
 @router.post("/query", response_model=QueryResponse)
-async def execute_query(request: QueryRequest, _db=Depends(get_db)) -> QueryResponse:
+async def execute_query(request: QueryRequest, _db=Depends(get_db)):
     """
     Execute a SQL query and return results.
 
@@ -136,7 +241,8 @@ async def execute_query(request: QueryRequest, _db=Depends(get_db)) -> QueryResp
         request: The query request containing SQL and response type
 
     Returns:
-        QueryResponse with data rows, column names, and row count
+        JSON with data rows, column names, and row count (QueryResponse shape;
+        the model is kept for the OpenAPI schema)
 
     Raises:
         HTTPException: 400 for invalid queries, 500 for execution errors
@@ -147,11 +253,8 @@ async def execute_query(request: QueryRequest, _db=Depends(get_db)) -> QueryResp
     logger.debug(f"Executing query: {request.sql[:100]}...")
 
     try:
-        result = await run_db_query(db.execute_sql, request.sql)
-
-        return QueryResponse(
-            data=result["data"], columns=result["columns"], row_count=result["row_count"]
-        )
+        body = await execute_cached(request.sql)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Query execution failed: {e}")
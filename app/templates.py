@@ -1,8 +1,33 @@
 """Shared Jinja2 template configuration."""
 
+import os
 from pathlib import Path
 
+import orjson
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
+
+# Templates only change on disk during development (hot reload); elsewhere skip
+# the per-render mtime check, and persist compiled templates so new workers
+# and restarts don't recompile them from source.
+templates.env.auto_reload = os.getenv("APP_ENV") == "development"
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+def _orjson_dumps(obj, sort_keys: bool = False, **_kwargs) -> str:
+    """JSON encoder for the ``tojson`` filter backed by orjson.
+
+    Chart partials embed large datasets via ``{{ data | tojson }}``; orjson
+    encodes them much faster than the stdlib json module Jinja uses by default.
+    Jinja still applies its HTML-safe escaping to the result.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode()
+
+
+templates.env.policies["json.dumps_function"] = _orjson_dumps
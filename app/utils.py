@@ -3,6 +3,9 @@
 import re
 import unicodedata
 
+# Runs of non-alphanumerics collapse to a single hyphen (the match is greedy)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 def to_disease_slug(name: str) -> str:
     """Generate deterministic, URL-safe slug from disease name.
@@ -32,10 +35,5 @@ def to_disease_slug(name: str) -> str:
     s = s.lower()
     # Replace apostrophes with nothing (Hansen's → hansens)
     s = s.replace("'", "")
-    # Replace any non-alphanumeric with hyphen
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    # Remove leading/trailing hyphens
-    s = s.strip("-")
-    # Collapse multiple hyphens
-    s = re.sub(r"-+", "-", s)
-    return s
+    # Replace each run of non-alphanumerics with one hyphen, trim the ends
+    return _SLUG_RE.sub("-", s).strip("-")
@@ -201,9 +201,18 @@ class TestMiddlewareAuthEnabled:
     def client(self, config: AuthConfig) -> TestClient:
         return TestClient(create_test_app(config))
 
-    def test_unauthenticated_request_returns_401(self, client: TestClient):
-        """Requests without credentials should return 401."""
-        response = client.get("/api/test")
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {},
+            make_basic_auth_header("wronguser", "testpass"),
+            make_basic_auth_header("testuser", "wrongpass"),
+        ],
+        ids=["no-credentials", "invalid-username", "invalid-password"],
+    )
+    def test_missing_or_invalid_credentials_return_401(self, client: TestClient, headers: dict):
+        """Requests without valid credentials should return 401."""
+        response = client.get("/api/test", headers=headers)
         assert response.status_code == 401
 
     def test_401_includes_www_authenticate_header(self, client: TestClient):
@@ -220,18 +229,6 @@ class TestMiddlewareAuthEnabled:
         assert response.status_code == 200
         assert response.json() == {"message": "authenticated"}
 
-    def test_invalid_username_returns_401(self, client: TestClient):
-        """Wrong username should return 401."""
-        headers = make_basic_auth_header("wronguser", "testpass")
-        response = client.get("/api/test", headers=headers)
-        assert response.status_code == 401
-
-    def test_invalid_password_returns_401(self, client: TestClient):
-        """Wrong password should return 401."""
-        headers = make_basic_auth_header("testuser", "wrongpass")
-        response = client.get("/api/test", headers=headers)
-        assert response.status_code == 401
-
     def test_health_bypasses_auth(self, client: TestClient):
         """Health endpoint should be accessible without auth."""
         response = client.get("/health")
@@ -255,19 +252,17 @@ class TestMiddlewareEdgeCases:
     def client(self, config: AuthConfig) -> TestClient:
         return TestClient(create_test_app(config))
 
-    def test_malformed_auth_header_returns_401(self, client: TestClient):
-        """Malformed Authorization header should return 401."""
-        response = client.get("/api/test", headers={"Authorization": "Basic !!invalid!!"})
-        assert response.status_code == 401
-
-    def test_bearer_token_returns_401(self, client: TestClient):
-        """Bearer auth scheme should return 401."""
-        response = client.get("/api/test", headers={"Authorization": "Bearer token"})
-        assert response.status_code == 401
-
-    def test_empty_credentials_returns_401(self, client: TestClient):
-        """Empty username/password should return 401."""
-        headers = make_basic_auth_header("", "")
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Authorization": "Basic !!invalid!!"},
+            {"Authorization": "Bearer token"},
+            make_basic_auth_header("", ""),
+        ],
+        ids=["malformed-header", "bearer-token", "empty-credentials"],
+    )
+    def test_unusable_credentials_return_401(self, client: TestClient, headers: dict):
+        """Malformed headers, other schemes and empty credentials should return 401."""
         response = client.get("/api/test", headers=headers)
         assert response.status_code == 401
 
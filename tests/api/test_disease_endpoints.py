@@ -2,6 +2,8 @@
 
 from fastapi.testclient import TestClient
 
+from app.models import SummaryStatsResponse
+
 
 class TestDiseaseListEndpoint:
     """Tests for /api/data/diseases endpoint."""
@@ -124,3 +126,14 @@ class TestSummaryStatsEndpoint:
         assert data["total_cases"] > 0
         assert data["earliest_date"] is not None
         assert data["latest_date"] is not None
+
+    def test_stats_unknown_source_matches_schema(self, client: TestClient):
+        """Test an unknown data_source gets zero counts that fit SummaryStatsResponse."""
+        response = client.get("/api/data/stats?data_source=bogus")
+        assert response.status_code == 200
+
+        data = response.json()
+        SummaryStatsResponse.model_validate(data)
+        assert data["total_records"] == 0
+        assert data["total_cases"] == 0
+        assert data["disease_totals"] == []
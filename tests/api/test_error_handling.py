@@ -1,5 +1,8 @@
 """Tests for API error handling."""
 
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -39,7 +42,7 @@ class TestNotFoundErrors:
 class TestContentTypeErrors:
     """Tests for content type validation."""
 
-    def test_json_endpoints_return_json(self, client: TestClient):
+    async def test_json_endpoints_return_json(self, async_client: httpx.AsyncClient):
         """Test JSON endpoints return application/json."""
         endpoints = [
             "/health",
@@ -48,7 +51,8 @@ class TestContentTypeErrors:
             "/api/data/stats",
         ]
 
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.status_code == 200
-            assert "application/json" in response.headers.get("content-type", "")
+        # Issued concurrently through the ASGI app
+        responses = await asyncio.gather(*(async_client.get(e) for e in endpoints))
+        for endpoint, response in zip(endpoints, responses, strict=True):
+            assert response.status_code == 200, endpoint
+            assert "application/json" in response.headers.get("content-type", ""), endpoint
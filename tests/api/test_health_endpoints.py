@@ -1,57 +1,85 @@
 """Tests for health check endpoints."""
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+# A response shared across tests, decoded once
+ResponseAndBody = tuple[httpx.Response, dict]
+
+
+@pytest.fixture(scope="module")
+def public_health(client: TestClient) -> ResponseAndBody:
+    """The /health response and its decoded body."""
+    response = client.get("/health")
+    return response, response.json()
+
+
+@pytest.fixture(scope="module")
+def api_health(client: TestClient) -> ResponseAndBody:
+    """The /api/data/health response and its decoded body."""
+    response = client.get("/api/data/health")
+    return response, response.json()
+
 
 class TestPublicHealthEndpoint:
     """Tests for the public /health endpoint."""
 
-    def test_health_returns_200(self, client: TestClient):
+    def test_health_returns_200(self, public_health: ResponseAndBody):
         """Test public health endpoint returns 200."""
-        response = client.get("/health")
+        response, _ = public_health
         assert response.status_code == 200
 
-    def test_health_returns_json(self, client: TestClient):
+    def test_health_returns_json(self, public_health: ResponseAndBody):
         """Test health endpoint returns JSON content type."""
-        response = client.get("/health")
+        response, _ = public_health
         assert "application/json" in response.headers.get("content-type", "")
 
-    def test_health_contains_status(self, client: TestClient):
+    def test_health_contains_status(self, public_health: ResponseAndBody):
         """Test health response contains status field."""
-        response = client.get("/health")
-        data = response.json()
+        _, data = public_health
         assert "status" in data
         assert data["status"] == "ok"
 
-    def test_health_contains_app_name(self, client: TestClient):
+    def test_health_contains_app_name(self, public_health: ResponseAndBody):
         """Test health response contains app name."""
-        response = client.get("/health")
-        data = response.json()
+        _, data = public_health
         assert "app" in data
 
 
 class TestAPIHealthEndpoint:
     """Tests for the /api/data/health endpoint."""
 
-    def test_api_health_returns_200(self, client: TestClient):
+    def test_api_health_returns_200(self, api_health: ResponseAndBody):
         """Test /api/data/health returns 200."""
-        response = client.get("/api/data/health")
+        response, _ = api_health
         assert response.status_code == 200
 
-    def test_api_health_returns_json(self, client: TestClient):
+    def test_api_health_returns_json(self, api_health: ResponseAndBody):
         """Test /api/data/health returns JSON."""
-        response = client.get("/api/data/health")
+        response, _ = api_health
         assert "application/json" in response.headers.get("content-type", "")
 
-    def test_api_health_contains_status(self, client: TestClient):
+    def test_api_health_contains_status(self, api_health: ResponseAndBody):
         """Test response contains status field."""
-        response = client.get("/api/data/health")
-        data = response.json()
+        _, data = api_health
         assert data["status"] == "healthy"
 
-    def test_api_health_contains_database_status(self, client: TestClient):
+    def test_api_health_contains_database_status(self, api_health: ResponseAndBody):
         """Test response contains database_initialized field."""
-        response = client.get("/api/data/health")
-        data = response.json()
+        _, data = api_health
         assert "database_initialized" in data
         assert isinstance(data["database_initialized"], bool)
+
+
+class TestPoolHealthEndpoint:
+    """Tests for the /api/data/pool-health endpoint."""
+
+    async def test_pool_health_reports_idle_pool(self, async_client: httpx.AsyncClient):
+        """Test pool stats are reported and all connections are idle between requests."""
+        response = await async_client.get("/api/data/pool-health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pool_size"] > 0
+        assert data["available"] == data["pool_size"]
+        assert data["in_use"] == 0
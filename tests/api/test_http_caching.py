@@ -0,0 +1,135 @@
+"""Tests for ETag/304 HTTP caching on read-only data and fragment endpoints."""
+
+from fastapi.testclient import TestClient
+
+from app.middleware import ETagMiddleware, etag_matches
+
+
+class TestETagHeaders:
+    """Tests for ETag and Cache-Control headers."""
+
+    def test_diseases_has_etag(self, client: TestClient):
+        """Test /api/data/diseases returns ETag and Cache-Control headers."""
+        response = client.get("/api/data/diseases")
+        assert response.status_code == 200
+        assert response.headers.get("etag")
+        assert response.headers.get("cache-control") == "public, max-age=300"
+
+    def test_etag_is_weak(self, client: TestClient):
+        """Test the ETag is weak, since gzip and identity bodies share it."""
+        response = client.get("/api/data/diseases", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["etag"].startswith('W/"')
+        identity = client.get("/api/data/diseases", headers={"Accept-Encoding": "identity"})
+        assert identity.headers["etag"] == response.headers["etag"]
+
+    def test_private_when_staging_auth_enabled(self, monkeypatch):
+        """Test shared caches may not store data responses behind staging auth."""
+        monkeypatch.setattr("app.middleware.etag.settings.staging_auth_enabled", True)
+        middleware = ETagMiddleware(None, get_version=lambda: None, path_prefixes=("/api/",))
+        assert middleware.cache_control == "private, max-age=300"
+
+    def test_etag_varies_by_query(self, client: TestClient):
+        """Test different query strings produce different ETags."""
+        all_sources = client.get("/api/data/stats")
+        nndss_only = client.get("/api/data/stats?data_source=nndss")
+        assert all_sources.headers["etag"] != nndss_only.headers["etag"]
+
+    def test_matching_etag_returns_304(self, client: TestClient):
+        """Test If-None-Match with the current ETag returns 304 without a body."""
+        etag = client.get("/api/data/stats").headers["etag"]
+        response = client.get("/api/data/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_200(self, client: TestClient):
+        """Test If-None-Match with an outdated ETag returns the full response."""
+        response = client.get("/api/data/diseases", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["count"] > 0
+
+    def test_uncached_path_has_no_etag(self, client: TestClient):
+        """Test endpoints outside the cached prefixes don't get an ETag."""
+        response = client.get("/api/data/health")
+        assert "etag" not in response.headers
+
+    def test_wildcard_if_none_match_still_returns_404(self, client: TestClient):
+        """Test If-None-Match: * can't turn a missing disease into a 304."""
+        response = client.get(
+            "/api/data/timeseries/national/nonexistent-disease", headers={"If-None-Match": "*"}
+        )
+        assert response.status_code == 404
+
+    def test_not_found_has_no_etag(self, client: TestClient):
+        """Test error responses are not marked cacheable."""
+        response = client.get("/api/data/timeseries/national/nonexistent-disease")
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+
+class TestFragmentETag:
+    """Tests for ETag revalidation of HTMX fragments."""
+
+    def test_fragment_has_private_cache_control(self, client: TestClient):
+        """Test fragments get an ETag and a short private Cache-Control."""
+        response = client.get("/api/html/diseases")
+        assert response.status_code == 200
+        assert response.headers.get("etag")
+        assert (
+            response.headers["cache-control"] == "private, max-age=60, stale-while-revalidate=300"
+        )
+
+    def test_fragment_matching_etag_returns_304(self, client: TestClient):
+        """Test a revalidated fragment returns 304 without a body."""
+        etag = client.get("/api/html/diseases").headers["etag"]
+        response = client.get("/api/html/diseases", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+
+class TestDataResponseCache:
+    """Tests for in-memory caching of read-only JSON data responses."""
+
+    def test_repeated_request_served_from_cache(self, client: TestClient, monkeypatch):
+        """Test an identical data request is answered without rerunning the route."""
+        first = client.get("/api/data/timeseries/national/measles?granularity=week")
+        assert first.status_code == 200
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("database queried on cache hit")
+
+        monkeypatch.setattr("app.routers.api.run_db_query", fail)
+        second = client.get("/api/data/timeseries/national/measles?granularity=week")
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_cache_hit_still_revalidates(self, client: TestClient):
+        """Test a cached data response still answers If-None-Match with 304."""
+        etag = client.get("/api/data/diseases").headers["etag"]
+        client.get("/api/data/diseases")
+        response = client.get("/api/data/diseases", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestETagMatching:
+    """Tests for If-None-Match parsing."""
+
+    def test_matches_weak_and_listed_tags(self):
+        """Test weak validators and comma-separated lists are matched."""
+        assert etag_matches('W/"abc", "def"', '"abc"')
+        assert etag_matches('"xyz", "def"', '"def"')
+
+    def test_wildcard_does_not_match(self):
+        """Test a bare * is not treated as a match before the route runs."""
+        assert not etag_matches("*", 'W/"abc"')
+
+    def test_weak_etag_matches_either_form(self):
+        """Test a weak ETag matches with or without the W/ prefix."""
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('"abc"', 'W/"abc"')
+        assert not etag_matches('W/"abc"', 'W/"def"')
+
+    def test_missing_header_does_not_match(self):
+        """Test an absent header never matches."""
+        assert not etag_matches(None, '"abc"')
@@ -0,0 +1,130 @@
+"""Tests for the Mosaic SQL query endpoint and its validation."""
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.routers.sql_api import QueryRequest, parse_select, validate_tables_in_query
+
+
+class TestQueryValidation:
+    """Tests for SQL validation helpers."""
+
+    def test_select_is_allowed(self):
+        """Test a plain SELECT passes validation."""
+        request = QueryRequest(sql="SELECT state, SUM(count) FROM disease_data GROUP BY state")
+        assert request.sql.startswith("SELECT")
+
+    def test_non_select_rejected(self):
+        """Test statements that don't start with SELECT are rejected."""
+        with pytest.raises(ValidationError, match="Only single SELECT"):
+            QueryRequest(sql="DELETE FROM disease_data")
+
+    def test_oversized_sql_rejected(self):
+        """Test queries longer than the limit are rejected before parsing."""
+        with pytest.raises(ValidationError, match="exceeds"):
+            QueryRequest(sql="SELECT " + "1, " * 10000 + "1")
+
+    def test_blank_sql_rejected(self):
+        """Test whitespace-only SQL is rejected."""
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            QueryRequest(sql="   ")
+
+    def test_non_select_prefix_rejected_before_parsing(self):
+        """Test queries not opening with SELECT/WITH never reach the parser."""
+        parse_select.cache_clear()
+        with pytest.raises(ValidationError, match="Only single SELECT"):
+            QueryRequest(sql="  pragma database_list")
+        assert parse_select.cache_info().misses == 0
+
+    def test_multiple_statements_rejected(self):
+        """Test a mutation smuggled in after a SELECT is rejected."""
+        with pytest.raises(ValidationError, match="Only single SELECT"):
+            QueryRequest(sql="SELECT 1; drop table disease_data")
+
+    def test_unparseable_sql_rejected(self):
+        """Test SQL that DuckDB can't parse is rejected."""
+        with pytest.raises(ValidationError, match="Invalid SQL"):
+            QueryRequest(sql="SELECT FROM WHERE")
+
+    def test_keywords_in_literals_and_identifiers_allowed(self):
+        """Test mutation keywords inside strings or column names don't trip validation."""
+        QueryRequest(sql="SELECT updated_at FROM disease_data WHERE disease_name = 'drop'")
+
+    def test_cte_names_are_not_tables(self):
+        """Test CTE aliases aren't reported as disallowed tables."""
+        sql = "WITH totals AS (SELECT state FROM disease_data) SELECT * FROM totals"
+        QueryRequest(sql=sql)
+        validate_tables_in_query(sql)
+
+    def test_table_functions_rejected(self):
+        """Test table functions that read files are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_tables_in_query("SELECT * FROM read_csv('/etc/passwd')")
+        assert "read_csv" in exc_info.value.detail
+
+    def test_disallowed_table_rejected(self):
+        """Test FROM/JOIN references outside the allowed tables are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_tables_in_query(
+                "SELECT * FROM disease_data d JOIN secrets s ON d.state = s.state"
+            )
+        assert exc_info.value.status_code == 400
+        assert "secrets" in exc_info.value.detail
+
+    def test_allowed_tables_pass(self):
+        """Test queries against allowed tables pass table validation."""
+        validate_tables_in_query("select * from disease_data join disease_mapping using (x)")
+
+
+class TestQueryEndpoint:
+    """Tests for POST /api/query."""
+
+    def test_returns_rows(self, client: TestClient):
+        """Test a valid query returns rows, columns and row count."""
+        response = client.post(
+            "/api/query",
+            json={"sql": "SELECT COUNT(*) AS n FROM disease_data"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["columns"] == ["n"]
+        assert data["row_count"] == 1
+        assert data["data"][0]["n"] > 0
+
+    def test_invalid_sql_returns_422(self, client: TestClient):
+        """Test validation failures are rejected before execution."""
+        response = client.post("/api/query", json={"sql": "UPDATE disease_data SET count = 0"})
+        assert response.status_code == 422
+
+    def test_disallowed_table_returns_400(self, client: TestClient):
+        """Test queries against tables outside the allow-list return 400."""
+        response = client.post("/api/query", json={"sql": "SELECT * FROM duckdb_settings()"})
+        assert response.status_code == 400
+
+    def test_repeated_query_served_from_cache(self, client: TestClient, etl_test_db, monkeypatch):
+        """Test an identical query is executed once and then served from the result cache."""
+        calls = []
+        execute_sql = etl_test_db.execute_sql
+
+        def counting_execute_sql(sql):
+            calls.append(sql)
+            return execute_sql(sql)
+
+        monkeypatch.setattr(etl_test_db, "execute_sql", counting_execute_sql)
+        body = {"sql": "SELECT COUNT(DISTINCT state) AS cached_states FROM disease_data"}
+
+        first = client.post("/api/query", json=body)
+        second = client.post("/api/query", json=body)
+
+        assert first.json() == second.json()
+        assert len(calls) == 1
+
+    def test_decimal_values_encoded(self, client: TestClient):
+        """Test DECIMAL results are encoded as strings, as before."""
+        response = client.post(
+            "/api/query", json={"sql": "SELECT 1.5 AS ratio FROM disease_data LIMIT 1"}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == [{"ratio": "1.5"}]
@@ -1,39 +1,55 @@
 """Tests for time series API endpoints."""
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+# A response shared across tests, decoded once
+ResponseAndBody = tuple[httpx.Response, dict]
+
+
+@pytest.fixture(scope="module")
+def national_measles(client: TestClient) -> ResponseAndBody:
+    """Default national measles timeseries response and its decoded body."""
+    response = client.get("/api/data/timeseries/national/measles")
+    return response, response.json()
+
+
+@pytest.fixture(scope="module")
+def state_measles(client: TestClient) -> ResponseAndBody:
+    """Default state measles timeseries response and its decoded body."""
+    response = client.get("/api/data/timeseries/states/measles")
+    return response, response.json()
+
 
 class TestNationalTimeseriesEndpoint:
     """Tests for /api/data/timeseries/national/{slug} endpoint."""
 
-    def test_timeseries_valid_disease(self, client: TestClient):
+    def test_timeseries_valid_disease(self, national_measles: ResponseAndBody):
         """Test timeseries for a valid disease."""
-        response = client.get("/api/data/timeseries/national/measles")
+        response, _ = national_measles
         assert response.status_code == 200
 
-    def test_timeseries_returns_json(self, client: TestClient):
+    def test_timeseries_returns_json(self, national_measles: ResponseAndBody):
         """Test endpoint returns JSON."""
-        response = client.get("/api/data/timeseries/national/measles")
+        response, _ = national_measles
         assert "application/json" in response.headers.get("content-type", "")
 
-    def test_timeseries_default_granularity(self, client: TestClient):
+    def test_timeseries_default_granularity(self, national_measles: ResponseAndBody):
         """Test default granularity is 'month'."""
-        response = client.get("/api/data/timeseries/national/measles")
-        data = response.json()
+        _, data = national_measles
         assert data.get("granularity") == "month"
 
-    def test_timeseries_week_granularity(self, client: TestClient):
+    async def test_timeseries_week_granularity(self, async_client: httpx.AsyncClient):
         """Test week granularity parameter."""
-        response = client.get("/api/data/timeseries/national/measles?granularity=week")
+        response = await async_client.get("/api/data/timeseries/national/measles?granularity=week")
         assert response.status_code == 200
         data = response.json()
         assert data.get("granularity") == "week"
 
-    def test_timeseries_response_structure(self, client: TestClient):
+    def test_timeseries_response_structure(self, national_measles: ResponseAndBody):
         """Test response has expected structure."""
-        response = client.get("/api/data/timeseries/national/measles")
-        data = response.json()
+        _, data = national_measles
 
         assert "disease_name" in data
         assert "disease_slug" in data
@@ -41,58 +57,57 @@ class TestNationalTimeseriesEndpoint:
         assert "data" in data
         assert isinstance(data["data"], list)
 
-    def test_timeseries_data_point_structure(self, client: TestClient):
+    def test_timeseries_data_point_structure(self, national_measles: ResponseAndBody):
         """Test data points have expected structure."""
-        response = client.get("/api/data/timeseries/national/measles")
-        data = response.json()
+        _, data = national_measles
 
         if data["data"]:
             point = data["data"][0]
             assert "period" in point
             assert "total_cases" in point
 
-    def test_timeseries_invalid_disease_returns_404(self, client: TestClient):
+    async def test_timeseries_invalid_disease_returns_404(self, async_client: httpx.AsyncClient):
         """Test 404 for nonexistent disease."""
-        response = client.get("/api/data/timeseries/national/nonexistent-disease")
+        response = await async_client.get("/api/data/timeseries/national/nonexistent-disease")
         assert response.status_code == 404
 
 
 class TestStateTimeseriesEndpoint:
     """Tests for /api/data/timeseries/states/{slug} endpoint."""
 
-    def test_state_timeseries_valid_disease(self, client: TestClient):
+    def test_state_timeseries_valid_disease(self, state_measles: ResponseAndBody):
         """Test state timeseries for a valid disease."""
-        response = client.get("/api/data/timeseries/states/measles")
+        response, _ = state_measles
         assert response.status_code == 200
 
-    def test_state_timeseries_response_structure(self, client: TestClient):
+    def test_state_timeseries_response_structure(self, state_measles: ResponseAndBody):
         """Test response has states dictionary."""
-        response = client.get("/api/data/timeseries/states/measles")
-        data = response.json()
+        _, data = state_measles
 
         assert "states" in data
         assert "national" in data
         assert isinstance(data["states"], dict)
         assert isinstance(data["national"], list)
 
-    def test_state_timeseries_has_available_states(self, client: TestClient):
+    def test_state_timeseries_has_available_states(self, state_measles: ResponseAndBody):
         """Test response lists available states."""
-        response = client.get("/api/data/timeseries/states/measles")
-        data = response.json()
+        _, data = state_measles
 
         assert "available_states" in data
         assert isinstance(data["available_states"], list)
 
-    def test_state_timeseries_week_granularity(self, client: TestClient):
+    async def test_state_timeseries_week_granularity(self, async_client: httpx.AsyncClient):
         """Test week granularity for state timeseries."""
-        response = client.get("/api/data/timeseries/states/measles?granularity=week")
+        response = await async_client.get("/api/data/timeseries/states/measles?granularity=week")
         assert response.status_code == 200
         data = response.json()
         assert data.get("granularity") == "week"
 
-    def test_state_timeseries_invalid_disease_returns_404(self, client: TestClient):
+    async def test_state_timeseries_invalid_disease_returns_404(
+        self, async_client: httpx.AsyncClient
+    ):
         """Test 404 for nonexistent disease."""
-        response = client.get("/api/data/timeseries/states/nonexistent-disease")
+        response = await async_client.get("/api/data/timeseries/states/nonexistent-disease")
         assert response.status_code == 404
 
 
@@ -100,9 +115,22 @@ class TestTimeseriesQueryParameters:
     """Tests for time series query parameters."""
 
     @pytest.mark.parametrize("granularity", ["month", "week"])
-    def test_valid_granularities(self, client: TestClient, granularity: str):
+    async def test_valid_granularities(self, async_client: httpx.AsyncClient, granularity: str):
         """Test valid granularity values."""
-        response = client.get(f"/api/data/timeseries/national/measles?granularity={granularity}")
+        response = await async_client.get(
+            f"/api/data/timeseries/national/measles?granularity={granularity}"
+        )
         assert response.status_code == 200
         data = response.json()
         assert data["granularity"] == granularity
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        ["/api/data/timeseries/national/measles", "/api/data/timeseries/states/measles"],
+    )
+    async def test_invalid_granularity_rejected(
+        self, async_client: httpx.AsyncClient, endpoint: str
+    ):
+        """Test unsupported granularity values get a 422 instead of a silent fallback."""
+        response = await async_client.get(f"{endpoint}?granularity=year")
+        assert response.status_code == 422
@@ -15,22 +15,40 @@ IMPORTANT RAMIFICATIONS:
    function-scoped `test_db` fixture instead (which creates a fresh DB per test).
 
 3. The session-scoped DB is loaded from real CSV fixtures in tests/fixtures/.
-   The function-scoped `test_db` uses temporary directories with sample data.
+   The function-scoped `test_db` is a private copy of a DuckDB file built
+   once per session from temporary sample CSVs (`golden_db_path`).
+
+4. Tests run in parallel under pytest-xdist (`-n auto --dist=loadgroup`).
+   Each worker is its own process with its own session and its own
+   `:memory:` database. Tests that use `etl_test_db` (directly or through
+   `client`/`async_client`) are put in one xdist group, and tests that use
+   `golden_db_path` in another, so each database is built on one worker
+   only; pure unit tests fan out across all workers. Pass `-n 0` to run
+   serially, e.g. when debugging with `--pdb`.
 
 Fixture Selection Guide:
 ------------------------
-- `client` / `etl_test_db`: Fast, read-only API/query tests (recommended)
+- `client` / `etl_test_db`: Fast, read-only API/query tests (recommended).
+  Both are session-scoped, so module- or class-scoped fixtures can use them.
+- `async_client`: Read-only like `client`, for `async def` tests.
+- `cached_get`: Plain GETs through `client`, each URL fetched once per session.
 - `isolated_client` / `test_db`: Slower, for tests that need isolated DB state
 """
 
-from collections.abc import Generator
+import shutil
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import Path
 
+import httpx
+import pandas as pd
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.config import Settings
 from app.database import DiseaseDatabase
+from app.etl.transformers.nndss import NNDSSTransformer
+from app.etl.transformers.tracker import TrackerTransformer
 
 # =============================================================================
 # Session-Scoped Paths (computed once)
@@ -59,6 +77,24 @@ def nndss_fixtures_dir() -> Path:
     return NNDSS_FIXTURES_DIR
 
 
+@pytest.fixture(scope="session")
+def tracker_loaded_df(fixtures_dir: Path) -> pd.DataFrame:
+    """Tracker fixtures run through the transformer once per session.
+
+    Shared by reference, so tests must not modify it.
+    """
+    return TrackerTransformer(fixtures_dir).load()
+
+
+@pytest.fixture(scope="session")
+def nndss_loaded_df(nndss_fixtures_dir: Path) -> pd.DataFrame:
+    """NNDSS fixtures run through the transformer once per session.
+
+    Shared by reference, so tests must not modify it.
+    """
+    return NNDSSTransformer(nndss_fixtures_dir).load()
+
+
 # =============================================================================
 # Session-Scoped ETL Database (loaded once per test run)
 # =============================================================================
@@ -84,56 +120,133 @@ def etl_test_db(etl_test_settings: Settings) -> Generator[DiseaseDatabase, None,
 
     Loaded ONCE per test session for maximum performance.
     """
-    # Temporarily patch settings for loading
-    import app.config
-    import app.database
-
-    original_config_settings = app.config.settings
-    original_db_settings = app.database.settings
-
-    app.config.settings = etl_test_settings
-    app.database.settings = etl_test_settings
-
-    db = DiseaseDatabase()
+    db = DiseaseDatabase(settings=etl_test_settings)
     try:
         db.connect()
         db.load_all_sources()
+        # Run each kind of query once so lazy DuckDB setup lands here, not in
+        # whichever test happens to run first
+        disease_name = db.get_disease_name_by_slug("measles")
+        db.get_national_disease_timeseries(disease_name, "month")
+        db.get_disease_stats(disease_name)
+        db.get_disease_timeseries_by_state(disease_name, "month")
         yield db
     finally:
         db.close()
-        # Restore original settings
-        app.config.settings = original_config_settings
-        app.database.settings = original_db_settings
+
+
+# xdist groups keyed by the session database fixture their tests depend on
+_XDIST_GROUPS = {"etl_test_db": "etl_db", "golden_db_path": "golden_db"}
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Pin tests that share a session database to one xdist worker."""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        for fixture, group in _XDIST_GROUPS.items():
+            if fixture in item.fixturenames:
+                item.add_marker(pytest.mark.xdist_group(group))
+                break
 
 
 # =============================================================================
 # Test Clients
 # =============================================================================
 
+# Module attributes holding the settings and database instances the app uses
+_SETTINGS_ATTRS = (
+    "app.config.settings",
+    "app.main.settings",
+)
+_DB_ATTRS = (
+    "app.database.db",
+    "app.main.db",
+    "app.routers.api.db",
+    "app.routers.pages.db",
+    "app.routers.html_api.db",
+    "app.routers.sql_api.db",
+    "app.dependencies.db",
+)
+
+
+def _patch_app(mp: pytest.MonkeyPatch, settings: Settings, db: DiseaseDatabase) -> None:
+    """Point every module the app reads settings and db from at the given instances."""
+    for path in _SETTINGS_ATTRS:
+        mp.setattr(path, settings)
+    for path in _DB_ATTRS:
+        mp.setattr(path, db)
 
-@pytest.fixture
-def client(etl_test_settings: Settings, etl_test_db: DiseaseDatabase, monkeypatch) -> TestClient:
+
+@pytest.fixture(scope="session")
+def fastapi_app() -> FastAPI:
+    """The application instance, imported once and shared by every test client."""
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def etl_app(
+    fastapi_app: FastAPI, etl_test_settings: Settings, etl_test_db: DiseaseDatabase
+) -> Generator[FastAPI, None, None]:
+    """
+    The application wired to the ETL-loaded database for the whole session.
+
+    The built-in monkeypatch fixture is function-scoped, so the patches are
+    held in a session-long MonkeyPatch context instead.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_app(mp, etl_test_settings, etl_test_db)
+        yield fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(etl_app: FastAPI) -> Generator[TestClient, None, None]:
     """
     Primary test client with ETL-loaded database.
 
-    Uses session-scoped database for fast tests. READ-ONLY.
+    Created ONCE per test session and shared, like the database behind it. READ-ONLY.
     """
-    from app.main import app
+    test_client = TestClient(etl_app, raise_server_exceptions=False)
+    # Starlette builds the middleware stack on the first request; do it up front
+    test_client.get("/health")
+    try:
+        yield test_client
+    finally:
+        test_client.close()
+
 
-    # Mock settings and database
-    monkeypatch.setattr("app.config.settings", etl_test_settings)
-    monkeypatch.setattr("app.main.settings", etl_test_settings)
-    monkeypatch.setattr("app.database.settings", etl_test_settings)
+@pytest.fixture(scope="session")
+def cached_get(client: TestClient) -> Callable[[str], httpx.Response]:
+    """
+    GET through the shared client, fetching each URL once per session.
+
+    For tests that only inspect a plain GET's status, headers or body; the
+    returned Response is shared, so don't use it for tests that send
+    headers or check caching behaviour.
+    """
+    responses: dict[str, httpx.Response] = {}
+
+    def get(url: str) -> httpx.Response:
+        if url not in responses:
+            responses[url] = client.get(url)
+        return responses[url]
 
-    # Replace the global db instance with our etl_test_db
-    monkeypatch.setattr("app.database.db", etl_test_db)
-    monkeypatch.setattr("app.main.db", etl_test_db)
-    monkeypatch.setattr("app.routers.api.db", etl_test_db)
-    monkeypatch.setattr("app.routers.pages.db", etl_test_db)
-    monkeypatch.setattr("app.routers.html_api.db", etl_test_db)
-    monkeypatch.setattr("app.dependencies.db", etl_test_db)
+    return get
+
+
+@pytest.fixture
+async def async_client(etl_app: FastAPI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Async test client with ETL-loaded database. READ-ONLY.
 
-    return TestClient(app, raise_server_exceptions=False)
+    Calls the app in the test's own event loop through httpx's ASGI
+    transport, without TestClient's thread portal. Use from async tests.
+    """
+    transport = httpx.ASGITransport(app=etl_app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
 
 
 # =============================================================================
@@ -141,7 +254,7 @@ def client(etl_test_settings: Settings, etl_test_db: DiseaseDatabase, monkeypatc
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_data() -> str:
     """Sample CSV data for testing"""
     return """report_period_start,report_period_end,date_type,time_unit,disease_name,disease_subtype,state,reporting_jurisdiction,geo_name,geo_unit,age_group,confirmation_status,outcome,count
@@ -153,10 +266,15 @@ def sample_csv_data() -> str:
 """
 
 
-@pytest.fixture
-def test_data_dir(sample_csv_data: str, tmp_path: Path) -> Path:
-    """Create temporary data directory with sample CSV files"""
-    data_dir = tmp_path / "us_disease_tracker_data" / "data" / "states"
+@pytest.fixture(scope="session")
+def test_data_dir(sample_csv_data: str, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create temporary data directory with sample CSV files.
+
+    Written once per session; tests only read it, so it isn't copied per test.
+    """
+    root = tmp_path_factory.mktemp("us_disease_tracker_data")
+    data_dir = root / "data" / "states"
 
     states = ["ID", "CA", "NY"]
     for state in states:
@@ -165,7 +283,7 @@ def test_data_dir(sample_csv_data: str, tmp_path: Path) -> Path:
         csv_file = state_dir / f"20251107-test_{state}.csv"
         csv_file.write_text(sample_csv_data)
 
-    return tmp_path / "us_disease_tracker_data"
+    return root
 
 
 @pytest.fixture
@@ -180,13 +298,48 @@ def test_settings(test_data_dir: Path) -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def golden_db_path(
+    test_data_dir: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Generator[Path, None, None]:
+    """
+    DuckDB file holding the sample data after a full ETL load.
+
+    The ETL pipeline runs ONCE per session; `test_db` copies this file
+    instead of re-parsing the CSVs for every test.
+    """
+    path = tmp_path_factory.mktemp("golden_db") / "golden.duckdb"
+    golden_settings = Settings(
+        app_name="Disease Dashboard Test",
+        data_directory=test_data_dir,
+        database_path=str(path),
+    )
+    db = DiseaseDatabase(settings=golden_settings)
+    try:
+        db.connect()
+        db.load_all_sources()
+    finally:
+        db.close()
+    yield path
+
+
 @pytest.fixture
-def test_db(test_settings: Settings, monkeypatch) -> Generator[DiseaseDatabase, None, None]:
-    """Test database with sample data loaded via ETL pipeline."""
-    monkeypatch.setattr("app.config.settings", test_settings)
-    monkeypatch.setattr("app.database.settings", test_settings)
+def test_db(
+    test_settings: Settings, golden_db_path: Path, tmp_path: Path, monkeypatch
+) -> Generator[DiseaseDatabase, None, None]:
+    """
+    Test database with sample data, private to the test.
 
-    db = DiseaseDatabase()
+    Opens a fresh copy of the session's golden database file, so tests may
+    mutate it freely without rerunning the ETL pipeline.
+    """
+    db_file = tmp_path / "test.duckdb"
+    shutil.copyfile(golden_db_path, db_file)
+    db_settings = test_settings.model_copy(update={"database_path": str(db_file)})
+    # Reuse the copied tables instead of reloading (the dev fast-restart path)
+    monkeypatch.setenv("APP_ENV", "development")
+
+    db = DiseaseDatabase(settings=db_settings)
     try:
         db.connect()
         db.load_all_sources()
@@ -196,21 +349,12 @@ def test_db(test_settings: Settings, monkeypatch) -> Generator[DiseaseDatabase,
 
 
 @pytest.fixture
-def isolated_client(test_settings, test_db, monkeypatch) -> TestClient:
+def isolated_client(fastapi_app: FastAPI, test_settings, test_db, monkeypatch) -> TestClient:
     """
     Test client with isolated (function-scoped) database.
 
     Use this for tests that need to modify database state.
     """
-    from app.main import app
-
-    monkeypatch.setattr("app.config.settings", test_settings)
-    monkeypatch.setattr("app.main.settings", test_settings)
-    monkeypatch.setattr("app.database.settings", test_settings)
-    monkeypatch.setattr("app.database.db", test_db)
-    monkeypatch.setattr("app.main.db", test_db)
-    monkeypatch.setattr("app.routers.api.db", test_db)
-    monkeypatch.setattr("app.routers.pages.db", test_db)
-    monkeypatch.setattr("app.dependencies.db", test_db)
+    _patch_app(monkeypatch, test_settings, test_db)
 
-    return TestClient(app, raise_server_exceptions=False)
+    return TestClient(fastapi_app, raise_server_exceptions=False)
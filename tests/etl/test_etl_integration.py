@@ -1,8 +1,31 @@
 """ETL integration tests: CSV -> Transformer -> DuckDB -> Query."""
 
+import pytest
+
 from app.database import DiseaseDatabase
 
 
+@pytest.fixture(scope="module")
+def source_counts(etl_test_db: DiseaseDatabase) -> dict[str, int]:
+    """Record count per data source, from a single scan of disease_data."""
+    rows = etl_test_db.conn.execute(
+        "SELECT data_source, COUNT(*) FROM disease_data GROUP BY ALL"
+    ).fetchall()
+    return dict(rows)
+
+
+@pytest.fixture(scope="module")
+def all_diseases(etl_test_db: DiseaseDatabase) -> list[str]:
+    """Disease names across all sources, fetched once for this module."""
+    return etl_test_db.get_diseases()
+
+
+@pytest.fixture(scope="module")
+def diseases_with_slugs(etl_test_db: DiseaseDatabase) -> list[dict]:
+    """Disease name/slug entries across all sources, fetched once for this module."""
+    return etl_test_db.get_diseases_with_slugs()
+
+
 class TestETLToDuckDBIntegration:
     """End-to-end tests: CSV fixtures -> ETL transformers -> DuckDB -> Query."""
 
@@ -15,7 +38,7 @@ class TestETLToDuckDBIntegration:
         diseases = etl_test_db.get_diseases(data_source="tracker")
         assert len(diseases) > 0
         # Check for expected diseases from fixtures
-        disease_names_lower = [d.lower() for d in diseases]
+        disease_names_lower = {d.lower() for d in diseases}
         assert "measles" in disease_names_lower or any("measles" in d for d in disease_names_lower)
 
     def test_nndss_diseases_queryable(self, etl_test_db: DiseaseDatabase):
@@ -23,18 +46,19 @@ class TestETLToDuckDBIntegration:
         diseases = etl_test_db.get_diseases(data_source="nndss")
         assert len(diseases) > 0
 
-    def test_combined_diseases_from_both_sources(self, etl_test_db: DiseaseDatabase):
+    def test_combined_diseases_from_both_sources(
+        self, etl_test_db: DiseaseDatabase, all_diseases: list[str]
+    ):
         """Verify diseases from both sources are available."""
-        all_diseases = etl_test_db.get_diseases()
         tracker_diseases = etl_test_db.get_diseases(data_source="tracker")
         nndss_diseases = etl_test_db.get_diseases(data_source="nndss")
 
         # Combined should include diseases from both
         assert len(all_diseases) >= max(len(tracker_diseases), len(nndss_diseases))
 
-    def test_get_diseases_with_slugs(self, etl_test_db: DiseaseDatabase):
+    def test_get_diseases_with_slugs(self, diseases_with_slugs: list[dict]):
         """Verify disease slugs are available."""
-        diseases = etl_test_db.get_diseases_with_slugs()
+        diseases = diseases_with_slugs
         assert len(diseases) > 0
 
         # Each entry should have name and slug
@@ -43,10 +67,12 @@ class TestETLToDuckDBIntegration:
             assert "slug" in disease
             assert disease["slug"] is not None
 
-    def test_disease_slug_lookup_works(self, etl_test_db: DiseaseDatabase):
+    def test_disease_slug_lookup_works(
+        self, etl_test_db: DiseaseDatabase, diseases_with_slugs: list[dict]
+    ):
         """Verify slug -> name lookup after ETL."""
         # First get a valid slug
-        diseases = etl_test_db.get_diseases_with_slugs()
+        diseases = diseases_with_slugs
         assert len(diseases) > 0
 
         slug = diseases[0]["slug"]
@@ -62,7 +88,7 @@ class TestETLToDuckDBIntegration:
         states = etl_test_db.get_states()
         assert len(states) > 0
         # Check for expected states from fixtures
-        assert any(s in states for s in ["ID", "CA", "NY", "MA"])
+        assert set(states) & {"ID", "CA", "NY", "MA"}
 
     def test_summary_stats_include_counts(self, etl_test_db: DiseaseDatabase):
         """Verify summary statistics are computed."""
@@ -82,40 +108,31 @@ class TestETLToDuckDBIntegration:
         assert stats["earliest_date"] is not None
         assert stats["latest_date"] is not None
 
-    def test_national_timeseries_query(self, etl_test_db: DiseaseDatabase):
-        """Verify national time series query works."""
-        # Get a valid disease name
-        diseases = etl_test_db.get_diseases()
-        assert len(diseases) > 0
-
-        disease_name = diseases[0]
-        data = etl_test_db.get_national_disease_timeseries(disease_name, "month")
-
-        assert isinstance(data, list)
-        # May be empty if no matching data, but should not error
-
-    def test_state_timeseries_query(self, etl_test_db: DiseaseDatabase):
-        """Verify state-level time series query works."""
-        diseases = etl_test_db.get_diseases()
-        assert len(diseases) > 0
-
-        disease_name = diseases[0]
-        data = etl_test_db.get_disease_timeseries_by_state(disease_name, "month")
-
-        assert "states" in data
-        assert "national" in data
-        assert isinstance(data["states"], dict)
-
-    def test_disease_stats_query(self, etl_test_db: DiseaseDatabase):
-        """Verify disease stats query works."""
-        diseases = etl_test_db.get_diseases()
-        assert len(diseases) > 0
-
-        disease_name = diseases[0]
-        stats = etl_test_db.get_disease_stats(disease_name)
-
-        assert "total_cases" in stats
-        assert "affected_states" in stats
+    @pytest.mark.parametrize(
+        ("getter", "expected_type", "expected_fields"),
+        [
+            # May be empty if no matching data, but should not error
+            ("get_national_disease_timeseries", list, {}),
+            ("get_disease_timeseries_by_state", dict, {"states": dict, "national": list}),
+            ("get_disease_stats", dict, {"total_cases": int, "affected_states": int}),
+        ],
+    )
+    def test_disease_query(
+        self,
+        etl_test_db: DiseaseDatabase,
+        all_diseases: list[str],
+        getter: str,
+        expected_type: type,
+        expected_fields: dict[str, type],
+    ):
+        """Verify national/state time series and stats queries work for a loaded disease."""
+        assert len(all_diseases) > 0
+
+        data = getattr(etl_test_db, getter)(all_diseases[0])
+
+        assert isinstance(data, expected_type)
+        for field, field_type in expected_fields.items():
+            assert isinstance(data[field], field_type)
 
     def test_age_group_distribution_from_tracker(self, etl_test_db: DiseaseDatabase):
         """Verify age group distribution (from tracker data)."""
@@ -129,74 +146,67 @@ class TestETLToDuckDBIntegration:
             assert "age_groups" in data
             assert "states" in data
 
-    def test_raw_record_count(self, etl_test_db: DiseaseDatabase):
+    def test_raw_record_count(self, source_counts: dict[str, int]):
         """Verify raw record count in database."""
-        count = etl_test_db.conn.execute("SELECT COUNT(*) FROM disease_data").fetchone()[0]
-        assert count > 0
+        assert sum(source_counts.values()) > 0
 
-    def test_data_sources_in_database(self, etl_test_db: DiseaseDatabase):
+    def test_data_sources_in_database(self, source_counts: dict[str, int]):
         """Verify both data sources are present in database."""
-        sources = etl_test_db.conn.execute(
-            "SELECT DISTINCT data_source FROM disease_data ORDER BY data_source"
-        ).fetchall()
-        source_names = [s[0] for s in sources]
-
         # Both sources should be loaded
-        assert "tracker" in source_names
-        assert "nndss" in source_names
+        assert "tracker" in source_counts
+        assert "nndss" in source_counts
+
+
+# Fields every ETL output row must have
+REQUIRED_FIELDS = (
+    "disease_name",
+    "disease_slug",
+    "state",
+    "report_period_start",
+    "report_period_end",
+)
+
+
+@pytest.fixture(scope="module")
+def integrity_metrics(etl_test_db: DiseaseDatabase) -> dict[str, int]:
+    """Every integrity violation count, computed in a single scan of disease_data."""
+    null_counts = ", ".join(
+        f"COUNT(*) FILTER (WHERE {field} IS NULL) AS null_{field}" for field in REQUIRED_FIELDS
+    )
+    cursor = etl_test_db.conn.execute(f"""
+        SELECT
+            {null_counts},
+            COUNT(*) FILTER (WHERE report_period_end < report_period_start) AS bad_dates,
+            COUNT(*) FILTER (WHERE count < 0) AS negative_counts,
+            COUNT(*) FILTER (WHERE disease_slug != LOWER(disease_slug)) AS uppercase_slugs,
+            COUNT(*) FILTER (WHERE disease_slug LIKE '% %') AS slugs_with_spaces
+        FROM disease_data
+    """)
+    columns = [column[0] for column in cursor.description]
+    return dict(zip(columns, cursor.fetchone(), strict=True))
 
 
 class TestETLDataIntegrity:
     """Tests for data integrity after ETL processing."""
 
-    def test_no_null_required_fields(self, etl_test_db: DiseaseDatabase):
+    def test_no_null_required_fields(self, integrity_metrics: dict[str, int]):
         """Verify required fields are not null."""
-        required_fields = [
-            "disease_name",
-            "disease_slug",
-            "state",
-            "report_period_start",
-            "report_period_end",
-        ]
-
-        for field in required_fields:
-            null_count = etl_test_db.conn.execute(
-                f"SELECT COUNT(*) FROM disease_data WHERE {field} IS NULL"
-            ).fetchone()[0]
+        for field in REQUIRED_FIELDS:
+            null_count = integrity_metrics[f"null_{field}"]
             assert null_count == 0, f"Found {null_count} null values in {field}"
 
-    def test_date_ordering_valid(self, etl_test_db: DiseaseDatabase):
+    def test_date_ordering_valid(self, integrity_metrics: dict[str, int]):
         """Verify end dates are after start dates."""
-        invalid_count = etl_test_db.conn.execute("""
-            SELECT COUNT(*)
-            FROM disease_data
-            WHERE report_period_end < report_period_start
-        """).fetchone()[0]
-        assert invalid_count == 0, "Found records with end date before start date"
-
-    def test_counts_are_non_negative(self, etl_test_db: DiseaseDatabase):
+        assert integrity_metrics["bad_dates"] == 0, "Found records with end date before start date"
+
+    def test_counts_are_non_negative(self, integrity_metrics: dict[str, int]):
         """Verify case counts are non-negative."""
-        negative_count = etl_test_db.conn.execute("""
-            SELECT COUNT(*)
-            FROM disease_data
-            WHERE count < 0
-        """).fetchone()[0]
-        assert negative_count == 0, "Found records with negative counts"
-
-    def test_disease_slugs_are_lowercase(self, etl_test_db: DiseaseDatabase):
+        assert integrity_metrics["negative_counts"] == 0, "Found records with negative counts"
+
+    def test_disease_slugs_are_lowercase(self, integrity_metrics: dict[str, int]):
         """Verify disease slugs are lowercase."""
-        uppercase_count = etl_test_db.conn.execute("""
-            SELECT COUNT(*)
-            FROM disease_data
-            WHERE disease_slug != LOWER(disease_slug)
-        """).fetchone()[0]
-        assert uppercase_count == 0, "Found slugs with uppercase characters"
-
-    def test_disease_slugs_no_spaces(self, etl_test_db: DiseaseDatabase):
+        assert integrity_metrics["uppercase_slugs"] == 0, "Found slugs with uppercase characters"
+
+    def test_disease_slugs_no_spaces(self, integrity_metrics: dict[str, int]):
         """Verify disease slugs have no spaces."""
-        space_count = etl_test_db.conn.execute("""
-            SELECT COUNT(*)
-            FROM disease_data
-            WHERE disease_slug LIKE '% %'
-        """).fetchone()[0]
-        assert space_count == 0, "Found slugs with spaces"
+        assert integrity_metrics["slugs_with_spaces"] == 0, "Found slugs with spaces"
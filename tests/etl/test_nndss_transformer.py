@@ -1,50 +1,79 @@
 """Tests for NNDSS data transformation."""
 
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from app.etl.transformers.nndss import MMWRWeekConverter, NNDSSTransformer
 
 
+@pytest.fixture(scope="module")
+def mmwr() -> MMWRWeekConverter:
+    """A converter shared by the MMWR tests."""
+    return MMWRWeekConverter()
+
+
 class TestMMWRWeekConverter:
     """Tests for MMWR week date conversion."""
 
-    def test_mmwr_week_start_2024_week1(self):
+    def test_mmwr_week_start_2024_week1(self, mmwr: MMWRWeekConverter):
         """Test MMWR week 1 of 2024."""
-        converter = MMWRWeekConverter()
-        start = converter.get_mmwr_week_start(2024, 1)
+        start = mmwr.get_mmwr_week_start(2024, 1)
         # 2024-01-01 is Monday, so week 1 starts on 2023-12-31 (Sunday)
         assert start.weekday() == 6  # Sunday
-
-    def test_mmwr_week_end_is_saturday(self):
+        assert start == datetime(2023, 12, 31)
+
+    @pytest.mark.parametrize(
+        ("year", "expected"),
+        [
+            (2022, datetime(2022, 1, 2)),  # Jan 1 is Saturday
+            (2023, datetime(2023, 1, 1)),  # Jan 1 is Sunday
+            (2026, datetime(2026, 1, 4)),  # Jan 1 is Thursday
+        ],
+    )
+    def test_mmwr_week1_start(self, mmwr: MMWRWeekConverter, year: int, expected: datetime):
+        """Test week 1 is the first Sunday-start week with four days in the year."""
+        assert mmwr.get_mmwr_week_start(year, 1) == expected
+
+    def test_vectorized_matches_scalar(self, mmwr: MMWRWeekConverter):
+        """Test the array form agrees with the scalar form."""
+        years = np.array([2020, 2024, 2024, 2025, 2026])
+        weeks = np.array([53, 1, 10, 52, 1])
+        starts = mmwr.get_mmwr_week_starts(years, weeks)
+        expected = [
+            mmwr.get_mmwr_week_start(int(y), int(w)) for y, w in zip(years, weeks, strict=True)
+        ]
+        assert starts.astype("datetime64[us]").tolist() == expected
+
+    @pytest.mark.parametrize(("year", "week"), [(2024, 1), (2024, 10), (2025, 52)])
+    def test_mmwr_week_end_is_saturday(self, mmwr: MMWRWeekConverter, year: int, week: int):
         """Test MMWR week end is always Saturday."""
-        converter = MMWRWeekConverter()
-        end = converter.get_mmwr_week_end(2024, 1)
+        end = mmwr.get_mmwr_week_end(year, week)
         assert end.weekday() == 5  # Saturday
 
-    def test_mmwr_week_range_is_6_days(self):
+    @pytest.mark.parametrize(("year", "week"), [(2024, 1), (2024, 10), (2025, 52)])
+    def test_mmwr_week_range_is_6_days(self, mmwr: MMWRWeekConverter, year: int, week: int):
         """Test week range is 6 days (7 days inclusive)."""
-        converter = MMWRWeekConverter()
-        start = converter.get_mmwr_week_start(2024, 10)
-        end = converter.get_mmwr_week_end(2024, 10)
+        start = mmwr.get_mmwr_week_start(year, week)
+        end = mmwr.get_mmwr_week_end(year, week)
         assert (end - start).days == 6
 
-    def test_mmwr_consecutive_weeks_7_days_apart(self):
+    def test_mmwr_consecutive_weeks_7_days_apart(self, mmwr: MMWRWeekConverter):
         """Test consecutive weeks start 7 days apart."""
-        converter = MMWRWeekConverter()
-        week1_start = converter.get_mmwr_week_start(2024, 1)
-        week2_start = converter.get_mmwr_week_start(2024, 2)
+        week1_start = mmwr.get_mmwr_week_start(2024, 1)
+        week2_start = mmwr.get_mmwr_week_start(2024, 2)
         assert (week2_start - week1_start).days == 7
 
 
 class TestNNDSSTransformer:
     """Tests for NNDSS data transformation."""
 
-    def test_load_transforms_to_unified_schema(self, nndss_fixtures_dir: Path):
+    def test_load_transforms_to_unified_schema(self, nndss_loaded_df: pd.DataFrame):
         """Test transformer produces unified schema output."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         assert not df.empty
         # Check required columns exist
@@ -52,16 +81,15 @@ class TestNNDSSTransformer:
         for col in required:
             assert col in df.columns, f"Missing column: {col}"
 
-    def test_data_source_is_nndss(self, nndss_fixtures_dir: Path):
+    def test_data_source_is_nndss(self, nndss_loaded_df: pd.DataFrame):
         """Test all records have data_source='nndss'."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert (df["data_source"] == "nndss").all()
 
-    def test_geo_unit_is_state_only(self, nndss_fixtures_dir: Path):
+    def test_geo_unit_is_state_only(self, nndss_loaded_df: pd.DataFrame):
         """Test only state-level records are included (regions/national filtered)."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         geo_units = df["geo_unit"].unique()
         # Only state records should remain after filtering
@@ -70,98 +98,120 @@ class TestNNDSSTransformer:
         assert "region" not in geo_units
         assert "national" not in geo_units
 
-    def test_state_code_conversion(self, nndss_fixtures_dir: Path):
+    def test_state_code_conversion(self, nndss_loaded_df: pd.DataFrame):
         """Test state names are converted to codes."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         # Massachusetts should be converted to MA
-        state_records = df[df["geo_unit"] == "state"]
-        states = state_records["state"].unique()
+        states = df.loc[df["geo_unit"] == "state", "state"]
         # Check for 2-letter codes
-        assert any(len(s) == 2 for s in states if pd.notna(s))
+        assert states.dropna().str.len().eq(2).any()
 
-    def test_null_counts_filtered(self, nndss_fixtures_dir: Path):
+    def test_null_counts_filtered(self, nndss_loaded_df: pd.DataFrame):
         """Test records with null counts are filtered out."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert df["count"].notna().all()
 
-    def test_date_columns_present(self, nndss_fixtures_dir: Path):
-        """Test date columns are parsed."""
+    def test_count_cleaning(self, nndss_fixtures_dir: Path):
+        """Test sentinel counts become NaN and formatted numbers keep their digits."""
+        raw = pd.DataFrame({"Current week": pd.Series(["5", None, "-", "N", "1,234"], dtype=str)})
+        counts = NNDSSTransformer(nndss_fixtures_dir)._clean_case_counts(raw)["count"]
+        assert counts[[0, 4]].tolist() == [5, 1234]
+        assert counts.iloc[1:4].isna().all()
+
+    def test_chunked_read_matches_single_pass(
+        self, nndss_fixtures_dir: Path, nndss_loaded_df: pd.DataFrame, monkeypatch
+    ):
+        """Test transforming the CSV in small chunks gives the same records."""
+        monkeypatch.setattr("app.etl.transformers.nndss.NNDSS_CSV_CHUNK_ROWS", 7)
+        df = NNDSSTransformer(nndss_fixtures_dir).load()
+        # Chunks with no subtypes build object columns, others str; compare
+        # values with every missing marker as None
+        chunked = df.astype(object).where(df.notna(), None)
+        single = nndss_loaded_df.astype(object).where(nndss_loaded_df.notna(), None)
+        pd.testing.assert_frame_equal(chunked, single)
+
+    def test_csv_is_streamed_in_bounded_chunks(self, nndss_fixtures_dir: Path, monkeypatch):
+        """Test the CSV is read in chunks of at most NNDSS_CSV_CHUNK_ROWS rows."""
+        monkeypatch.setattr("app.etl.transformers.nndss.NNDSS_CSV_CHUNK_ROWS", 7)
+        csv_file = next(nndss_fixtures_dir.glob("NNDSS_Weekly_Data_*.csv"))
         transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        sizes = [len(chunk) for chunk in transformer._read_csv_chunks(str(csv_file), None)]
+        assert len(sizes) > 1
+        assert max(sizes) <= 7
+
+    def test_date_columns_present(self, nndss_loaded_df: pd.DataFrame):
+        """Test date columns are parsed."""
+        df = nndss_loaded_df
 
         assert "report_period_start" in df.columns
         assert "report_period_end" in df.columns
         assert df["report_period_start"].notna().all()
         assert df["report_period_end"].notna().all()
 
-    def test_date_range_is_valid(self, nndss_fixtures_dir: Path):
+    def test_date_range_is_valid(self, nndss_loaded_df: pd.DataFrame):
         """Test date range is 6 days (7 days inclusive)."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         date_ranges = (df["report_period_end"] - df["report_period_start"]).dt.days
         assert (date_ranges == 6).all()
 
-    def test_time_unit_is_week(self, nndss_fixtures_dir: Path):
+    def test_time_unit_is_week(self, nndss_loaded_df: pd.DataFrame):
         """Test time_unit is 'week' for all NNDSS records."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert (df["time_unit"] == "week").all()
 
-    def test_date_type_is_mmwr(self, nndss_fixtures_dir: Path):
+    def test_date_type_is_mmwr(self, nndss_loaded_df: pd.DataFrame):
         """Test date_type is 'mmwr' for all NNDSS records."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert (df["date_type"] == "mmwr").all()
 
-    def test_original_disease_name_preserved(self, nndss_fixtures_dir: Path):
+    def test_original_disease_name_preserved(self, nndss_loaded_df: pd.DataFrame):
         """Test original disease name is preserved."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert "original_disease_name" in df.columns
         assert df["original_disease_name"].notna().all()
 
-    def test_disease_slug_generated(self, nndss_fixtures_dir: Path):
+    def test_disease_slug_generated(self, nndss_loaded_df: pd.DataFrame):
         """Test disease slugs are generated from disease names."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert "disease_slug" in df.columns
         assert df["disease_slug"].notna().all()
         # Slugs should be URL-safe (lowercase, hyphenated)
-        for slug in df["disease_slug"].unique():
-            assert slug == slug.lower()
-            assert " " not in slug
+        slugs = df["disease_slug"]
+        assert (slugs == slugs.str.lower()).all()
+        assert not slugs.str.contains(" ", regex=False).any()
 
-    def test_disease_subtype_column_present(self, nndss_fixtures_dir: Path):
+    def test_disease_subtype_column_present(self, nndss_loaded_df: pd.DataFrame):
         """Test disease_subtype column is present in output."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
+
         assert "disease_subtype" in df.columns
 
-    def test_measles_aggregation(self, nndss_fixtures_dir: Path):
+    def test_measles_aggregation(self, nndss_loaded_df: pd.DataFrame):
         """Test Measles, Imported and Measles, Indigenous aggregate to Measles."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         # Disease names now use tracker canonical form (lowercase slug)
         measles_records = df[df["disease_name"] == "measles"]
         assert len(measles_records) > 0
 
         # Original names should include the variants
-        original_names = measles_records["original_disease_name"].unique()
-        assert any("Imported" in str(n) for n in original_names)
-        assert any("Indigenous" in str(n) for n in original_names)
+        original_names = measles_records["original_disease_name"]
+        assert original_names.str.contains("Imported", regex=False).any()
+        assert original_names.str.contains("Indigenous", regex=False).any()
 
         # Measles should have no subtype (imported/indigenous are aggregated)
         assert measles_records["disease_subtype"].isna().all()
 
-    def test_meningococcal_subtype_extraction(self, nndss_fixtures_dir: Path):
+    def test_meningococcal_subtype_extraction(self, nndss_loaded_df: pd.DataFrame):
         """Test Meningococcal serogroups are extracted to disease_subtype."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         # Disease names now use tracker canonical form
         mening_records = df[df["disease_name"] == "meningococcus"]
@@ -172,12 +222,13 @@ class TestNNDSSTransformer:
         assert "B" in subtypes
         assert "ACWY" in subtypes
 
-    def test_meningococcal_all_serogroups_no_subtype(self, nndss_fixtures_dir: Path):
+    def test_meningococcal_all_serogroups_no_subtype(self, nndss_loaded_df: pd.DataFrame):
         """Test Meningococcal All serogroups records have no subtype."""
-        transformer = NNDSSTransformer(nndss_fixtures_dir)
-        df = transformer.load()
+        df = nndss_loaded_df
 
         # Records from "All serogroups" should have null subtype
-        all_serogroups = df[df["original_disease_name"].str.contains("All serogroups", na=False)]
+        all_serogroups = df[
+            df["original_disease_name"].str.contains("All serogroups", regex=False, na=False)
+        ]
         if len(all_serogroups) > 0:
             assert all_serogroups["disease_subtype"].isna().all()
@@ -1,6 +1,7 @@
 """Tests for ETL normalizer functions."""
 
 import pandas as pd
+import pytest
 
 from app.etl.normalizers.disease_names import get_display_name
 from app.etl.normalizers.geo import (
@@ -8,100 +9,115 @@ from app.etl.normalizers.geo import (
     REGION_SLUGS,
     classify_geo_unit,
 )
+from app.etl.normalizers.mapping import constant_category, map_unique
 from app.etl.normalizers.slugify import slugify
 
 
 class TestSlugify:
     """Tests for slugify function."""
 
-    def test_basic_slugify(self):
-        """Test basic string slugification."""
-        assert slugify("Hello World") == "hello-world"
-        assert slugify("Meningococcal disease") == "meningococcal-disease"
-
-    def test_removes_punctuation(self):
-        """Test punctuation is removed."""
-        assert slugify("U.S. Residents") == "us-residents"
-        assert slugify("Hansen's Disease") == "hansens-disease"
-        assert slugify("Test, with, commas") == "test-with-commas"
-
-    def test_handles_case(self):
-        """Test case normalization."""
-        assert slugify("OTHER") == "other"
-        assert slugify("Other") == "other"
-        assert slugify("other") == "other"
-
-    def test_collapses_whitespace(self):
-        """Test multiple spaces collapse to single hyphen."""
-        assert slugify("Hello   World") == "hello-world"
-        assert slugify("  padded  ") == "padded"
-
-    def test_underscores_to_hyphens(self):
-        """Test underscores become hyphens."""
-        assert slugify("hello_world") == "hello-world"
-
-    def test_none_returns_none(self):
-        """Test None returns None."""
-        assert slugify(None) is None
-
-    def test_nan_returns_none(self):
-        """Test NaN returns None."""
-        assert slugify(pd.NA) is None
-
-    def test_empty_returns_none(self):
-        """Test empty string returns None."""
-        assert slugify("") is None
-        assert slugify("   ") is None
-
-    def test_state_codes(self):
-        """Test state codes slugify correctly."""
-        assert slugify("CA") == "ca"
-        assert slugify("NY") == "ny"
-        assert slugify("NYC") == "nyc"
-
-    def test_serogroups(self):
-        """Test serogroup slugification."""
-        assert slugify("B") == "b"
-        assert slugify("ACWY") == "acwy"
-        assert slugify("Other") == "other"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            # Basic slugification
+            ("Hello World", "hello-world"),
+            ("Meningococcal disease", "meningococcal-disease"),
+            # Punctuation is removed
+            ("U.S. Residents", "us-residents"),
+            ("Hansen's Disease", "hansens-disease"),
+            ("Test, with, commas", "test-with-commas"),
+            # Case normalization
+            ("OTHER", "other"),
+            ("Other", "other"),
+            ("other", "other"),
+            # Whitespace collapses to a single hyphen
+            ("Hello   World", "hello-world"),
+            ("  padded  ", "padded"),
+            # Underscores become hyphens
+            ("hello_world", "hello-world"),
+            # State codes
+            ("CA", "ca"),
+            ("NY", "ny"),
+            ("NYC", "nyc"),
+            # Serogroups
+            ("B", "b"),
+            ("ACWY", "acwy"),
+        ],
+    )
+    def test_slugify(self, value: str, expected: str):
+        """Test string slugification."""
+        assert slugify(value) == expected
+
+    @pytest.mark.parametrize("value", [None, pd.NA, "", "   "])
+    def test_missing_returns_none(self, value):
+        """Test None, NA, empty and blank strings return None."""
+        assert slugify(value) is None
 
 
 class TestClassifyGeoUnit:
     """Tests for classify_geo_unit function."""
 
-    def test_national_level(self):
-        """Test national level classifications."""
-        assert classify_geo_unit("US RESIDENTS") == "national"
-        assert classify_geo_unit("NON-US RESIDENTS") == "national"
-        assert classify_geo_unit("TOTAL") == "national"
-
-    def test_national_with_punctuation(self):
-        """Test national level with punctuation variations."""
-        # The bug case - periods and different casing
-        assert classify_geo_unit("U.S. Residents") == "national"
-        assert classify_geo_unit("U.S.Residents") == "national"
-        assert classify_geo_unit("us residents") == "national"
-
-    def test_region_level(self):
-        """Test region level classifications."""
-        assert classify_geo_unit("PACIFIC") == "region"
-        assert classify_geo_unit("NEW ENGLAND") == "region"
-        assert classify_geo_unit("MOUNTAIN") == "region"
-        assert classify_geo_unit("pacific") == "region"
-
-    def test_state_level(self):
-        """Test state level classifications."""
-        assert classify_geo_unit("California") == "state"
-        assert classify_geo_unit("CA") == "state"
-        assert classify_geo_unit("New York City") == "state"
-
-    def test_empty_returns_state(self):
-        """Test empty string defaults to state."""
-        assert classify_geo_unit("") == "state"
-
-    def test_none_returns_state(self):
-        """Test None defaults to state."""
-        assert classify_geo_unit(None) == "state"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            # National level
+            ("US RESIDENTS", "national"),
+            ("NON-US RESIDENTS", "national"),
+            ("TOTAL", "national"),
+            # National level with punctuation and casing variations (the bug case)
+            ("U.S. Residents", "national"),
+            ("U.S.Residents", "national"),
+            ("us residents", "national"),
+            # Region level
+            ("PACIFIC", "region"),
+            ("NEW ENGLAND", "region"),
+            ("MOUNTAIN", "region"),
+            ("pacific", "region"),
+            # State level
+            ("California", "state"),
+            ("CA", "state"),
+            ("New York City", "state"),
+            # Missing names default to state
+            ("", "state"),
+            (None, "state"),
+        ],
+    )
+    def test_classify_geo_unit(self, name: str | None, expected: str):
+        """Test geographic unit classification."""
+        assert classify_geo_unit(name) == expected
+
+
+class TestMapUnique:
+    """Tests for map_unique helper."""
+
+    def test_matches_per_row_apply(self):
+        """Test results match applying the function to every row."""
+        series = pd.Series(["Measles", None, "New York", "Measles", "New York"])
+        expected = series.apply(slugify)
+        assert map_unique(series, slugify).tolist() == expected.tolist()
+
+    def test_calls_function_once_per_distinct_value(self):
+        """Test the function runs once per distinct value plus once for missing."""
+        calls = []
+        series = pd.Series(["a", "b", "a", None, "b", None])
+        map_unique(series, lambda x: calls.append(x) or x)
+        assert sorted(calls, key=str) == sorted(["a", "b", None], key=str)
+
+    def test_preserves_index(self):
+        """Test the result is aligned to the input index."""
+        series = pd.Series(["x", "y"], index=[10, 20])
+        assert map_unique(series, slugify).index.tolist() == [10, 20]
+
+
+class TestConstantCategory:
+    """Tests for constant_category helper."""
+
+    def test_single_category_on_every_row(self):
+        """Test every row holds the value and it is the only category."""
+        column = pd.Series(constant_category("nndss", 3))
+        assert column.tolist() == ["nndss"] * 3
+        assert column.cat.categories.tolist() == ["nndss"]
+        assert (column == "nndss").all()
 
 
 class TestGetDisplayName:
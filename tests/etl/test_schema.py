@@ -1,6 +1,8 @@
 """Tests for ETL schema validation."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from app.etl.schema import (
     NULLABLE_COLUMNS,
@@ -10,6 +12,13 @@ from app.etl.schema import (
 )
 
 
+@pytest.fixture(scope="module")
+def base_df() -> pd.DataFrame:
+    """One-row frame covering every required column; copy before changing."""
+    values = np.full((1, len(REQUIRED_COLUMNS)), "value", dtype=object)
+    return pd.DataFrame(values, columns=REQUIRED_COLUMNS)
+
+
 class TestSchemaConstants:
     """Tests for schema constants."""
 
@@ -36,34 +45,31 @@ class TestValidateDataframe:
         assert len(errors) > 0
         assert any("Missing columns" in e for e in errors)
 
-    def test_null_in_required_column(self):
+    def test_null_in_required_column(self, base_df: pd.DataFrame):
         """Test detection of null values in required columns."""
-        # Create a dataframe with all required columns
-        data = {col: ["value"] for col in REQUIRED_COLUMNS}
-        data["disease_name"] = [None]  # Set a required column to null
-        df = pd.DataFrame(data)
+        # All required columns, with one of them set to null
+        df = base_df.copy()
+        df["disease_name"] = [None]
 
         errors = validate_dataframe(df)
         assert any("disease_name" in e and "null" in e for e in errors)
 
-    def test_extra_columns_no_error(self):
+    def test_extra_columns_no_error(self, base_df: pd.DataFrame):
         """Test extra columns don't cause errors."""
-        data = {col: ["value"] for col in REQUIRED_COLUMNS}
-        data["extra_column"] = ["extra"]
-        df = pd.DataFrame(data)
+        df = base_df.copy()
+        df["extra_column"] = ["extra"]
 
         errors = validate_dataframe(df)
         # Should not have errors about extra columns
         assert not any("extra_column" in str(e) for e in errors)
 
-    def test_valid_dataframe(self):
+    def test_valid_dataframe(self, base_df: pd.DataFrame):
         """Test valid dataframe passes validation."""
-        data = {col: ["value"] for col in REQUIRED_COLUMNS}
+        df = base_df.copy()
         # Set proper types for date columns
-        data["report_period_start"] = pd.to_datetime(["2024-01-01"])
-        data["report_period_end"] = pd.to_datetime(["2024-01-07"])
-        data["count"] = [100]
-        df = pd.DataFrame(data)
+        df["report_period_start"] = pd.to_datetime(["2024-01-01"])
+        df["report_period_end"] = pd.to_datetime(["2024-01-07"])
+        df["count"] = [100]
 
         errors = validate_dataframe(df)
         # Only check for missing column errors, not null errors
@@ -2,75 +2,69 @@
 
 from pathlib import Path
 
+import pandas as pd
+
 from app.etl.transformers.tracker import TrackerTransformer
 
 
 class TestTrackerTransformer:
     """Tests for tracker data transformation."""
 
-    def test_load_transforms_to_unified_schema(self, fixtures_dir: Path):
+    def test_load_transforms_to_unified_schema(self, tracker_loaded_df: pd.DataFrame):
         """Test transformer produces unified schema output."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert not df.empty
         required = ["disease_name", "disease_slug", "state", "count", "data_source"]
         for col in required:
             assert col in df.columns, f"Missing column: {col}"
 
-    def test_data_source_is_tracker(self, fixtures_dir: Path):
+    def test_data_source_is_tracker(self, tracker_loaded_df: pd.DataFrame):
         """Test all records have data_source='tracker'."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
         assert (df["data_source"] == "tracker").all()
 
-    def test_loads_multiple_states(self, fixtures_dir: Path):
+    def test_loads_multiple_states(self, tracker_loaded_df: pd.DataFrame):
         """Test transformer loads data from multiple state directories."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         states = df["state"].unique()
         assert len(states) >= 2, "Should load data from multiple states"
 
-    def test_original_disease_name_preserved(self, fixtures_dir: Path):
+    def test_original_disease_name_preserved(self, tracker_loaded_df: pd.DataFrame):
         """Test original disease name is preserved before normalization."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert "original_disease_name" in df.columns
         assert df["original_disease_name"].notna().all()
 
-    def test_disease_slug_generated(self, fixtures_dir: Path):
+    def test_disease_slug_generated(self, tracker_loaded_df: pd.DataFrame):
         """Test disease slugs are generated."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert "disease_slug" in df.columns
         assert df["disease_slug"].notna().all()
 
-    def test_date_columns_present(self, fixtures_dir: Path):
+    def test_date_columns_present(self, tracker_loaded_df: pd.DataFrame):
         """Test date columns are parsed from CSV."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert "report_period_start" in df.columns
         assert "report_period_end" in df.columns
         assert df["report_period_start"].notna().all()
         assert df["report_period_end"].notna().all()
 
-    def test_age_group_present(self, fixtures_dir: Path):
+    def test_age_group_present(self, tracker_loaded_df: pd.DataFrame):
         """Test age_group column is present (tracker data has age groups)."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert "age_group" in df.columns
         # Tracker fixtures should have age group data
         assert df["age_group"].notna().any()
 
-    def test_geo_unit_is_state(self, fixtures_dir: Path):
+    def test_geo_unit_is_state(self, tracker_loaded_df: pd.DataFrame):
         """Test geo_unit is 'state' for tracker data."""
-        transformer = TrackerTransformer(fixtures_dir)
-        df = transformer.load()
+        df = tracker_loaded_df
 
         assert (df["geo_unit"] == "state").all()
 
@@ -96,7 +90,7 @@ class TestTrackerTransformer:
 
         # Should have loaded only from the newer file
         assert len(df) == 1
-        assert df.iloc[0]["count"] == 10
+        assert df["count"].iat[0] == 10
 
     def test_empty_directory_returns_empty_dataframe(self, tmp_path: Path):
         """Test transformer handles missing data directory gracefully."""
@@ -1,77 +1,149 @@
 """Tests for HTML fragment endpoints (HTMX)."""
 
+import asyncio
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+from app.routers import html_api
+
 
 class TestDiseaseCardsFragment:
     """Tests for /api/html/diseases endpoint."""
 
-    def test_returns_html(self, client: TestClient):
-        """Test endpoint returns HTML content type."""
+    def test_fragment_contract(self, client: TestClient):
+        """Test one response is HTML with links to, and names of, fixture diseases."""
         response = client.get("/api/html/diseases")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
 
-    def test_contains_disease_links(self, client: TestClient):
-        """Test response contains links to disease pages."""
-        response = client.get("/api/html/diseases")
-        content = response.text
+        content = response.content.lower()
         # Should have links to disease detail pages
-        assert "/disease/" in content
-
-    def test_displays_disease_names(self, client: TestClient):
-        """Test response displays disease names."""
-        response = client.get("/api/html/diseases")
-        content = response.text.lower()
+        assert b"/disease/" in content
         # Should contain at least one disease name from fixtures
-        assert "measles" in content or "pertussis" in content
-
+        assert b"measles" in content or b"pertussis" in content
 
-class TestDiseaseStatsFragment:
-    """Tests for /api/html/disease/{slug}/stats endpoint."""
+    def test_cards_rendered_once_per_load(self, client: TestClient):
+        """Test the card grid is rendered once and reused until the data reloads."""
+        first = html_api.render_disease_cards("tracker")
+        assert html_api.render_disease_cards("tracker") is first
+        assert client.get("/api/html/diseases").content == first
 
-    def test_returns_html(self, client: TestClient):
-        """Test endpoint returns HTML content type."""
-        response = client.get("/api/html/disease/measles/stats")
+    def test_unknown_source_not_cached(self, client: TestClient):
+        """Test grids for unconfigured data sources are rendered but not kept."""
+        response = client.get("/api/html/diseases?data_source=bogus")
         assert response.status_code == 200
-        assert "text/html" in response.headers.get("content-type", "")
+        assert "bogus" not in html_api._cards_html
 
-    def test_invalid_disease_returns_404(self, client: TestClient):
+
+# Per-disease fragments under /api/html/disease/{slug}/
+DISEASE_FRAGMENTS = ("stats", "timeseries", "age-groups")
+
+
+class TestDiseaseFragments:
+    """Tests for the /api/html/disease/{slug}/... fragment endpoints."""
+
+    async def test_fragments_return_html(self, async_client: httpx.AsyncClient):
+        """Test every disease fragment (and the week granularity) renders as HTML."""
+        urls = [f"/api/html/disease/measles/{fragment}" for fragment in DISEASE_FRAGMENTS]
+        urls.append("/api/html/disease/measles/timeseries?granularity=week")
+
+        # Issued concurrently through the ASGI app
+        responses = await asyncio.gather(*(async_client.get(url) for url in urls))
+        for url, response in zip(urls, responses, strict=True):
+            assert response.status_code == 200, url
+            assert "text/html" in response.headers.get("content-type", ""), url
+
+    @pytest.mark.parametrize("fragment", DISEASE_FRAGMENTS)
+    async def test_invalid_disease_returns_404(
+        self, async_client: httpx.AsyncClient, fragment: str
+    ):
         """Test 404 for nonexistent disease."""
-        response = client.get("/api/html/disease/nonexistent-xyz/stats")
+        response = await async_client.get(f"/api/html/disease/nonexistent-xyz/{fragment}")
         assert response.status_code == 404
 
 
-class TestTimeseriesFragment:
-    """Tests for /api/html/disease/{slug}/timeseries endpoint."""
+class TestFragmentCache:
+    """Tests for the in-process rendered fragment cache."""
 
-    def test_returns_html(self, client: TestClient):
-        """Test endpoint returns HTML content type."""
-        response = client.get("/api/html/disease/measles/timeseries")
-        assert response.status_code == 200
-        assert "text/html" in response.headers.get("content-type", "")
+    def test_repeat_request_served_from_cache(self, client: TestClient, monkeypatch):
+        """Test a repeated fragment request doesn't hit the database again."""
+        first = client.get("/api/html/disease/measles/stats")
+        assert first.status_code == 200
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("database queried on cache hit")
+
+        monkeypatch.setattr("app.routers.html_api.run_db_query", fail)
+        second = client.get("/api/html/disease/measles/stats")
+        assert second.status_code == 200
+        assert second.text == first.text
+        assert "text/html" in second.headers.get("content-type", "")
 
-    def test_granularity_parameter(self, client: TestClient):
-        """Test granularity query parameter is accepted."""
-        response = client.get("/api/html/disease/measles/timeseries?granularity=week")
+    def test_not_found_is_not_cached(self, client: TestClient):
+        """Test error responses are not stored in the cache."""
+        assert client.get("/api/html/disease/nonexistent-xyz/stats").status_code == 404
+        assert client.get("/api/html/disease/nonexistent-xyz/stats").status_code == 404
+
+    def test_gzip_served_when_accepted(self, client: TestClient):
+        """Test large fragments are served precompressed to gzip-capable clients."""
+        response = client.get(
+            "/api/html/disease/measles/timeseries", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "measles" in response.text.lower()
+
+    def test_identity_served_when_gzip_not_accepted(self, client: TestClient):
+        """Test clients without gzip support get the uncompressed body."""
+        response = client.get(
+            "/api/html/disease/measles/timeseries", headers={"Accept-Encoding": "identity"}
+        )
         assert response.status_code == 200
+        assert "content-encoding" not in response.headers
 
-    def test_invalid_disease_returns_404(self, client: TestClient):
-        """Test 404 for nonexistent disease."""
-        response = client.get("/api/html/disease/nonexistent-xyz/timeseries")
-        assert response.status_code == 404
 
+class TestTemplateJson:
+    """Tests for the orjson-backed tojson filter."""
+
+    def test_tojson_is_html_safe(self):
+        """Test embedded JSON escapes characters that could close a script tag."""
+        from app.templates import templates
 
-class TestAgeGroupFragment:
-    """Tests for /api/html/disease/{slug}/age-groups endpoint."""
+        rendered = templates.env.from_string("{{ data | tojson }}").render(
+            data={"label": "</script>&'", "values": [1, 2.5, None]}
+        )
+        assert "</script>" not in rendered
+        assert '"values":[1,2.5,null]' in rendered
 
-    def test_returns_html(self, client: TestClient):
-        """Test endpoint returns HTML content type."""
-        response = client.get("/api/html/disease/measles/age-groups")
+
+class TestDiseaseBundleFragment:
+    """Tests for /api/html/disease/{slug}/bundle endpoint."""
+
+    def test_returns_all_panels(self, client: TestClient):
+        """Test the bundle contains an out-of-band swap for every panel."""
+        response = client.get("/api/html/disease/measles/bundle")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
+        for panel_id in (
+            "disease-stats-panel",
+            "state-selector-panel",
+            "date-range-selector-panel",
+            "timeseries-panel",
+            "state-map-panel",
+            "age-groups-panel",
+        ):
+            assert f'id="{panel_id}" hx-swap-oob="innerHTML"' in response.text
+        assert "serotypes-panel" not in response.text
+
+    def test_includes_serotypes_for_meningococcus(self, client: TestClient):
+        """Test the serotype panel is only bundled for meningococcus."""
+        response = client.get("/api/html/disease/meningococcus/bundle")
+        assert response.status_code == 200
+        assert 'id="serotypes-panel" hx-swap-oob="innerHTML"' in response.text
 
     def test_invalid_disease_returns_404(self, client: TestClient):
         """Test 404 for nonexistent disease."""
-        response = client.get("/api/html/disease/nonexistent-xyz/age-groups")
+        response = client.get("/api/html/disease/nonexistent-xyz/bundle")
         assert response.status_code == 404
@@ -1,98 +1,145 @@
 """Tests for HTML page rendering."""
 
+from collections.abc import Callable
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+# The session-wide `cached_get` fixture: one shared response per URL
+CachedGet = Callable[[str], httpx.Response]
+
+# Full-page routes served as HTML documents
+PAGE_PATHS = ["/", "/disease/measles"]
+
 
 class TestLandingPage:
     """Tests for the landing page (/)."""
 
-    def test_returns_html(self, client: TestClient):
+    def test_returns_html(self, cached_get: CachedGet):
         """Test landing page returns HTML."""
-        response = client.get("/")
+        response = cached_get("/")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
 
-    def test_has_html_structure(self, client: TestClient):
+    def test_has_html_structure(self, cached_get: CachedGet):
         """Test response has proper HTML document structure."""
-        response = client.get("/")
-        content = response.text.lower()
-        assert "<!doctype html>" in content or "<html" in content
-        assert "</html>" in content
+        response = cached_get("/")
+        content = response.content.lower()
+        assert b"<!doctype html>" in content or b"<html" in content
+        assert b"</html>" in content
 
-    def test_has_htmx_trigger(self, client: TestClient):
+    def test_has_htmx_trigger(self, cached_get: CachedGet):
         """Test landing page has HTMX trigger for loading content."""
-        response = client.get("/")
-        content = response.text
+        response = cached_get("/")
+        content = response.content
         # Should have HTMX attributes for dynamic loading
-        assert "hx-get" in content or "hx-trigger" in content
+        assert b"hx-get" in content or b"hx-trigger" in content
 
-    def test_has_page_title(self, client: TestClient):
+    def test_has_page_title(self, cached_get: CachedGet):
         """Test landing page has title."""
-        response = client.get("/")
-        content = response.text
-        assert "<title>" in content
-        assert "Dashboard" in content
+        response = cached_get("/")
+        content = response.content
+        assert b"<title>" in content
+        assert b"Dashboard" in content
 
-    def test_loads_htmx_library(self, client: TestClient):
+    def test_loads_htmx_library(self, cached_get: CachedGet):
         """Test page includes HTMX library."""
-        response = client.get("/")
-        content = response.text.lower()
+        response = cached_get("/")
+        content = response.content.lower()
         # Should reference htmx somewhere (in head or body)
-        assert "htmx" in content
+        assert b"htmx" in content
 
 
 class TestDiseaseDetailPage:
     """Tests for disease detail page (/disease/{slug})."""
 
-    def test_returns_html(self, client: TestClient):
-        """Test disease page returns HTML."""
-        response = client.get("/disease/measles")
+    def test_measles_page_contract(self, cached_get: CachedGet):
+        """Test the disease page is HTML with the name, HTMX triggers and a home link."""
+        response = cached_get("/disease/measles")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
 
-    def test_contains_disease_name(self, client: TestClient):
-        """Test page contains disease name."""
-        response = client.get("/disease/measles")
-        content = response.text.lower()
-        assert "measles" in content
-
-    def test_has_htmx_triggers(self, client: TestClient):
-        """Test disease page has HTMX triggers for loading data."""
-        response = client.get("/disease/measles")
-        content = response.text
+        content = response.content
+        assert b"measles" in content.lower()
         # Should have hx-get for loading stats and charts
-        assert "hx-get" in content
+        assert b"hx-get" in content
+        # Should have a link back to home
+        assert b'href="/"' in content or b"href='/''" in content
 
     def test_invalid_disease_returns_404(self, client: TestClient):
-        """Test 404 for nonexistent disease."""
+        """Test 404 with an error message for nonexistent disease."""
         response = client.get("/disease/nonexistent-disease-xyz")
         assert response.status_code == 404
-
-    def test_404_has_error_message(self, client: TestClient):
-        """Test 404 page has error message."""
-        response = client.get("/disease/nonexistent-disease-xyz")
-        content = response.text.lower()
-        assert "not found" in content
-
-    def test_has_back_navigation(self, client: TestClient):
-        """Test disease page has navigation back to landing."""
-        response = client.get("/disease/measles")
-        content = response.text
-        # Should have a link back to home
-        assert 'href="/"' in content or "href='/''" in content
+        assert b"not found" in response.content.lower()
 
 
 class TestHTMLResponseHeaders:
     """Tests for HTML response headers."""
 
-    def test_content_type_is_html(self, client: TestClient):
+    @pytest.mark.parametrize("path", PAGE_PATHS)
+    def test_content_type_is_html(self, cached_get: CachedGet, path: str):
         """Test content type is text/html for pages."""
-        response = client.get("/")
+        response = cached_get(path)
         content_type = response.headers.get("content-type", "")
         assert "text/html" in content_type
 
-    def test_charset_is_utf8(self, client: TestClient):
+    @pytest.mark.parametrize("path", PAGE_PATHS)
+    def test_charset_is_utf8(self, cached_get: CachedGet, path: str):
         """Test charset is utf-8."""
-        response = client.get("/")
+        response = cached_get(path)
         content_type = response.headers.get("content-type", "")
         assert "utf-8" in content_type.lower()
+
+
+class TestSitemap:
+    """Tests for /sitemap.xml."""
+
+    def test_lists_disease_pages(self, client: TestClient):
+        """Test the sitemap lists the landing page and disease pages."""
+        response = client.get("/sitemap.xml")
+        assert response.status_code == 200
+        assert "application/xml" in response.headers["content-type"]
+        assert "<loc>http://testserver/</loc>" in response.text
+        assert "<loc>http://testserver/disease/measles</loc>" in response.text
+        assert response.text.endswith("</urlset>")
+
+    def test_base_url_is_xml_escaped(self, client: TestClient):
+        """Test a Host header with XML metacharacters can't break the markup."""
+        response = client.get("/sitemap.xml", headers={"Host": "a&b.example"})
+        assert "<loc>http://a&amp;b.example/</loc>" in response.text
+
+    def test_has_cache_headers(self, client: TestClient):
+        """Test the sitemap is served with ETag, Last-Modified and Cache-Control."""
+        response = client.get("/sitemap.xml")
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers.get("last-modified")
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+    def test_matching_etag_returns_304(self, client: TestClient):
+        """Test revalidating with the current ETag returns 304 without a body."""
+        etag = client.get("/sitemap.xml").headers["etag"]
+        response = client.get("/sitemap.xml", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_precompressed_for_gzip_clients(self, client: TestClient):
+        """Test gzip clients get the precompressed sitemap."""
+        response = client.get("/sitemap.xml", headers={"Accept-Encoding": "gzip"})
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "<loc>http://testserver/</loc>" in response.text
+
+
+class TestResponseCompression:
+    """Tests for on-the-fly gzip compression."""
+
+    def test_html_page_is_gzipped(self, client: TestClient):
+        """Test large HTML pages are gzip-compressed for clients that accept it."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "<html" in response.text
+
+    def test_identity_when_gzip_not_accepted(self, client: TestClient):
+        """Test clients without gzip support get an uncompressed page."""
+        response = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
@@ -1,132 +1,219 @@
 """Tests for database edge cases."""
 
+import pytest
+
+from app.config import Settings, settings
 from app.database import DiseaseDatabase
 
 
+@pytest.fixture(scope="module")
+def uninit_db() -> DiseaseDatabase:
+    """A database that is never connected; its query methods don't change it."""
+    return DiseaseDatabase()
+
+
 class TestUninitializedDatabase:
     """Tests for database methods when not initialized."""
 
-    def test_get_diseases_returns_empty(self):
-        """Test get_diseases returns empty list when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_diseases() == []
-
-    def test_get_diseases_with_source_returns_empty(self):
-        """Test get_diseases with data_source returns empty when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_diseases(data_source="tracker") == []
-
-    def test_get_diseases_with_slugs_returns_empty(self):
-        """Test get_diseases_with_slugs returns empty when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_diseases_with_slugs() == []
-
-    def test_get_disease_name_by_slug_returns_none(self):
-        """Test get_disease_name_by_slug returns None when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_disease_name_by_slug("measles") is None
-
-    def test_get_states_returns_empty(self):
-        """Test get_states returns empty list when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_states() == []
-
-    def test_get_summary_stats_returns_empty(self):
-        """Test get_summary_stats returns empty dict when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_summary_stats() == {}
-
-    def test_get_disease_totals_returns_empty(self):
-        """Test get_disease_totals returns empty list when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_disease_totals() == []
-
-    def test_get_national_timeseries_returns_empty(self):
-        """Test get_national_disease_timeseries returns empty when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_national_disease_timeseries("Measles") == []
-
-    def test_get_disease_stats_returns_empty(self):
-        """Test get_disease_stats returns empty dict when not initialized."""
-        db = DiseaseDatabase()
-        assert db.get_disease_stats("Measles") == {}
-
-    def test_get_age_group_distribution_returns_empty(self):
-        """Test get_age_group_distribution_by_state returns empty when not initialized."""
-        db = DiseaseDatabase()
-        result = db.get_age_group_distribution_by_state("Measles")
-        assert result == {"states": {}, "age_groups": [], "available_states": []}
-
-    def test_get_timeseries_by_state_returns_empty(self):
-        """Test get_disease_timeseries_by_state returns empty when not initialized."""
-        db = DiseaseDatabase()
-        result = db.get_disease_timeseries_by_state("Measles")
-        assert result == {"states": {}, "national": [], "available_states": []}
-
-    def test_get_serotype_distribution_returns_empty(self):
-        """Test get_serotype_distribution_by_state returns empty when not initialized."""
-        db = DiseaseDatabase()
-        result = db.get_serotype_distribution_by_state("Meningococcal disease")
-        assert result == {"states": {}, "serotypes": [], "available_states": []}
-
-    def test_is_initialized_false(self):
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "expected"),
+        [
+            ("get_diseases", (), {}, []),
+            ("get_diseases", (), {"data_source": "tracker"}, []),
+            ("get_diseases_with_slugs", (), {}, []),
+            ("get_disease_cards_bundle", (), {}, []),
+            ("get_disease_name_by_slug", ("measles",), {}, None),
+            ("get_states", (), {}, []),
+            ("get_summary_stats", (), {}, {}),
+            ("get_disease_totals", (), {}, []),
+            ("get_national_disease_timeseries", ("Measles",), {}, []),
+            ("get_disease_stats", ("Measles",), {}, {}),
+            (
+                "get_age_group_distribution_by_state",
+                ("Measles",),
+                {},
+                {"states": {}, "age_groups": [], "available_states": []},
+            ),
+            (
+                "get_disease_timeseries_by_state",
+                ("Measles",),
+                {},
+                {"states": {}, "national": [], "available_states": []},
+            ),
+            (
+                "get_serotype_distribution_by_state",
+                ("Meningococcal disease",),
+                {},
+                {"states": {}, "serotypes": [], "available_states": []},
+            ),
+        ],
+    )
+    def test_query_returns_empty(
+        self, uninit_db: DiseaseDatabase, method: str, args: tuple, kwargs: dict, expected
+    ):
+        """Test query methods return an empty result when not initialized."""
+        assert getattr(uninit_db, method)(*args, **kwargs) == expected
+
+    def test_is_initialized_false(self, uninit_db: DiseaseDatabase):
         """Test is_initialized returns False for new database."""
-        db = DiseaseDatabase()
-        assert db.is_initialized() is False
+        assert uninit_db.is_initialized() is False
+
+    def test_last_updated_at_none(self, uninit_db: DiseaseDatabase):
+        """Test last_updated_at returns None before data is loaded."""
+        assert uninit_db.last_updated_at() is None
+
+    def test_uses_injected_settings(self):
+        """Test settings passed to the constructor win over the app-wide settings."""
+        custom = Settings(database_path=":memory:", db_workers=settings.db_workers + 1)
+        assert DiseaseDatabase(settings=custom).pool_stats()["workers"] == custom.db_workers
+        assert DiseaseDatabase().settings is settings
 
 
 class TestDataSourceFilters:
     """Tests for data_source filter branches using the session-scoped test db."""
 
-    def test_get_diseases_with_tracker_source(self, etl_test_db):
-        """Test get_diseases filters by tracker source."""
-        diseases = etl_test_db.get_diseases(data_source="tracker")
-        assert isinstance(diseases, list)
-
-    def test_get_diseases_with_nndss_source(self, etl_test_db):
-        """Test get_diseases filters by nndss source."""
-        diseases = etl_test_db.get_diseases(data_source="nndss")
-        assert isinstance(diseases, list)
+    @pytest.mark.parametrize(
+        ("method", "args", "data_source", "expected_type"),
+        [
+            ("get_diseases", (), "tracker", list),
+            ("get_diseases", (), "nndss", list),
+            ("get_diseases_with_slugs", (), "tracker", list),
+            ("get_states", (), "tracker", list),
+            ("get_summary_stats", (), "tracker", dict),
+            ("get_disease_totals", (), "tracker", list),
+            ("get_national_disease_timeseries", ("Measles",), "tracker", list),
+            ("get_disease_stats", ("Measles",), "tracker", dict),
+            ("get_age_group_distribution_by_state", ("Measles",), "tracker", dict),
+            ("get_disease_timeseries_by_state", ("Measles",), "tracker", dict),
+        ],
+    )
+    def test_data_source_filter(
+        self, etl_test_db, method: str, args: tuple, data_source: str, expected_type: type
+    ):
+        """Test query methods accept a data_source filter."""
+        result = getattr(etl_test_db, method)(*args, data_source=data_source)
+        assert isinstance(result, expected_type)
 
-    def test_get_diseases_with_slugs_tracker_source(self, etl_test_db):
-        """Test get_diseases_with_slugs filters by tracker source."""
+    def test_get_disease_cards_bundle_with_source(self, etl_test_db):
+        """Test get_disease_cards_bundle matches the disease list plus merged totals."""
+        cards = etl_test_db.get_disease_cards_bundle(data_source="tracker")
         diseases = etl_test_db.get_diseases_with_slugs(data_source="tracker")
-        assert isinstance(diseases, list)
-
-    def test_get_states_with_source(self, etl_test_db):
-        """Test get_states filters by data source."""
-        states = etl_test_db.get_states(data_source="tracker")
-        assert isinstance(states, list)
-
-    def test_get_summary_stats_with_source(self, etl_test_db):
-        """Test get_summary_stats filters by data source."""
-        stats = etl_test_db.get_summary_stats(data_source="tracker")
-        assert isinstance(stats, dict)
-
-    def test_get_disease_totals_with_source(self, etl_test_db):
-        """Test get_disease_totals filters by data source."""
-        totals = etl_test_db.get_disease_totals(data_source="tracker")
-        assert isinstance(totals, list)
-
-    def test_get_national_timeseries_with_source(self, etl_test_db):
-        """Test get_national_disease_timeseries filters by data source."""
-        data = etl_test_db.get_national_disease_timeseries("Measles", data_source="tracker")
-        assert isinstance(data, list)
-
-    def test_get_disease_stats_with_source(self, etl_test_db):
-        """Test get_disease_stats filters by data source."""
-        stats = etl_test_db.get_disease_stats("Measles", data_source="tracker")
-        assert isinstance(stats, dict)
-
-    def test_get_age_distribution_with_source(self, etl_test_db):
-        """Test get_age_group_distribution_by_state filters by data source."""
-        data = etl_test_db.get_age_group_distribution_by_state("Measles", data_source="tracker")
-        assert isinstance(data, dict)
+        totals = {d["disease_name"]: d["total_cases"] for d in etl_test_db.get_disease_totals()}
 
-    def test_get_timeseries_by_state_with_source(self, etl_test_db):
-        """Test get_disease_timeseries_by_state filters by data source."""
-        data = etl_test_db.get_disease_timeseries_by_state("Measles", data_source="tracker")
-        assert isinstance(data, dict)
+        assert [c["slug"] for c in cards] == [d["slug"] for d in diseases]
+        for card in cards:
+            assert card["total_cases"] == totals.get(card["name"])
+
+    def test_get_disease_header_by_slug(self, etl_test_db):
+        """Test get_disease_header_by_slug returns name and sources, or None if unknown."""
+        header = etl_test_db.get_disease_header_by_slug("measles")
+        assert header["name"] == etl_test_db.get_disease_name_by_slug("measles")
+        assert header["data_source"] == etl_test_db.get_disease_data_source_by_slug("measles")
+        assert etl_test_db.get_disease_header_by_slug("nonexistent-xyz") is None
+
+    def test_get_disease_data_source_by_slug_matches_data(self, etl_test_db):
+        """Test the in-memory data source lookup agrees with disease_data."""
+        raw = etl_test_db.execute_sql(
+            "SELECT DISTINCT data_source FROM disease_data WHERE disease_slug = 'measles'"
+        )
+        sources = etl_test_db.get_disease_data_source_by_slug("measles")
+        assert set(sources.split(",")) == {row["data_source"] for row in raw["data"]}
+        assert etl_test_db.get_disease_data_source_by_slug("nonexistent-xyz") is None
+
+    def test_refresh_disease_index_is_idempotent(self, etl_test_db):
+        """Test rebuilding the disease index keeps slug lookups resolving the same way."""
+        before = etl_test_db.get_disease_name_by_slug("measles")
+        etl_test_db.refresh_disease_index()
+        assert etl_test_db.get_disease_name_by_slug("measles") == before
+        assert etl_test_db.get_disease_name_by_slug("nonexistent-xyz") is None
+
+    def test_cached_disease_catalog_returns_copies(self, etl_test_db):
+        """Test the cached unfiltered disease list can't be mutated by callers."""
+        diseases = etl_test_db.get_diseases_with_slugs()
+        diseases[0]["name"] = "mutated"
+        assert etl_test_db.get_diseases_with_slugs()[0]["name"] != "mutated"
+
+    def test_cached_disease_names_match_table(self, etl_test_db):
+        """Test the cached disease names match the loaded table."""
+        rows = etl_test_db.conn.execute(
+            "SELECT DISTINCT disease_name FROM disease_data ORDER BY disease_name"
+        ).fetchall()
+        assert etl_test_db.get_diseases() == [row[0] for row in rows]
+
+    def test_get_state_case_totals_national_total(self, etl_test_db):
+        """Test get_state_case_totals national_total sums the per-state cases."""
+        data = etl_test_db.get_state_case_totals("measles")
+        assert data["national_total"] == sum(s["cases"] for s in data["states"].values())
+        assert data["national_total"] > 0
+
+    def test_get_state_case_totals_date_range(self, etl_test_db):
+        """Test a date-range filter only narrows the merged state totals."""
+        full = etl_test_db.get_state_case_totals("measles")
+        ranged = etl_test_db.get_state_case_totals(
+            "measles", start_date="2025-01-01", end_date="2025-06-30"
+        )
+        assert ranged["national_total"] <= full["national_total"]
+        for state, info in ranged["states"].items():
+            assert info["cases"] <= full["states"][state]["cases"]
+
+    def test_query_results_memoized_per_load(self, etl_test_db, monkeypatch):
+        """Test a repeated query is answered without DuckDB, however it's called."""
+        first = etl_test_db.get_disease_timeseries_by_state("measles", "week")
+
+        def fail():
+            raise AssertionError("database queried on cache hit")
+
+        monkeypatch.setattr(etl_test_db, "_cursor", fail)
+        again = etl_test_db.get_disease_timeseries_by_state(
+            "measles", granularity="week", data_source=None
+        )
+        assert again == first
+
+    def test_memoized_results_are_copies(self, etl_test_db):
+        """Test mutating a memoized result doesn't affect later calls."""
+        data = etl_test_db.get_state_case_totals("measles")
+        data["states"].clear()
+        assert etl_test_db.get_state_case_totals("measles")["states"]
+
+    def test_merged_data_is_materialized(self, etl_test_db):
+        """Test disease_data_merged is a table rather than a view."""
+        row = etl_test_db.conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?",
+            ["disease_data_merged"],
+        ).fetchone()
+        assert row == ("BASE TABLE",)
+
+    def test_disease_stats_rollup_matches_raw_data(self, etl_test_db):
+        """Test the pre-aggregated disease stats match aggregates over disease_data."""
+        name = etl_test_db.get_disease_name_by_slug("measles")
+        stats = etl_test_db.get_disease_stats(name, data_source="tracker")
+        total, states = etl_test_db.conn.execute(
+            """
+            SELECT SUM(count), COUNT(DISTINCT state) FROM disease_data
+            WHERE disease_name = ? AND data_source = 'tracker'
+        """,
+            [name],
+        ).fetchone()
+        assert stats["total_cases"] == total > 0
+        assert stats["affected_states"] == states
+
+    def test_disease_stats_unknown_disease(self, etl_test_db):
+        """Test get_disease_stats returns zeros for a disease missing from the rollup."""
+        stats = etl_test_db.get_disease_stats("Nonexistent Disease")
+        assert stats == {
+            "total_cases": 0,
+            "affected_states": 0,
+            "affected_counties": 0,
+            "two_week_cases": 0,
+        }
+
+    def test_summary_stats_unknown_source(self, etl_test_db):
+        """Test get_summary_stats for an unknown source reports an empty dataset."""
+        stats = etl_test_db.get_summary_stats(data_source="bogus")
+        assert stats["total_records"] == 0
+        assert stats["total_cases"] == 0
+        assert stats["earliest_date"] is None
+        assert set(stats["source_breakdown"]) == {"tracker", "nndss"}
 
     def test_get_serotype_distribution_with_source(self, etl_test_db):
         """Test get_serotype_distribution_by_state filters by data source."""
@@ -137,3 +224,52 @@ class TestDataSourceFilters:
         assert "states" in data
         assert "serotypes" in data
         assert "available_states" in data
+
+
+class TestConnectionPool:
+    """Tests for the pooled DuckDB connections used by query methods."""
+
+    def test_concurrent_queries_share_pool(self, etl_test_db):
+        """Test concurrent queries succeed and every connection is returned to the pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        expected = etl_test_db.get_disease_stats("measles")
+        pool_size = etl_test_db._pool.qsize()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: etl_test_db.get_disease_stats("measles"), range(32))
+            )
+
+        assert all(result == expected for result in results)
+        assert etl_test_db._pool.qsize() == pool_size
+
+    def test_pool_smaller_than_workers_rejected(self):
+        """Test settings reject a pool that can't give every DB worker a connection."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError, match="db_pool_size"):
+            Settings(database_path=":memory:", db_workers=4, db_pool_size=2)
+        assert Settings(database_path=":memory:", db_workers=4, db_pool_size=0).db_pool_size == 0
+        assert Settings(database_path=":memory:", db_workers=4, db_pool_size=6).db_pool_size == 6
+
+    def test_exhausted_pool_raises_instead_of_blocking(self, etl_test_db, monkeypatch):
+        """Test a query fails with a clear error when no connection frees up."""
+        import app.database
+
+        monkeypatch.setattr(app.database, "POOL_TIMEOUT_SECONDS", 0.01)
+        held = []
+        while not etl_test_db._pool.empty():
+            held.append(etl_test_db._pool.get_nowait())
+        etl_test_db._query_cache.clear()
+        try:
+            with pytest.raises(RuntimeError, match="waiting for a DuckDB connection"):
+                etl_test_db.get_disease_totals()
+        finally:
+            for cursor in held:
+                etl_test_db._pool.put(cursor)
+
+    def test_nested_queries_reuse_connection(self, etl_test_db):
+        """Test query methods calling other query methods don't take a second connection."""
+        stats = etl_test_db.get_summary_stats()
+        assert stats["disease_totals"] == etl_test_db.get_disease_totals()